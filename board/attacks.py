@@ -0,0 +1,119 @@
+# board/attacks.py
+
+# Attack sets for every square, built once at import. Move generation and
+# threat detection index these tables instead of walking offsets per call.
+# Sliders go through board/magic.py; the ray functions here are its
+# reference implementation.
+
+from board.bitboard import (
+    WHITE, BLACK, NOT_A, NOT_H, FULL,
+    knight_attacks_bb, king_attacks_bb, pawn_attacks_bb,
+)
+
+KNIGHT_ATTACKS = [knight_attacks_bb(1 << sq) for sq in range(64)]
+KING_ATTACKS = [king_attacks_bb(1 << sq) for sq in range(64)]
+PAWN_ATTACKS = [
+    [pawn_attacks_bb(1 << sq, WHITE) for sq in range(64)],
+    [pawn_attacks_bb(1 << sq, BLACK) for sq in range(64)],
+]
+
+
+def _ray(sq, shift, mask):
+    # Every square from sq (exclusive) to the edge of the board in one direction
+    ray = 0
+    b = 1 << sq
+    while True:
+        b = (b << shift if shift > 0 else b >> -shift) & mask & FULL
+        if not b:
+            return ray
+        ray |= b
+
+
+# Rays towards higher indices (blockers found with the lowest set bit)
+RAY_SOUTH = [_ray(sq, 8, FULL) for sq in range(64)]
+RAY_EAST = [_ray(sq, 1, NOT_A) for sq in range(64)]
+RAY_SOUTH_WEST = [_ray(sq, 7, NOT_H) for sq in range(64)]
+RAY_SOUTH_EAST = [_ray(sq, 9, NOT_A) for sq in range(64)]
+# Rays towards lower indices (blockers found with the highest set bit)
+RAY_NORTH = [_ray(sq, -8, FULL) for sq in range(64)]
+RAY_WEST = [_ray(sq, -1, NOT_H) for sq in range(64)]
+RAY_NORTH_WEST = [_ray(sq, -9, NOT_H) for sq in range(64)]
+RAY_NORTH_EAST = [_ray(sq, -7, NOT_A) for sq in range(64)]
+
+# Empty-board slider attacks
+ROOK_RAYS = [RAY_NORTH[sq] | RAY_SOUTH[sq] | RAY_EAST[sq] | RAY_WEST[sq] for sq in range(64)]
+BISHOP_RAYS = [RAY_NORTH_EAST[sq] | RAY_NORTH_WEST[sq] | RAY_SOUTH_EAST[sq] | RAY_SOUTH_WEST[sq]
+               for sq in range(64)]
+
+
+def _build_between():
+    # BETWEEN[a * 64 + b]: squares strictly between two aligned squares, else 0
+    between = [0] * 4096
+    for ray, opposite in ((RAY_NORTH, RAY_SOUTH), (RAY_SOUTH, RAY_NORTH),
+                          (RAY_EAST, RAY_WEST), (RAY_WEST, RAY_EAST),
+                          (RAY_NORTH_EAST, RAY_SOUTH_WEST), (RAY_SOUTH_WEST, RAY_NORTH_EAST),
+                          (RAY_NORTH_WEST, RAY_SOUTH_EAST), (RAY_SOUTH_EAST, RAY_NORTH_WEST)):
+        for a in range(64):
+            targets = ray[a]
+            while targets:
+                low = targets & -targets
+                b = low.bit_length() - 1
+                between[a * 64 + b] = ray[a] & opposite[b]
+                targets ^= low
+    return between
+
+
+BETWEEN = _build_between()
+
+
+def rook_ray_attacks(sq, occupied):
+    # Each ray is cut at its first blocker (blocker square included)
+    ray = RAY_SOUTH[sq]
+    blockers = ray & occupied
+    if blockers:
+        ray ^= RAY_SOUTH[(blockers & -blockers).bit_length() - 1]
+    attacks = ray
+
+    ray = RAY_EAST[sq]
+    blockers = ray & occupied
+    if blockers:
+        ray ^= RAY_EAST[(blockers & -blockers).bit_length() - 1]
+    attacks |= ray
+
+    ray = RAY_NORTH[sq]
+    blockers = ray & occupied
+    if blockers:
+        ray ^= RAY_NORTH[blockers.bit_length() - 1]
+    attacks |= ray
+
+    ray = RAY_WEST[sq]
+    blockers = ray & occupied
+    if blockers:
+        ray ^= RAY_WEST[blockers.bit_length() - 1]
+    return attacks | ray
+
+
+def bishop_ray_attacks(sq, occupied):
+    ray = RAY_SOUTH_WEST[sq]
+    blockers = ray & occupied
+    if blockers:
+        ray ^= RAY_SOUTH_WEST[(blockers & -blockers).bit_length() - 1]
+    attacks = ray
+
+    ray = RAY_SOUTH_EAST[sq]
+    blockers = ray & occupied
+    if blockers:
+        ray ^= RAY_SOUTH_EAST[(blockers & -blockers).bit_length() - 1]
+    attacks |= ray
+
+    ray = RAY_NORTH_WEST[sq]
+    blockers = ray & occupied
+    if blockers:
+        ray ^= RAY_NORTH_WEST[blockers.bit_length() - 1]
+    attacks |= ray
+
+    ray = RAY_NORTH_EAST[sq]
+    blockers = ray & occupied
+    if blockers:
+        ray ^= RAY_NORTH_EAST[blockers.bit_length() - 1]
+    return attacks | ray
@@ -0,0 +1,101 @@
+# board/bitboard.py
+
+# Bitboard constants and helpers. Every piece type and colour gets one
+# 64-bit integer; bit i stands for board index i, so bit 0 is a8 and bit 63
+# is h1, exactly like the 64-entry board_pieces list the renderer uses.
+
+WHITE, BLACK = 0, 1
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+EMPTY = -1
+
+# Piece codes are colour * 6 + piece type
+W_PAWN, W_KNIGHT, W_BISHOP, W_ROOK, W_QUEEN, W_KING = range(0, 6)
+B_PAWN, B_KNIGHT, B_BISHOP, B_ROOK, B_QUEEN, B_KING = range(6, 12)
+
+PIECE_NAMES = ("wP", "wKnight", "wB", "wR", "wQ", "wK",
+               "bP", "bKnight", "bB", "bR", "bQ", "bK")
+PIECE_CODES = {name: code for code, name in enumerate(PIECE_NAMES)}
+
+FULL = 0xFFFF_FFFF_FFFF_FFFF
+FILE_A = 0x0101_0101_0101_0101
+FILE_B = FILE_A << 1
+FILE_G = FILE_A << 6
+FILE_H = FILE_A << 7
+NOT_A = FULL ^ FILE_A
+NOT_H = FULL ^ FILE_H
+NOT_AB = FULL ^ (FILE_A | FILE_B)
+NOT_GH = FULL ^ (FILE_G | FILE_H)
+
+
+def squares(bb):
+    """Return the indices of the set bits of bb in ascending order."""
+    result = []
+    while bb:
+        low = bb & -bb
+        result.append(low.bit_length() - 1)
+        bb ^= low
+    return result
+
+
+def lsb(bb):
+    """Index of the lowest set bit, or -1 for an empty board."""
+    return (bb & -bb).bit_length() - 1
+
+
+def popcount(bb):
+    return bb.bit_count()
+
+
+# --- Set-wise attack generation -------------------------------------------
+# Every function below takes a bitboard of attackers and returns the union of
+# their attacks, so a whole piece set is handled in a handful of shifts.
+# "Up" is towards rank 8 (index - 8), "right" is towards the h-file (index + 1).
+
+def knight_attacks_bb(knights):
+    return (((knights >> 17) & NOT_H) | ((knights >> 15) & NOT_A)
+            | ((knights >> 10) & NOT_GH) | ((knights >> 6) & NOT_AB)
+            | ((knights << 6) & NOT_GH) | ((knights << 10) & NOT_AB)
+            | ((knights << 15) & NOT_H) | ((knights << 17) & NOT_A)) & FULL
+
+
+def king_attacks_bb(kings):
+    row = kings | ((kings >> 1) & NOT_H) | ((kings << 1) & NOT_A)
+    return (row | (row >> 8) | (row << 8)) & FULL & ~kings
+
+
+def pawn_attacks_bb(pawns, color):
+    if color == WHITE:
+        return ((pawns >> 9) & NOT_H) | ((pawns >> 7) & NOT_A)
+    return (((pawns << 7) & NOT_H) | ((pawns << 9) & NOT_A)) & FULL
+
+
+# (shift, mask) pairs; a positive shift moves towards h1, a negative one towards a8
+ROOK_DIRECTIONS = ((-8, FULL), (8, FULL), (-1, NOT_H), (1, NOT_A))
+BISHOP_DIRECTIONS = ((-9, NOT_H), (-7, NOT_A), (7, NOT_H), (9, NOT_A))
+
+
+def _ray_attacks(sliders, occupied, directions):
+    empty = FULL & ~occupied
+    attacks = 0
+    for shift, mask in directions:
+        gen = sliders
+        if shift > 0:
+            while gen:
+                gen = (gen << shift) & mask & FULL
+                attacks |= gen
+                gen &= empty
+        else:
+            shift = -shift
+            while gen:
+                gen = (gen >> shift) & mask
+                attacks |= gen
+                gen &= empty
+    return attacks
+
+
+def rook_attacks_bb(rooks, occupied):
+    return _ray_attacks(rooks, occupied, ROOK_DIRECTIONS)
+
+
+def bishop_attacks_bb(bishops, occupied):
+    return _ray_attacks(bishops, occupied, BISHOP_DIRECTIONS)
@@ -0,0 +1,97 @@
+# board/epd.py
+
+# Streaming EPD reader. An EPD record is the first four FEN fields followed
+# by operations, each an opcode and its operands ended by ";":
+#   r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - bm Bb5; id "Ruy Lopez";
+# Perft suites use the same idea after a full FEN:
+#   rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1 ;D1 20 ;D2 400
+# Lines are parsed one at a time from any iterable (an open file works), so
+# files with millions of positions never have to fit in memory.
+
+from board.position import Position
+
+
+class EPDRecord:
+    __slots__ = ("position", "operations")
+
+    def __init__(self, position, operations):
+        self.position = position
+        self.operations = operations  # opcode -> list of operand strings
+
+    @property
+    def fen(self):
+        return self.position.to_fen()
+
+    def get(self, opcode, default=None):
+        """The first operand of opcode, or default."""
+        operands = self.operations.get(opcode)
+        return operands[0] if operands else default
+
+    def __repr__(self):
+        return f"EPDRecord({self.fen!r}, {self.operations!r})"
+
+
+def _split_operations(text):
+    # Split on ";" outside quoted strings, then each operation on spaces
+    operations = {}
+    current = []
+    token = []
+    quoted = False
+    for ch in text + ";":
+        if ch == '"':
+            quoted = not quoted
+            continue
+        if quoted:
+            token.append(ch)
+        elif ch == ";" or ch.isspace():
+            if token:
+                current.append("".join(token))
+                token = []
+            if ch == ";" and current:
+                operations[current[0]] = current[1:]
+                current = []
+        else:
+            token.append(ch)
+    return operations
+
+
+def parse_epd(line):
+    """EPDRecord for one line; ValueError if it does not hold a position."""
+    fields = line.split(None, 4)
+    if len(fields) < 4:
+        raise ValueError(f"Invalid EPD: {line!r}")
+    rest = fields[4] if len(fields) > 4 else ""
+    counters = rest.split(None, 2)
+    if len(counters) >= 2 and counters[0].isdigit() and counters[1].isdigit():
+        # A full FEN; its counters win over hmvc / fmvn
+        position = Position.from_fen(line)
+        rest = counters[2] if len(counters) > 2 else ""
+        operations = _split_operations(rest)
+    else:
+        position = Position.from_fen(" ".join(fields[:4]))
+        operations = _split_operations(rest)
+        halfmove = operations.get("hmvc")
+        fullmove = operations.get("fmvn")
+        if halfmove or fullmove:
+            try:
+                position.set_counters(int(halfmove[0]) if halfmove else 0,
+                                      int(fullmove[0]) if fullmove else 1)
+            except ValueError:
+                raise ValueError(f"Invalid EPD move counter: {line!r}") from None
+    return EPDRecord(position, operations)
+
+
+def read_epd(lines):
+    """Yield an EPDRecord for every position in lines (an iterable of text lines).
+
+    Blank lines and lines starting with "#" are skipped. A malformed line
+    raises ValueError naming its line number.
+    """
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line[0] == "#":
+            continue
+        try:
+            yield parse_epd(line)
+        except ValueError as exc:
+            raise ValueError(f"line {number}: {exc}") from None
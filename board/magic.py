@@ -0,0 +1,229 @@
+# board/magic.py
+
+# Magic-bitboard slider attacks. The blockers on a slider's relevant squares
+# are multiplied by a per-square magic number; the top bits of the product
+# index a table holding the finished attack set, so a lookup is one AND, one
+# multiply and one shift no matter how many squares the rays cover.
+#
+# The magic numbers below were found offline with find_magic() (run
+# `python -m board.magic` to search for a fresh set). The tables themselves
+# are built at startup, or read back from a cache file when one exists. The
+# file ends with a checksum of the tables, so a truncated or corrupt cache is
+# rebuilt instead of handing out wrong attacks; it is written to a temporary
+# file and renamed into place so a process never reads a half-written one.
+# CHESS_MAGIC_CACHE overrides the cache path; set it empty to never touch disk.
+
+import hashlib
+import os
+import random
+import sys
+from array import array
+
+from board.bitboard import FULL
+from board.attacks import (
+    RAY_NORTH, RAY_SOUTH, RAY_EAST, RAY_WEST,
+    RAY_NORTH_EAST, RAY_NORTH_WEST, RAY_SOUTH_EAST, RAY_SOUTH_WEST,
+    rook_ray_attacks, bishop_ray_attacks,
+)
+
+CACHE_VERSION = 2
+CACHE_PATH = os.environ.get(
+    "CHESS_MAGIC_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "chess", f"magic_v{CACHE_VERSION}.bin"),
+)
+
+# Edge squares never block anything behind them, so they are left out of the
+# relevant-occupancy masks.
+_RANK_EDGES = 0xFF | (0xFF << 56)
+_FILE_EDGES = 0x8181_8181_8181_8181
+
+
+def _rook_mask(sq):
+    return (((RAY_NORTH[sq] | RAY_SOUTH[sq]) & ~_RANK_EDGES)
+            | ((RAY_EAST[sq] | RAY_WEST[sq]) & ~_FILE_EDGES)) & FULL
+
+
+def _bishop_mask(sq):
+    return (RAY_NORTH_EAST[sq] | RAY_NORTH_WEST[sq]
+            | RAY_SOUTH_EAST[sq] | RAY_SOUTH_WEST[sq]) & ~(_RANK_EDGES | _FILE_EDGES) & FULL
+
+
+ROOK_MASKS = [_rook_mask(sq) for sq in range(64)]
+BISHOP_MASKS = [_bishop_mask(sq) for sq in range(64)]
+ROOK_SHIFTS = [64 - mask.bit_count() for mask in ROOK_MASKS]
+BISHOP_SHIFTS = [64 - mask.bit_count() for mask in BISHOP_MASKS]
+
+ROOK_MAGICS = [
+    0x2080001440022581, 0x1080200040001080, 0x4080100008200080, 0x0280080080100254,
+    0x4D8004000A180080, 0x0100080400020100, 0x1080010040800200, 0x0200004402002081,
+    0x0068800024884004, 0x1000804000802002, 0x000200208A001040, 0x3008801000800800,
+    0x2006001060440A00, 0x1000800200800400, 0x0004000441024810, 0xA001000082004100,
+    0x0040808000204014, 0x0000424002201000, 0x0010110041002000, 0x0000090021041000,
+    0x0204008004800800, 0x0000808004000200, 0x6006040021485042, 0x0000020002409924,
+    0x2000401980028020, 0x4000400100308100, 0x0000820200201041, 0xB100100080800800,
+    0x3004080080040080, 0x0802000200041009, 0x01A0580400021110, 0x00020042000408A1,
+    0x4218884000800023, 0x0480201000400045, 0x0010200080801000, 0x1200200901001000,
+    0x0000100801000500, 0x0080020080800400, 0x004A000100404080, 0x0480005402001081,
+    0x258000402000C000, 0xA010004820084002, 0x0480200010008080, 0x244100100021000C,
+    0x2040080005010010, 0x0012000810020004, 0x0011000200B9000C, 0x1121000080410002,
+    0x00082080410A0600, 0x4002008100402600, 0x0A0300E008544100, 0x7B00080010008080,
+    0x0300080100100500, 0x0002020080040080, 0x0042521810214400, 0x8A00004089140200,
+    0x00001280010A2041, 0x0400401102042086, 0x41902000100C4101, 0x0043020420900009,
+    0x00E2000410082002, 0x4402000108041002, 0x2100101A00814804, 0x0400010400218246,
+]
+
+BISHOP_MAGICS = [
+    0x0102040418220020, 0x0108024802002028, 0x8010044040400001, 0x0022209200044800,
+    0x4004504005040114, 0x0022010420A80800, 0x0008441008090002, 0x0000420801480200,
+    0x1100220244011C00, 0x00883004081AB020, 0x4400100152002000, 0x4019080841004000,
+    0x2861021210000000, 0x400EA10108400020, 0x4800208208A24000, 0x0020A500A0842085,
+    0x3410000802504400, 0x0010E0200C010060, 0x0014182042408200, 0x4094006840112109,
+    0x2014200202010000, 0x000100020080C400, 0x800400420D2C0200, 0x0002200182251000,
+    0x0010F10304C41000, 0x001024A008281084, 0x0088110002040100, 0x0820080001004008,
+    0x0104040020410050, 0x0110002027040500, 0x418C008009182100, 0x2C00A9040C80480B,
+    0x008110C8005020A4, 0x4004210802041000, 0x0004020108208100, 0x0000080800120A00,
+    0x430C008400820102, 0x1400808100020108, 0x005006020010A8A0, 0x000801868004A220,
+    0x00420105C00C2000, 0x1010921032019040, 0x0300222028103000, 0x0008004208001080,
+    0x5410202248811400, 0x0008010800800808, 0x3C02C20404000900, 0x0408022282040032,
+    0x0000941002100000, 0x0112209A10100804, 0x080C020111210000, 0x442002A442022008,
+    0x00084A181B040000, 0x00115021021C2080, 0x4010051000A20000, 0x0404688085060000,
+    0x0000220110011000, 0x140000220734200C, 0x0440010424020800, 0x2204828883460800,
+    0x0020000004050410, 0x4060004A20082080, 0x00489034B002C201, 0x0444049010410300,
+]
+
+
+def subsets(mask):
+    """Every subset of mask (Carry-Rippler enumeration), starting with 0."""
+    subset = 0
+    while True:
+        yield subset
+        subset = (subset - mask) & mask
+        if not subset:
+            return
+
+
+def find_magic(sq, rook, rng):
+    mask = ROOK_MASKS[sq] if rook else BISHOP_MASKS[sq]
+    shift = ROOK_SHIFTS[sq] if rook else BISHOP_SHIFTS[sq]
+    reference = rook_ray_attacks if rook else bishop_ray_attacks
+    occupancies = list(subsets(mask))
+    attacks = [reference(sq, occ) for occ in occupancies]
+
+    while True:
+        # Sparse candidates are far more likely to work
+        magic = rng.getrandbits(64) & rng.getrandbits(64) & rng.getrandbits(64)
+        if ((mask * magic) & 0xFF00_0000_0000_0000).bit_count() < 6:
+            continue
+        table = {}
+        for occ, attack in zip(occupancies, attacks):
+            index = ((occ * magic) & FULL) >> shift
+            if table.setdefault(index, attack) != attack:
+                break
+        else:
+            return magic
+
+
+def _build_table(sq, mask, magic, shift, reference):
+    table = [0] * (1 << (64 - shift))
+    for occ in subsets(mask):
+        table[((occ * magic) & FULL) >> shift] = reference(sq, occ)
+    return table
+
+
+def _cache_header():
+    return array("Q", [CACHE_VERSION, *ROOK_MAGICS, *BISHOP_MAGICS])
+
+
+def _checksum(tables):
+    # 64-bit digest of the table words, stored as the file's last word
+    return int.from_bytes(hashlib.blake2b(tables.tobytes(), digest_size=8).digest(), "little")
+
+
+def _load_cache(path):
+    try:
+        with open(path, "rb") as f:
+            data = array("Q")
+            data.frombytes(f.read())
+    except OSError:
+        return None
+
+    header = _cache_header()
+    sizes = [1 << (64 - s) for s in ROOK_SHIFTS + BISHOP_SHIFTS]
+    if len(data) != len(header) + sum(sizes) + 1 or data[:len(header)] != header:
+        return None
+    if data[-1] != _checksum(data[len(header):-1]):
+        return None
+
+    tables = []
+    offset = len(header)
+    for size in sizes:
+        tables.append(data[offset:offset + size].tolist())
+        offset += size
+    return tables[:64], tables[64:]
+
+
+def _save_cache(path, rook_tables, bishop_tables):
+    tables = array("Q")
+    for table in rook_tables + bishop_tables:
+        tables.extend(table)
+    data = _cache_header()
+    data.extend(tables)
+    data.append(_checksum(tables))
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            data.tofile(f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # A read-only home directory just means we build again next time
+
+
+def build_tables(cache_path=CACHE_PATH):
+    if cache_path:
+        cached = _load_cache(cache_path)
+        if cached is not None:
+            return cached
+
+    rook_tables = [_build_table(sq, ROOK_MASKS[sq], ROOK_MAGICS[sq], ROOK_SHIFTS[sq], rook_ray_attacks)
+                   for sq in range(64)]
+    bishop_tables = [_build_table(sq, BISHOP_MASKS[sq], BISHOP_MAGICS[sq], BISHOP_SHIFTS[sq], bishop_ray_attacks)
+                     for sq in range(64)]
+    if cache_path:
+        _save_cache(cache_path, rook_tables, bishop_tables)
+    return rook_tables, bishop_tables
+
+
+ROOK_TABLES, BISHOP_TABLES = build_tables()
+
+# Per-square (mask, magic, shift, table) tuples keep each lookup to one list index
+ROOK_ENTRIES = list(zip(ROOK_MASKS, ROOK_MAGICS, ROOK_SHIFTS, ROOK_TABLES))
+BISHOP_ENTRIES = list(zip(BISHOP_MASKS, BISHOP_MAGICS, BISHOP_SHIFTS, BISHOP_TABLES))
+
+
+def rook_attacks(sq, occupied):
+    mask, magic, shift, table = ROOK_ENTRIES[sq]
+    return table[(((occupied & mask) * magic) & FULL) >> shift]
+
+
+def bishop_attacks(sq, occupied):
+    mask, magic, shift, table = BISHOP_ENTRIES[sq]
+    return table[(((occupied & mask) * magic) & FULL) >> shift]
+
+
+def queen_attacks(sq, occupied):
+    mask, magic, shift, table = ROOK_ENTRIES[sq]
+    attacks = table[(((occupied & mask) * magic) & FULL) >> shift]
+    mask, magic, shift, table = BISHOP_ENTRIES[sq]
+    return attacks | table[(((occupied & mask) * magic) & FULL) >> shift]
+
+
+if __name__ == "__main__":
+    seed = int(sys.argv[1]) if len(sys.argv) > 1 else 2024
+    rng = random.Random(seed)
+    for name, rook in (("ROOK_MAGICS", True), ("BISHOP_MAGICS", False)):
+        print(f"{name} = [")
+        for sq in range(0, 64, 4):
+            row = ", ".join(f"0x{find_magic(s, rook, rng):016X}" for s in range(sq, sq + 4))
+            print(f"    {row},")
+        print("]")
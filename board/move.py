@@ -0,0 +1,33 @@
+# board/move.py
+
+# Moves are plain ints so they are cheap to create, compare and store:
+#   bits 0-5   from square
+#   bits 6-11  to square
+#   bits 12-14 promotion piece type (0 when the move is not a promotion)
+#   bits 15-16 special kind (NORMAL, DOUBLE_PUSH, CASTLE, EN_PASSANT)
+
+NORMAL, DOUBLE_PUSH, CASTLE, EN_PASSANT = range(4)
+
+NO_MOVE = 0
+
+FILE_NAMES = "abcdefgh"
+PROMOTION_LETTERS = {1: "n", 2: "b", 3: "r", 4: "q"}  # keyed by piece type
+
+
+def encode_move(from_sq, to_sq, promotion=0, special=NORMAL):
+    return from_sq | (to_sq << 6) | (promotion << 12) | (special << 15)
+
+
+def square_name(sq):
+    """Board index to algebraic name: 0 -> "a8", 63 -> "h1"."""
+    return FILE_NAMES[sq % 8] + str(8 - sq // 8)
+
+
+def parse_square(name):
+    return (8 - int(name[1])) * 8 + FILE_NAMES.index(name[0])
+
+
+def move_to_uci(move):
+    text = square_name(move & 63) + square_name((move >> 6) & 63)
+    promotion = (move >> 12) & 7
+    return text + PROMOTION_LETTERS[promotion] if promotion else text
@@ -0,0 +1,198 @@
+# board/movegen.py
+
+# Fully legal move generation. Checkers and pinned pieces are worked out once
+# per position, so every move that comes out is legal without having to be
+# played, tested for check and taken back.
+
+from board.bitboard import WHITE, FULL, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, NOT_A, NOT_H
+from board.attacks import KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, ROOK_RAYS, BISHOP_RAYS, BETWEEN
+from board.magic import rook_attacks, bishop_attacks
+from board.move import DOUBLE_PUSH, CASTLE, EN_PASSANT
+from board.position import WHITE_KINGSIDE, WHITE_QUEENSIDE, BLACK_KINGSIDE, BLACK_QUEENSIDE
+
+PROMOTION_RANKS = 0xFF | (0xFF << 56)
+WHITE_PUSH_RANK = 0xFF << 40  # a single push from the start row lands here
+BLACK_PUSH_RANK = 0xFF << 16
+PROMOTIONS = (QUEEN << 12, KNIGHT << 12, ROOK << 12, BISHOP << 12)
+
+# (right, king from, king to, squares that must be empty, squares the king crosses)
+CASTLES = (
+    ((WHITE_KINGSIDE, 60, 62, (1 << 61) | (1 << 62), (1 << 61) | (1 << 62)),
+     (WHITE_QUEENSIDE, 60, 58, (1 << 57) | (1 << 58) | (1 << 59), (1 << 58) | (1 << 59))),
+    ((BLACK_KINGSIDE, 4, 6, (1 << 5) | (1 << 6), (1 << 5) | (1 << 6)),
+     (BLACK_QUEENSIDE, 4, 2, (1 << 1) | (1 << 2) | (1 << 3), (1 << 2) | (1 << 3))),
+)
+
+
+def _add_targets(moves, from_sq, targets):
+    while targets:
+        low = targets & -targets
+        moves.append(from_sq | ((low.bit_length() - 1) << 6))
+        targets ^= low
+
+
+def _add_pawn_moves(moves, targets, delta, special=0):
+    # Set-wise pawn targets; the pawn came from to_sq + delta
+    while targets:
+        low = targets & -targets
+        to_sq = low.bit_length() - 1
+        move = (to_sq + delta) | (to_sq << 6)
+        if low & PROMOTION_RANKS:
+            for promotion in PROMOTIONS:
+                moves.append(move | promotion)
+        else:
+            moves.append(move | special)
+        targets ^= low
+
+
+def in_check(position, color=None):
+    if color is None:
+        color = position.side
+    king = position.pieces[color * 6 + KING]
+    return (position.attacked[color ^ 1] & king) != 0
+
+
+def generate_legal_moves(position, from_mask=FULL, color=None):
+    """Every legal move for color (default: the side to move).
+
+    from_mask restricts the origin squares, e.g. 1 << index for the moves
+    of a single piece.
+    """
+    if color is None:
+        color = position.side
+    us = color
+    them = us ^ 1
+    pieces = position.pieces
+    base = us * 6
+    own = position.occupied[us]
+    enemy = position.occupied[them]
+    occupied = position.all_occupied
+    their_straight = pieces[them * 6 + ROOK] | pieces[them * 6 + QUEEN]
+    their_diagonal = pieces[them * 6 + BISHOP] | pieces[them * 6 + QUEEN]
+
+    king_bb = pieces[base + KING]
+    king_sq = king_bb.bit_length() - 1
+    attacked = position.attacked[them]
+    checkers = position.attackers_to(king_sq, them) if attacked & king_bb else 0
+    moves = []
+
+    # King steps. The attack map is exact except behind the king on a
+    # checking slider's line, so those sliders are recomputed with the king
+    # lifted off the board
+    if king_bb & from_mask:
+        danger = attacked
+        sliders = checkers & (their_straight | their_diagonal)
+        while sliders:
+            low = sliders & -sliders
+            danger |= position.attacks_from(low.bit_length() - 1, occupied ^ king_bb)
+            sliders ^= low
+        _add_targets(moves, king_sq, KING_ATTACKS[king_sq] & ~own & ~danger)
+        if not checkers:
+            castling = position.castling
+            for right, from_sq, to_sq, between, path in CASTLES[us]:
+                if castling & right and not occupied & between and not danger & path:
+                    moves.append(from_sq | (to_sq << 6) | (CASTLE << 15))
+
+    if checkers & (checkers - 1):
+        return moves  # Double check: only the king can move
+
+    # Single check: capture the checker or block its line
+    if checkers:
+        target_mask = (checkers | BETWEEN[king_sq * 64 + checkers.bit_length() - 1]) & ~own
+    else:
+        target_mask = FULL & ~own
+
+    # A piece alone between our king and an enemy slider may only move along that line
+    pinned = 0
+    pin_lines = {}
+    snipers = (ROOK_RAYS[king_sq] & their_straight) | (BISHOP_RAYS[king_sq] & their_diagonal)
+    while snipers:
+        low = snipers & -snipers
+        line = BETWEEN[king_sq * 64 + low.bit_length() - 1]
+        blockers = line & occupied
+        if blockers & own and not blockers & (blockers - 1):
+            pinned |= blockers
+            pin_lines[blockers.bit_length() - 1] = line | low
+        snipers ^= low
+
+    # Knights (a pinned knight can never move)
+    knights = pieces[base + KNIGHT] & ~pinned & from_mask
+    while knights:
+        low = knights & -knights
+        sq = low.bit_length() - 1
+        _add_targets(moves, sq, KNIGHT_ATTACKS[sq] & target_mask)
+        knights ^= low
+
+    # Sliders
+    queens = pieces[base + QUEEN]
+    for sliders, attacks in (((pieces[base + BISHOP] | queens) & from_mask, bishop_attacks),
+                             ((pieces[base + ROOK] | queens) & from_mask, rook_attacks)):
+        while sliders:
+            low = sliders & -sliders
+            sq = low.bit_length() - 1
+            targets = attacks(sq, occupied) & target_mask
+            if low & pinned:
+                targets &= pin_lines[sq]
+            _add_targets(moves, sq, targets)
+            sliders ^= low
+
+    # Pawns: unpinned ones set-wise, pinned ones one at a time
+    pawns = pieces[base + PAWN] & from_mask
+    empty = FULL ^ occupied
+    free = pawns & ~pinned
+    if us == WHITE:
+        single = (free >> 8) & empty
+        double = ((single & WHITE_PUSH_RANK) >> 8) & empty & target_mask
+        _add_pawn_moves(moves, single & target_mask, 8)
+        _add_pawn_moves(moves, double, 16, DOUBLE_PUSH << 15)
+        _add_pawn_moves(moves, (free >> 9) & NOT_H & enemy & target_mask, 9)
+        _add_pawn_moves(moves, (free >> 7) & NOT_A & enemy & target_mask, 7)
+    else:
+        single = (free << 8) & empty
+        double = ((single & BLACK_PUSH_RANK) << 8) & empty & target_mask
+        _add_pawn_moves(moves, single & target_mask, -8)
+        _add_pawn_moves(moves, double, -16, DOUBLE_PUSH << 15)
+        _add_pawn_moves(moves, (free << 7) & NOT_H & enemy & target_mask, -7)
+        _add_pawn_moves(moves, (free << 9) & NOT_A & enemy & target_mask, -9)
+
+    stuck = pawns & pinned
+    while stuck:
+        low = stuck & -stuck
+        sq = low.bit_length() - 1
+        allowed = target_mask & pin_lines[sq]
+        step = sq - 8 if us == WHITE else sq + 8
+        targets = PAWN_ATTACKS[us][sq] & enemy
+        if (empty >> step) & 1:
+            targets |= 1 << step
+            start_row = 6 if us == WHITE else 1
+            if sq >> 3 == start_row and (empty >> (2 * step - sq)) & 1 and (allowed >> (2 * step - sq)) & 1:
+                moves.append(sq | ((2 * step - sq) << 6) | (DOUBLE_PUSH << 15))
+        targets &= allowed
+        while targets:
+            t = targets & -targets
+            to_sq = t.bit_length() - 1
+            if t & PROMOTION_RANKS:
+                for promotion in PROMOTIONS:
+                    moves.append(sq | (to_sq << 6) | promotion)
+            else:
+                moves.append(sq | (to_sq << 6))
+            targets ^= t
+        stuck ^= low
+
+    # En passant: test the resulting occupancy directly, which also catches
+    # the rare horizontal pin where both pawns leave the king's rank
+    ep = position.ep_square
+    if ep >= 0 and us == position.side:
+        captured_bb = 1 << (ep + 8 if us == WHITE else ep - 8)
+        # A knight or pawn check can only be answered by taking the checker
+        if not (checkers & ~captured_bb & ~(their_straight | their_diagonal)):
+            capturers = PAWN_ATTACKS[them][ep] & pawns
+            while capturers:
+                low = capturers & -capturers
+                after = (occupied ^ low ^ captured_bb) | (1 << ep)
+                if not (rook_attacks(king_sq, after) & their_straight
+                        or bishop_attacks(king_sq, after) & their_diagonal):
+                    moves.append((low.bit_length() - 1) | (ep << 6) | (EN_PASSANT << 15))
+                capturers ^= low
+
+    return moves
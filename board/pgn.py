@@ -0,0 +1,137 @@
+# board/pgn.py
+
+# Streaming PGN reader: games are read one at a time from any iterable of
+# lines (an open file works), so collections far larger than memory can be
+# processed. Comments, variations, NAGs and move numbers are dropped; what
+# comes out is the tag pairs and the main-line SAN moves.
+
+import re
+
+from board.position import START_FEN
+
+_TAG = re.compile(r'\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+# Comments and variations are removed before the movetext is split
+_COMMENTS = re.compile(r"\{[^}]*\}|;[^\n]*")
+_PARENS = re.compile(r"[()]")
+_MOVE_NUMBER = re.compile(r"^\d+\.+")
+RESULTS = ("1-0", "0-1", "1/2-1/2", "*")
+
+
+class PGNGame:
+    __slots__ = ("headers", "moves", "result")
+
+    def __init__(self, headers, moves, result):
+        self.headers = headers
+        self.moves = moves  # SAN strings of the main line
+        self.result = result
+
+    @property
+    def fen(self):
+        """FEN of the starting position (the FEN tag, or the standard start)."""
+        return self.headers.get("FEN", START_FEN)
+
+    def __repr__(self):
+        return f"PGNGame({self.headers.get('White', '?')} - {self.headers.get('Black', '?')}, {len(self.moves)} moves)"
+
+
+def _strip_movetext(text):
+    # Drop {comments}, ;comments and (nested variations)
+    if "{" in text or ";" in text:
+        text = _COMMENTS.sub(" ", text)
+    if "(" not in text:
+        return text
+    out = []
+    depth = 0
+    last = 0
+    for match in _PARENS.finditer(text):
+        if match.group() == "(":
+            if depth == 0:
+                out.append(text[last:match.start()])
+            depth += 1
+        elif depth == 0:
+            out.append(text[last:match.start()])  # stray ")"
+            last = match.end()
+        else:
+            depth -= 1
+            if depth == 0:
+                last = match.end()
+                out.append(" ")
+    if depth == 0:
+        out.append(text[last:])
+    return "".join(out)
+
+
+def _parse_moves(movetext):
+    moves = []
+    result = "*"
+    for token in _strip_movetext(movetext).split():
+        if token in RESULTS:
+            result = token
+            continue
+        if token[0] == "$":
+            continue  # numeric annotation glyph
+        token = _MOVE_NUMBER.sub("", token)
+        if token:
+            moves.append(token)
+    return moves, result
+
+
+def read_games(lines):
+    """Yield a PGNGame for every game in lines (an iterable of text lines)."""
+    headers = {}
+    movetext = []
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("["):
+            if movetext:
+                # Tag pairs after movetext start the next game
+                moves, result = _parse_moves("\n".join(movetext))
+                yield PGNGame(headers, moves, headers.get("Result", result) if result == "*" else result)
+                headers = {}
+                movetext = []
+            match = _TAG.match(stripped)
+            if match:
+                headers[match.group(1)] = match.group(2).replace('\\"', '"')
+        elif stripped.startswith("%"):
+            continue  # escape line
+        elif stripped:
+            movetext.append(stripped)
+    if movetext or headers:
+        moves, result = _parse_moves("\n".join(movetext))
+        yield PGNGame(headers, moves, headers.get("Result", result) if result == "*" else result)
+
+
+def format_game(headers, moves, result, width=79):
+    """PGN text for one game: tag pairs, then the SAN moves numbered and wrapped to width.
+
+    Numbering starts from the FEN tag when there is one, so games from set-up
+    positions (and Black to move) come out right.
+    """
+    lines = []
+    for tag, value in headers.items():
+        value = str(value).replace('"', '\\"')
+        lines.append(f'[{tag} "{value}"]')
+    lines.append("")
+    fields = headers.get("FEN", START_FEN).split()
+    black = len(fields) > 1 and fields[1] == "b"
+    number = int(fields[5]) if len(fields) > 5 and fields[5].isdigit() else 1
+    tokens = []
+    for san in moves:
+        if not black:
+            tokens.append(f"{number}.")
+        elif not tokens:
+            tokens.append(f"{number}...")
+        tokens.append(san)
+        if black:
+            number += 1
+        black = not black
+    tokens.append(result)
+    line = ""
+    for token in tokens:
+        if line and len(line) + 1 + len(token) > width:
+            lines.append(line)
+            line = token
+        else:
+            line = f"{line} {token}" if line else token
+    lines.append(line)
+    return "\n".join(lines) + "\n"
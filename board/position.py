@@ -0,0 +1,629 @@
+# board/position.py
+
+from collections.abc import Sequence
+
+from board.bitboard import (
+    WHITE, BLACK, EMPTY, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING,
+    W_BISHOP, W_ROOK, W_QUEEN, W_KING, B_BISHOP, B_ROOK, B_QUEEN, B_KING,
+    PIECE_NAMES, PIECE_CODES, lsb, knight_attacks_bb, king_attacks_bb, pawn_attacks_bb,
+)
+from board.attacks import KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS
+from board.magic import rook_attacks, bishop_attacks, queen_attacks
+from board.move import DOUBLE_PUSH, CASTLE, EN_PASSANT, encode_move, parse_square, square_name
+from board.zobrist import PIECE_KEYS, CASTLING_KEYS, EP_KEYS, SIDE_KEY
+from board.psqt import PSQT_MG, PSQT_EG, PIECE_PHASE
+
+# Castling rights bits
+WHITE_KINGSIDE, WHITE_QUEENSIDE, BLACK_KINGSIDE, BLACK_QUEENSIDE = 1, 2, 4, 8
+ALL_CASTLING = 15
+
+# rights & CASTLING_MASK[from] & CASTLING_MASK[to] drops every right whose
+# king or rook square was touched by the move (moved from or captured on)
+CASTLING_MASK = [ALL_CASTLING] * 64
+CASTLING_MASK[60] ^= WHITE_KINGSIDE | WHITE_QUEENSIDE
+CASTLING_MASK[63] ^= WHITE_KINGSIDE
+CASTLING_MASK[56] ^= WHITE_QUEENSIDE
+CASTLING_MASK[4] ^= BLACK_KINGSIDE | BLACK_QUEENSIDE
+CASTLING_MASK[7] ^= BLACK_KINGSIDE
+CASTLING_MASK[0] ^= BLACK_QUEENSIDE
+
+# King target square -> (rook from, rook to)
+CASTLE_ROOK_SQUARES = [None] * 64
+CASTLE_ROOK_SQUARES[62] = (63, 61)
+CASTLE_ROOK_SQUARES[58] = (56, 59)
+CASTLE_ROOK_SQUARES[6] = (7, 5)
+CASTLE_ROOK_SQUARES[2] = (0, 3)
+
+# Right bit -> (king square, king piece, rook square, rook piece)
+CASTLING_HOMES = {
+    WHITE_KINGSIDE: (60, W_KING, 63, W_ROOK),
+    WHITE_QUEENSIDE: (60, W_KING, 56, W_ROOK),
+    BLACK_KINGSIDE: (4, B_KING, 7, B_ROOK),
+    BLACK_QUEENSIDE: (4, B_KING, 0, B_ROOK),
+}
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+FEN_LETTERS = "PNBRQKpnbrqk"  # indexed by piece code
+FEN_CASTLING = ((WHITE_KINGSIDE, "K"), (WHITE_QUEENSIDE, "Q"), (BLACK_KINGSIDE, "k"), (BLACK_QUEENSIDE, "q"))
+
+
+ATTACK_PLANES = 5  # bit-sliced attacker counters hold up to 31 attackers per square
+
+
+class Position:
+    """Piece placement as twelve bitboards plus occupancy masks.
+
+    The mailbox list mirrors the bitboards square by square so that
+    "what is on this square" is a single list lookup. make_move and
+    unmake_move keep everything else a move can change (side to move,
+    castling rights, en passant square, halfmove clock, Zobrist key) on an
+    undo stack.
+
+    Each side also has an attack map that is updated incrementally:
+    attack_sets holds the attacks of every piece (indexed color * 64 + sq),
+    attack_planes holds the per-square attacker counts bit-sliced into
+    ATTACK_PLANES bitboards per side, and attacked is the union per side.
+
+    psqt_mg / psqt_eg are the material plus piece-square sums (White minus
+    Black) and phase the game phase, kept current the same way so the
+    evaluation is a constant-time read.
+    """
+
+    __slots__ = ("pieces", "occupied", "all_occupied", "mailbox",
+                 "side", "castling", "ep_square", "halfmove_clock", "key", "history",
+                 "attack_sets", "attack_planes", "attacked", "psqt_mg", "psqt_eg", "phase",
+                 "start_ply")
+
+    def __init__(self):
+        self.pieces = [0] * 12
+        self.occupied = [0, 0]  # [white pieces, black pieces]
+        self.all_occupied = 0
+        self.mailbox = [EMPTY] * 64
+        self.side = WHITE
+        self.castling = 0
+        self.ep_square = -1  # only set when an en passant capture is possible
+        self.halfmove_clock = 0
+        self.key = 0  # Zobrist key, updated incrementally
+        # (move, captured piece, castling, ep square, halfmove clock, key,
+        #  psqt midgame, psqt endgame, phase, attack planes, attacked, replaced attack sets)
+        self.history = []
+        self.attack_sets = [0] * 128
+        self.attack_planes = [0] * (2 * ATTACK_PLANES)
+        self.attacked = [0, 0]
+        self.psqt_mg = 0
+        self.psqt_eg = 0
+        self.phase = 0
+        self.start_ply = 0  # plies played before history starts, for the fullmove number
+
+    @classmethod
+    def from_mailbox(cls, mailbox, side=WHITE, castling=ALL_CASTLING):
+        """Position from 64 piece codes (EMPTY for an empty square)."""
+        position = cls()
+        pieces = position.pieces
+        for sq, piece in enumerate(mailbox):
+            if piece != EMPTY:
+                pieces[piece] |= 1 << sq
+        position.mailbox = list(mailbox)
+        position.side = side
+        position.start_ply = side
+        # Only keep rights whose king and rook are still on their home squares
+        for right, (king_sq, king, rook_sq, rook) in CASTLING_HOMES.items():
+            if castling & right and mailbox[king_sq] == king and mailbox[rook_sq] == rook:
+                position.castling |= right
+        position._refresh()
+        return position
+
+    def _refresh(self):
+        # Derive occupancy, key, evaluation sums and attack maps from the
+        # bitboards and mailbox in one pass, instead of one put() per piece
+        pieces = self.pieces
+        white = pieces[0] | pieces[1] | pieces[2] | pieces[3] | pieces[4] | pieces[5]
+        black = pieces[6] | pieces[7] | pieces[8] | pieces[9] | pieces[10] | pieces[11]
+        self.occupied = [white, black]
+        self.all_occupied = white | black
+        attack_sets = self.attack_sets = [0] * 128
+        planes = self.attack_planes = [0] * (2 * ATTACK_PLANES)
+        mg = eg = phase = 0
+        key = CASTLING_KEYS[self.castling]
+        if self.ep_square >= 0:
+            key ^= EP_KEYS[self.ep_square & 7]
+        if self.side:
+            key ^= SIDE_KEY
+        for sq, piece in enumerate(self.mailbox):
+            if piece == EMPTY:
+                continue
+            key ^= PIECE_KEYS[piece * 64 + sq]
+            mg += PSQT_MG[piece * 64 + sq]
+            eg += PSQT_EG[piece * 64 + sq]
+            phase += PIECE_PHASE[piece]
+            attacks = self.attacks_from(sq)
+            color = piece // 6
+            attack_sets[color * 64 + sq] = attacks
+            carry = attacks
+            i = color * ATTACK_PLANES
+            while carry:
+                plane = planes[i]
+                planes[i] = plane ^ carry
+                carry &= plane
+                i += 1
+        self.psqt_mg = mg
+        self.psqt_eg = eg
+        self.phase = phase
+        self.attacked = [planes[0] | planes[1] | planes[2] | planes[3] | planes[4],
+                         planes[5] | planes[6] | planes[7] | planes[8] | planes[9]]
+        self.key = key
+
+    @classmethod
+    def from_fen(cls, fen):
+        """Position from a FEN string; the move counters are optional.
+
+        EPD lines work too: anything after the fourth field that is not a
+        pair of move counters is ignored.
+        """
+        fields = fen.split()
+        if len(fields) < 4:
+            raise ValueError(f"Invalid FEN: {fen!r}")
+        mailbox = []
+        for ch in fields[0]:
+            if ch == "/":
+                continue
+            if ch.isdigit():
+                mailbox.extend([EMPTY] * int(ch))
+            else:
+                piece = FEN_LETTERS.find(ch)
+                if piece < 0:
+                    raise ValueError(f"Invalid FEN piece {ch!r}: {fen!r}")
+                mailbox.append(piece)
+        if len(mailbox) != 64 or fields[1] not in ("w", "b"):
+            raise ValueError(f"Invalid FEN: {fen!r}")
+
+        castling = 0
+        for right, letter in FEN_CASTLING:
+            if letter in fields[2]:
+                castling |= right
+        position = cls.from_mailbox(mailbox, WHITE if fields[1] == "w" else BLACK, castling)
+
+        # Same convention as make_move: only keep a square that can be taken on
+        if fields[3] != "-":
+            ep_square = parse_square(fields[3])
+            them = position.side ^ 1
+            if PAWN_ATTACKS[them][ep_square] & position.pieces[position.side * 6 + PAWN]:
+                position.ep_square = ep_square
+                position.key ^= EP_KEYS[ep_square & 7]
+        if len(fields) > 4 and fields[4].isdigit():
+            fullmove = int(fields[5]) if len(fields) > 5 and fields[5].isdigit() else 1
+            position.set_counters(int(fields[4]), fullmove)
+        return position
+
+    def set_counters(self, halfmove_clock, fullmove):
+        """Set the FEN move counters (the fullmove number starts at 1)."""
+        self.halfmove_clock = halfmove_clock
+        self.start_ply = 2 * (max(fullmove, 1) - 1) + self.side - len(self.history)
+
+    @property
+    def fullmove(self):
+        # Counted from the position the game was set up from, like FEN does
+        return (self.start_ply + len(self.history)) // 2 + 1
+
+    def to_fen(self):
+        rows = []
+        mailbox = self.mailbox
+        for row in range(8):
+            text = ""
+            empty = 0
+            for piece in mailbox[row * 8:row * 8 + 8]:
+                if piece == EMPTY:
+                    empty += 1
+                    continue
+                if empty:
+                    text += str(empty)
+                    empty = 0
+                text += FEN_LETTERS[piece]
+            if empty:
+                text += str(empty)
+            rows.append(text)
+        castling = "".join(letter for right, letter in FEN_CASTLING if self.castling & right) or "-"
+        ep = square_name(self.ep_square) if self.ep_square >= 0 else "-"
+        return (f"{'/'.join(rows)} {'wb'[self.side]} {castling} {ep} "
+                f"{self.halfmove_clock} {self.fullmove}")
+
+    def copy(self):
+        other = Position.__new__(Position)
+        other.pieces = self.pieces[:]
+        other.occupied = self.occupied[:]
+        other.all_occupied = self.all_occupied
+        other.mailbox = self.mailbox[:]
+        other.side = self.side
+        other.castling = self.castling
+        other.ep_square = self.ep_square
+        other.halfmove_clock = self.halfmove_clock
+        other.key = self.key
+        other.history = self.history[:]
+        other.attack_sets = self.attack_sets[:]
+        other.attack_planes = self.attack_planes[:]
+        other.attacked = self.attacked[:]
+        other.psqt_mg = self.psqt_mg
+        other.psqt_eg = self.psqt_eg
+        other.phase = self.phase
+        other.start_ply = self.start_ply
+        return other
+
+    def put(self, piece, sq):
+        b = 1 << sq
+        self.pieces[piece] |= b
+        self.occupied[piece // 6] |= b
+        self.all_occupied |= b
+        self.mailbox[sq] = piece
+        self.key ^= PIECE_KEYS[piece * 64 + sq]
+        self.psqt_mg += PSQT_MG[piece * 64 + sq]
+        self.psqt_eg += PSQT_EG[piece * 64 + sq]
+        self.phase += PIECE_PHASE[piece]
+        self._update_attacks(b)
+
+    def remove(self, sq):
+        piece = self.mailbox[sq]
+        if piece != EMPTY:
+            b = 1 << sq
+            self.pieces[piece] ^= b
+            self.occupied[piece // 6] ^= b
+            self.all_occupied ^= b
+            self.mailbox[sq] = EMPTY
+            self.key ^= PIECE_KEYS[piece * 64 + sq]
+            self.psqt_mg -= PSQT_MG[piece * 64 + sq]
+            self.psqt_eg -= PSQT_EG[piece * 64 + sq]
+            self.phase -= PIECE_PHASE[piece]
+            self._update_attacks(b)
+        return piece
+
+    def move(self, from_sq, to_sq):
+        """Move whatever stands on from_sq to to_sq, returning any captured piece."""
+        captured = self.remove(to_sq)
+        self.put(self.remove(from_sq), to_sq)
+        return captured
+
+    def encode(self, from_sq, to_sq, promotion=QUEEN):
+        """Build the move for a from/to square pair, detecting castling,
+        double pushes, en passant and promotions."""
+        piece = self.mailbox[from_sq]
+        ptype = piece % 6
+        if ptype == KING and abs(to_sq - from_sq) == 2:
+            return encode_move(from_sq, to_sq, special=CASTLE)
+        if ptype == PAWN:
+            if to_sq < 8 or to_sq >= 56:
+                return encode_move(from_sq, to_sq, promotion)
+            if abs(to_sq - from_sq) == 16:
+                return encode_move(from_sq, to_sq, special=DOUBLE_PUSH)
+            if to_sq == self.ep_square and (to_sq - from_sq) % 8:
+                return encode_move(from_sq, to_sq, special=EN_PASSANT)
+        return encode_move(from_sq, to_sq)
+
+    def make_move(self, move):
+        from_sq = move & 63
+        to_sq = (move >> 6) & 63
+        special = move >> 15
+        mailbox = self.mailbox
+        pieces = self.pieces
+        occupied = self.occupied
+        piece = mailbox[from_sq]
+        us = piece // 6
+
+        cap_sq = to_sq
+        if special == EN_PASSANT:
+            cap_sq = to_sq + 8 if us == WHITE else to_sq - 8
+        captured = mailbox[cap_sq]
+        castling = self.castling
+        key = self.key
+        mg = self.psqt_mg
+        eg = self.psqt_eg
+        undo = (move, captured, castling, self.ep_square, self.halfmove_clock, key,
+                mg, eg, self.phase, tuple(self.attack_planes), tuple(self.attacked))
+        changed = (1 << from_sq) | (1 << to_sq) | (1 << cap_sq)
+
+        if self.ep_square >= 0:
+            key ^= EP_KEYS[self.ep_square & 7]
+        key ^= SIDE_KEY ^ PIECE_KEYS[piece * 64 + from_sq] ^ PIECE_KEYS[piece * 64 + to_sq]
+        mg += PSQT_MG[piece * 64 + to_sq] - PSQT_MG[piece * 64 + from_sq]
+        eg += PSQT_EG[piece * 64 + to_sq] - PSQT_EG[piece * 64 + from_sq]
+
+        if captured != EMPTY:
+            b = 1 << cap_sq
+            pieces[captured] ^= b
+            occupied[us ^ 1] ^= b
+            mailbox[cap_sq] = EMPTY
+            key ^= PIECE_KEYS[captured * 64 + cap_sq]
+            mg -= PSQT_MG[captured * 64 + cap_sq]
+            eg -= PSQT_EG[captured * 64 + cap_sq]
+            self.phase -= PIECE_PHASE[captured]
+            self.halfmove_clock = 0
+        elif piece % 6 == PAWN:
+            self.halfmove_clock = 0
+        else:
+            self.halfmove_clock += 1
+
+        b = (1 << from_sq) | (1 << to_sq)
+        pieces[piece] ^= b
+        occupied[us] ^= b
+        mailbox[from_sq] = EMPTY
+        mailbox[to_sq] = piece
+
+        promotion = (move >> 12) & 7
+        if promotion:
+            b = 1 << to_sq
+            pieces[piece] ^= b
+            key ^= PIECE_KEYS[piece * 64 + to_sq]
+            mg -= PSQT_MG[piece * 64 + to_sq]
+            eg -= PSQT_EG[piece * 64 + to_sq]
+            piece = us * 6 + promotion
+            pieces[piece] |= b
+            mailbox[to_sq] = piece
+            key ^= PIECE_KEYS[piece * 64 + to_sq]
+            mg += PSQT_MG[piece * 64 + to_sq]
+            eg += PSQT_EG[piece * 64 + to_sq]
+            self.phase += PIECE_PHASE[piece]
+        elif special == CASTLE:
+            rook_from, rook_to = CASTLE_ROOK_SQUARES[to_sq]
+            rook = mailbox[rook_from]
+            b = (1 << rook_from) | (1 << rook_to)
+            pieces[rook] ^= b
+            occupied[us] ^= b
+            mailbox[rook_from] = EMPTY
+            mailbox[rook_to] = rook
+            key ^= PIECE_KEYS[rook * 64 + rook_from] ^ PIECE_KEYS[rook * 64 + rook_to]
+            mg += PSQT_MG[rook * 64 + rook_to] - PSQT_MG[rook * 64 + rook_from]
+            eg += PSQT_EG[rook * 64 + rook_to] - PSQT_EG[rook * 64 + rook_from]
+            changed |= b
+
+        self.all_occupied = occupied[0] | occupied[1]
+        new_castling = castling & CASTLING_MASK[from_sq] & CASTLING_MASK[to_sq]
+        if new_castling != castling:
+            key ^= CASTLING_KEYS[castling] ^ CASTLING_KEYS[new_castling]
+            self.castling = new_castling
+
+        # Remember the skipped square only if an enemy pawn could take en passant
+        self.ep_square = -1
+        if special == DOUBLE_PUSH:
+            ep_square = (from_sq + to_sq) >> 1
+            if PAWN_ATTACKS[us][ep_square] & pieces[(us ^ 1) * 6 + PAWN]:
+                self.ep_square = ep_square
+                key ^= EP_KEYS[ep_square & 7]
+
+        self.key = key
+        self.psqt_mg = mg
+        self.psqt_eg = eg
+        self.side ^= 1
+        self.history.append(undo + (self._update_attacks(changed),))
+
+    def unmake_move(self):
+        (move, captured, self.castling, self.ep_square, self.halfmove_clock, self.key,
+         self.psqt_mg, self.psqt_eg, self.phase, planes, attacked, replaced) = self.history.pop()
+        self.attack_planes[:] = planes
+        self.attacked[:] = attacked
+        attack_sets = self.attack_sets
+        for index, attacks in replaced:
+            attack_sets[index] = attacks
+        from_sq = move & 63
+        to_sq = (move >> 6) & 63
+        special = move >> 15
+        mailbox = self.mailbox
+        pieces = self.pieces
+        occupied = self.occupied
+        piece = mailbox[to_sq]
+        us = piece // 6
+
+        promotion = (move >> 12) & 7
+        if promotion:
+            b = 1 << to_sq
+            pieces[piece] ^= b
+            piece = us * 6 + PAWN
+            pieces[piece] |= b
+        elif special == CASTLE:
+            rook_from, rook_to = CASTLE_ROOK_SQUARES[to_sq]
+            rook = mailbox[rook_to]
+            b = (1 << rook_from) | (1 << rook_to)
+            pieces[rook] ^= b
+            occupied[us] ^= b
+            mailbox[rook_to] = EMPTY
+            mailbox[rook_from] = rook
+
+        b = (1 << from_sq) | (1 << to_sq)
+        pieces[piece] ^= b
+        occupied[us] ^= b
+        mailbox[to_sq] = EMPTY
+        mailbox[from_sq] = piece
+
+        if captured != EMPTY:
+            cap_sq = to_sq
+            if special == EN_PASSANT:
+                cap_sq = to_sq + 8 if us == WHITE else to_sq - 8
+            b = 1 << cap_sq
+            pieces[captured] |= b
+            occupied[us ^ 1] |= b
+            mailbox[cap_sq] = captured
+
+        self.all_occupied = occupied[0] | occupied[1]
+        self.side ^= 1
+
+    def _update_attacks(self, changed):
+        """Bring the attack maps in line with the bitboards after the squares
+        in changed were emptied or filled.
+
+        Only the pieces on those squares and the sliders whose stored
+        attacks reach one of them can have different attacks now; every
+        other entry is left alone. Returns the replaced (index, attacks)
+        pairs so unmake_move can put them back.
+        """
+        attack_sets = self.attack_sets
+        planes = self.attack_planes
+        mailbox = self.mailbox
+        pieces = self.pieces
+        replaced = []
+
+        dirty = changed
+        sliders = (pieces[W_BISHOP] | pieces[W_ROOK] | pieces[W_QUEEN]
+                   | pieces[B_BISHOP] | pieces[B_ROOK] | pieces[B_QUEEN]) & ~changed
+        while sliders:
+            low = sliders & -sliders
+            sq = low.bit_length() - 1
+            if attack_sets[(mailbox[sq] // 6) * 64 + sq] & changed:
+                dirty |= low
+            sliders ^= low
+
+        touched = 0
+        while dirty:
+            low = dirty & -dirty
+            sq = low.bit_length() - 1
+            dirty ^= low
+            piece = mailbox[sq]
+            for color in (0, 1):
+                index = color * 64 + sq
+                old = attack_sets[index]
+                if piece != EMPTY and piece // 6 == color:
+                    new = self.attacks_from(sq)
+                elif not old:
+                    continue
+                else:
+                    new = 0
+                if old == new:
+                    continue
+                replaced.append((index, old))
+                attack_sets[index] = new
+                touched |= 1 << color
+                first = color * ATTACK_PLANES
+
+                # Bit-sliced counter update: subtract the lost squares, add the gained ones
+                borrow = old & ~new
+                i = first
+                while borrow:
+                    plane = planes[i]
+                    planes[i] = plane ^ borrow
+                    borrow &= ~plane
+                    i += 1
+                carry = new & ~old
+                i = first
+                while carry:
+                    plane = planes[i]
+                    planes[i] = plane ^ carry
+                    carry &= plane
+                    i += 1
+
+        for color in (0, 1):
+            if touched >> color & 1:
+                first = color * ATTACK_PLANES
+                self.attacked[color] = (planes[first] | planes[first + 1] | planes[first + 2]
+                                        | planes[first + 3] | planes[first + 4])
+        return replaced
+
+    def attacker_count(self, sq, color):
+        """How many of the given side's pieces attack sq."""
+        planes = self.attack_planes
+        first = color * ATTACK_PLANES
+        return sum(((planes[first + i] >> sq) & 1) << i for i in range(ATTACK_PLANES))
+
+    def kings(self):
+        return self.pieces[W_KING] | self.pieces[B_KING]
+
+    def king_square(self, color):
+        king = self.pieces[color * 6 + KING]
+        if not king:
+            raise ValueError("King piece not found on the board.")
+        return lsb(king)
+
+    def attacks_from(self, sq, occupied=None):
+        """Squares attacked by the piece on sq (own pieces included)."""
+        piece = self.mailbox[sq]
+        if piece == EMPTY:
+            return 0
+        if occupied is None:
+            occupied = self.all_occupied
+        ptype = piece % 6
+        if ptype == PAWN:
+            return PAWN_ATTACKS[piece // 6][sq]
+        if ptype == KNIGHT:
+            return KNIGHT_ATTACKS[sq]
+        if ptype == BISHOP:
+            return bishop_attacks(sq, occupied)
+        if ptype == ROOK:
+            return rook_attacks(sq, occupied)
+        if ptype == QUEEN:
+            return queen_attacks(sq, occupied)
+        return KING_ATTACKS[sq]
+
+    def attacked_squares(self, color, occupied=None):
+        """Union of every square attacked by the given side.
+
+        With the current occupancy this is a lookup in the attack map; a
+        different occupancy (e.g. with a king lifted off) is computed fresh.
+        """
+        if occupied is None:
+            return self.attacked[color]
+        p = self.pieces
+        base = color * 6
+        queens = p[base + QUEEN]
+        # Leapers are handled set-wise, sliders through the magic tables
+        attacks = (pawn_attacks_bb(p[base + PAWN], color)
+                   | knight_attacks_bb(p[base + KNIGHT])
+                   | king_attacks_bb(p[base + KING]))
+        sliders = p[base + BISHOP] | queens
+        while sliders:
+            low = sliders & -sliders
+            attacks |= bishop_attacks(low.bit_length() - 1, occupied)
+            sliders ^= low
+        sliders = p[base + ROOK] | queens
+        while sliders:
+            low = sliders & -sliders
+            attacks |= rook_attacks(low.bit_length() - 1, occupied)
+            sliders ^= low
+        return attacks
+
+    def attackers_to(self, sq, color, occupied=None):
+        """Bitboard of the given side's pieces attacking sq."""
+        if occupied is None:
+            occupied = self.all_occupied
+        p = self.pieces
+        base = color * 6
+        queens = p[base + QUEEN]
+        return ((PAWN_ATTACKS[color ^ 1][sq] & p[base + PAWN])
+                | (KNIGHT_ATTACKS[sq] & p[base + KNIGHT])
+                | (KING_ATTACKS[sq] & p[base + KING])
+                | (bishop_attacks(sq, occupied) & (p[base + BISHOP] | queens))
+                | (rook_attacks(sq, occupied) & (p[base + ROOK] | queens)))
+
+    def is_attacked(self, sq, color, occupied=None):
+        if occupied is None:
+            return (self.attacked[color] >> sq) & 1 == 1
+        return self.attackers_to(sq, color, occupied) != 0
+
+
+class BoardView(Sequence):
+    """Read-only board_pieces view ("wKnight", "0", ...) over a mailbox."""
+
+    __slots__ = ("_mailbox",)
+
+    def __init__(self, mailbox):
+        self._mailbox = mailbox
+
+    def __len__(self):
+        return 64
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(64))]
+        piece = self._mailbox[index]
+        return "0" if piece == EMPTY else PIECE_NAMES[piece]
+
+    def __iter__(self):
+        for piece in self._mailbox:
+            yield "0" if piece == EMPTY else PIECE_NAMES[piece]
+
+    def __contains__(self, name):
+        code = EMPTY if name == "0" else PIECE_CODES.get(name)
+        return code is not None and code in self._mailbox
+
+    def index(self, name, start=0, stop=64):
+        code = EMPTY if name == "0" else PIECE_CODES.get(name)
+        if code is None:
+            raise ValueError(f"{name!r} is not on the board")
+        return self._mailbox.index(code, start, stop)
+
+    def __repr__(self):
+        return f"BoardView({list(self)!r})"
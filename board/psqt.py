@@ -0,0 +1,118 @@
+# board/psqt.py
+
+# Material plus piece-square tables for a tapered evaluation. Position keeps
+# the running midgame/endgame sums and the game phase up to date on every
+# put/remove/make/unmake, so the evaluation never has to rescan the board.
+#
+# The tables below are written from White's point of view with rank 8 in the
+# first row, which matches the board indexing (0 = a8). Black uses the
+# vertically mirrored square (sq ^ 56). The combined PSQT_MG / PSQT_EG
+# tables are indexed piece * 64 + sq and are signed: positive favours White.
+
+from board.bitboard import PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING
+
+MATERIAL_MG = (100, 320, 330, 500, 900, 0)
+MATERIAL_EG = (120, 290, 310, 530, 940, 0)
+
+# How much each piece type counts towards the middlegame; the starting
+# position adds up to PHASE_TOTAL and a bare-kings ending to 0.
+PHASE_WEIGHTS = (0, 1, 1, 2, 4, 0)
+PHASE_TOTAL = 24
+
+_PAWN_MG = (
+    0,   0,   0,   0,   0,   0,   0,   0,
+    50,  50,  50,  50,  50,  50,  50,  50,
+    10,  10,  20,  30,  30,  20,  10,  10,
+    5,   5,  10,  25,  25,  10,   5,   5,
+    0,   0,   0,  20,  20,   0,   0,   0,
+    5,  -5, -10,   0,   0, -10,  -5,   5,
+    5,  10,  10, -20, -20,  10,  10,   5,
+    0,   0,   0,   0,   0,   0,   0,   0,
+)
+_PAWN_EG = (
+    0,   0,   0,   0,   0,   0,   0,   0,
+    80,  80,  80,  80,  80,  80,  80,  80,
+    50,  50,  50,  50,  50,  50,  50,  50,
+    30,  30,  30,  30,  30,  30,  30,  30,
+    15,  15,  15,  15,  15,  15,  15,  15,
+    5,   5,   5,   5,   5,   5,   5,   5,
+    0,   0,   0,   0,   0,   0,   0,   0,
+    0,   0,   0,   0,   0,   0,   0,   0,
+)
+_KNIGHT = (
+    -50, -40, -30, -30, -30, -30, -40, -50,
+    -40, -20,   0,   0,   0,   0, -20, -40,
+    -30,   0,  10,  15,  15,  10,   0, -30,
+    -30,   5,  15,  20,  20,  15,   5, -30,
+    -30,   0,  15,  20,  20,  15,   0, -30,
+    -30,   5,  10,  15,  15,  10,   5, -30,
+    -40, -20,   0,   5,   5,   0, -20, -40,
+    -50, -40, -30, -30, -30, -30, -40, -50,
+)
+_BISHOP = (
+    -20, -10, -10, -10, -10, -10, -10, -20,
+    -10,   0,   0,   0,   0,   0,   0, -10,
+    -10,   0,   5,  10,  10,   5,   0, -10,
+    -10,   5,   5,  10,  10,   5,   5, -10,
+    -10,   0,  10,  10,  10,  10,   0, -10,
+    -10,  10,  10,  10,  10,  10,  10, -10,
+    -10,   5,   0,   0,   0,   0,   5, -10,
+    -20, -10, -10, -10, -10, -10, -10, -20,
+)
+_ROOK = (
+    0,   0,   0,   0,   0,   0,   0,   0,
+    5,  10,  10,  10,  10,  10,  10,   5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    0,   0,   0,   5,   5,   0,   0,   0,
+)
+_QUEEN = (
+    -20, -10, -10,  -5,  -5, -10, -10, -20,
+    -10,   0,   0,   0,   0,   0,   0, -10,
+    -10,   0,   5,   5,   5,   5,   0, -10,
+    -5,   0,   5,   5,   5,   5,   0,  -5,
+    0,   0,   5,   5,   5,   5,   0,  -5,
+    -10,   5,   5,   5,   5,   5,   0, -10,
+    -10,   0,   5,   0,   0,   0,   0, -10,
+    -20, -10, -10,  -5,  -5, -10, -10, -20,
+)
+_KING_MG = (
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -20, -30, -30, -40, -40, -30, -30, -20,
+    -10, -20, -20, -20, -20, -20, -20, -10,
+    20,  20,   0,   0,   0,   0,  20,  20,
+    20,  30,  10,   0,   0,  10,  30,  20,
+)
+_KING_EG = (
+    -50, -40, -30, -20, -20, -30, -40, -50,
+    -30, -20, -10,   0,   0, -10, -20, -30,
+    -30, -10,  20,  30,  30,  20, -10, -30,
+    -30, -10,  30,  40,  40,  30, -10, -30,
+    -30, -10,  30,  40,  40,  30, -10, -30,
+    -30, -10,  20,  30,  30,  20, -10, -30,
+    -30, -30,   0,   0,   0,   0, -30, -30,
+    -50, -30, -30, -30, -30, -30, -30, -50,
+)
+
+_TABLES_MG = {PAWN: _PAWN_MG, KNIGHT: _KNIGHT, BISHOP: _BISHOP, ROOK: _ROOK, QUEEN: _QUEEN, KING: _KING_MG}
+_TABLES_EG = {PAWN: _PAWN_EG, KNIGHT: _KNIGHT, BISHOP: _BISHOP, ROOK: _ROOK, QUEEN: _QUEEN, KING: _KING_EG}
+
+
+def _build(material, tables):
+    combined = [0] * (12 * 64)
+    for ptype in range(6):
+        for sq in range(64):
+            combined[ptype * 64 + sq] = material[ptype] + tables[ptype][sq]
+            combined[(6 + ptype) * 64 + sq] = -(material[ptype] + tables[ptype][sq ^ 56])
+    return combined
+
+
+PSQT_MG = _build(MATERIAL_MG, _TABLES_MG)
+PSQT_EG = _build(MATERIAL_EG, _TABLES_EG)
+PIECE_PHASE = PHASE_WEIGHTS * 2  # indexed by piece code
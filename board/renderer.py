@@ -0,0 +1,131 @@
+# board/renderer.py
+
+# Draws a Board with pygame: tiles, coordinates, highlights and pieces. The
+# Board itself (board/board.py) holds no rendering code, so the rules can
+# be imported where there is no pygame or display.
+#
+# The tiles, coordinates and window background never change, so they are
+# drawn once into a cached surface. Each frame draw() works out what every
+# square should show (piece, check, selection, move target), repaints only
+# the squares that differ from the last frame and returns their rects for
+# pygame.display.update; on an unchanged board it draws nothing at all.
+# The translucent check, selection and move-target squares are built once
+# and blitted wherever they are needed.
+
+import pygame
+from settings import ROWS, COLS, SQUARE_SIZE, MARGIN_X, MARGIN_Y, WHITE, BROWN, BOARD_SIZE, BG_COLOR, HIGHLIGHT
+from utils.tile_utils import tile_center_position
+from pieces.images import get_piece_images
+from board.bitboard import EMPTY
+
+# Screen rect of every square, indexed like the board
+SQUARE_RECTS = [
+    pygame.Rect(MARGIN_X + col * SQUARE_SIZE, MARGIN_Y + row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
+    for row in range(ROWS)
+    for col in range(COLS)
+]
+
+# RGBA fill of each square overlay
+OVERLAY_COLORS = {
+    "check": (255, 0, 0, 120),        # Red with transparency
+    "selected": (*HIGHLIGHT, 100),
+    "target": (*HIGHLIGHT, 80),
+}
+
+
+class BoardRenderer:
+    def __init__(self, board):
+        self.board = board
+        self._background = None  # window-sized: background colour, tiles and coordinates
+        self._drawn = None       # what each square showed in the last frame; None until the first
+        self._overlays = {}
+
+    def invalidate(self):
+        # Repaint the whole window next frame, e.g. after something else drew over it
+        self._drawn = None
+
+    def draw_tiles(self, surface):
+        # Draw the chess squares (your original code)
+        for row in range(ROWS):
+            for col in range(COLS):
+                color = WHITE if (row + col) % 2 == 0 else BROWN
+                x = MARGIN_X + col * SQUARE_SIZE
+                y = MARGIN_Y + row * SQUARE_SIZE
+                pygame.draw.rect(surface, color, (x, y, SQUARE_SIZE, SQUARE_SIZE))
+
+        # Draw algebraic notation (letters and numbers)
+        font = pygame.font.Font(None, 24)
+
+        # Draw file letters (a-h) at the bottom
+        for col in range(COLS):
+            letter = chr(ord('a') + col)
+            text = font.render(letter, True, (200, 200, 200))
+            x = MARGIN_X + col * SQUARE_SIZE + SQUARE_SIZE // 2 - text.get_width() // 2
+            y = MARGIN_Y + BOARD_SIZE + 5
+            surface.blit(text, (x, y))
+
+        # Draw rank numbers (1-8) on the right side
+        for row in range(ROWS):
+            number = str(8 - row)  # Chess ranks go from 8 at top to 1 at bottom
+            text = font.render(number, True, (200, 200, 200))
+            x = MARGIN_X + BOARD_SIZE + 5
+            y = MARGIN_Y + row * SQUARE_SIZE + SQUARE_SIZE // 2 - text.get_height() // 2
+            surface.blit(text, (x, y))
+
+    def background(self, surface):
+        # Built on first use, in the display's pixel format so blits from it are plain copies
+        if self._background is None or self._background.get_size() != surface.get_size():
+            background = pygame.Surface(surface.get_size()).convert(surface)
+            background.fill(BG_COLOR)
+            self.draw_tiles(background)
+            self._background = background
+        return self._background
+
+    def overlay(self, kind):
+        # One translucent square per kind, shared by every square that shows it
+        overlay = self._overlays.get(kind)
+        if overlay is None:
+            overlay = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
+            overlay.fill(OVERLAY_COLORS[kind])
+            self._overlays[kind] = overlay
+        return overlay
+
+    def check_square(self):
+        # Square of the side to move's king when it is in check, from the per-ply status cache
+        status = self.board.status
+        if not status.in_check:
+            return None
+        return self.board.position.king_square(status.side)
+
+    def draw(self, surface, selected_index=None, move_indices=()):
+        """Bring surface up to date and return the list of rects that changed."""
+        mailbox = self.board.position.mailbox
+        check = self.check_square()
+        targets = set(move_indices)
+        state = [(mailbox[i], i == check, i == selected_index, i in targets) for i in range(64)]
+
+        drawn = self._drawn
+        if drawn is None:
+            surface.blit(self.background(surface), (0, 0))
+            changed = range(64)
+            rects = [surface.get_rect()]
+        else:
+            changed = [i for i in range(64) if state[i] != drawn[i]]
+            rects = [SQUARE_RECTS[i] for i in changed]
+        for index in changed:
+            self.draw_square(surface, index, *state[index])
+        self._drawn = state
+        return rects
+
+    def draw_square(self, surface, index, piece, in_check, selected, target):
+        # Tile from the cached background, then the overlays and the piece, in the old draw order
+        rect = SQUARE_RECTS[index]
+        surface.blit(self.background(surface), rect, rect)
+        if in_check:
+            surface.blit(self.overlay("check"), rect)
+        if selected:
+            surface.blit(self.overlay("selected"), rect)
+        if target:
+            surface.blit(self.overlay("target"), rect)
+        if piece != EMPTY:
+            surface.blit(get_piece_images()[self.board.board_pieces[index]], tile_center_position[index])
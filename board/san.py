@@ -0,0 +1,120 @@
+# board/san.py
+
+# Standard Algebraic Notation (the move text of PGN files): "e4", "Nbd7",
+# "exd6", "R1a3", "e8=Q+", "O-O-O". Moves are matched against the legal
+# moves of the position, so ambiguous or illegal SAN is rejected.
+
+from board.bitboard import PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, EMPTY
+from board.move import CASTLE, EN_PASSANT, FILE_NAMES, square_name, parse_square
+from board.movegen import generate_legal_moves, in_check
+
+SAN_PIECES = {"N": KNIGHT, "B": BISHOP, "R": ROOK, "Q": QUEEN, "K": KING}
+PIECE_LETTERS = {KNIGHT: "N", BISHOP: "B", ROOK: "R", QUEEN: "Q", KING: "K"}
+RANKS = "87654321"  # row 0 is rank 8
+
+
+def parse_san(position, san, moves=None):
+    """The legal move of position written as san (ValueError if there is none).
+
+    moves can pass in the already generated legal moves of position.
+    """
+    if moves is None:
+        moves = generate_legal_moves(position)
+    text = san.rstrip("+#!?")
+    mailbox = position.mailbox
+
+    if text in ("O-O", "0-0", "O-O-O", "0-0-0"):
+        long = len(text) == 5
+        for move in moves:
+            if move >> 15 == CASTLE and (((move >> 6) & 7) == 2) == long:
+                return move
+        raise ValueError(f"Illegal castling {san!r}")
+
+    promotion = 0
+    if "=" in text:
+        text, letter = text.split("=", 1)
+        promotion = SAN_PIECES.get(letter.upper(), 0)
+        if not promotion or promotion == KING:
+            raise ValueError(f"Invalid promotion in {san!r}")
+    elif len(text) > 2 and text[-1] in "NBRQ" and text[-2] in RANKS:
+        promotion = SAN_PIECES[text[-1]]  # "e8Q" without the "="
+        text = text[:-1]
+
+    if len(text) < 2:
+        raise ValueError(f"Invalid SAN {san!r}")
+    ptype = PAWN
+    if text[0] in SAN_PIECES:
+        ptype = SAN_PIECES[text[0]]
+        text = text[1:]
+    try:
+        to_sq = parse_square(text[-2:])
+    except (ValueError, IndexError):
+        raise ValueError(f"Invalid SAN {san!r}") from None
+    hint = text[:-2].replace("x", "")
+    from_file = from_rank = -1
+    for ch in hint:
+        if ch in FILE_NAMES:
+            from_file = FILE_NAMES.index(ch)
+        elif ch in RANKS:
+            from_rank = RANKS.index(ch)
+        else:
+            raise ValueError(f"Invalid SAN {san!r}")
+
+    found = None
+    for move in moves:
+        from_sq = move & 63
+        if ((move >> 6) & 63 != to_sq or mailbox[from_sq] % 6 != ptype
+                or (move >> 12) & 7 != promotion or move >> 15 == CASTLE):
+            continue
+        if from_file >= 0 and from_sq & 7 != from_file:
+            continue
+        if from_rank >= 0 and from_sq >> 3 != from_rank:
+            continue
+        if found is not None:
+            raise ValueError(f"Ambiguous SAN {san!r}")
+        found = move
+    if found is None:
+        raise ValueError(f"Illegal SAN {san!r}")
+    return found
+
+
+def move_to_san(position, move, moves=None):
+    """SAN for a legal move of position, with the check or mate suffix."""
+    if moves is None:
+        moves = generate_legal_moves(position)
+    from_sq = move & 63
+    to_sq = (move >> 6) & 63
+    piece = position.mailbox[from_sq]
+    ptype = piece % 6
+
+    if move >> 15 == CASTLE:
+        text = "O-O" if to_sq & 7 == 6 else "O-O-O"
+    else:
+        capture = position.mailbox[to_sq] != EMPTY or move >> 15 == EN_PASSANT
+        if ptype == PAWN:
+            text = FILE_NAMES[from_sq & 7] + "x" if capture else ""
+        else:
+            text = PIECE_LETTERS[ptype]
+            # Disambiguate against other pieces of the same kind reaching to_sq
+            rivals = [other & 63 for other in moves
+                      if (other >> 6) & 63 == to_sq and other & 63 != from_sq
+                      and position.mailbox[other & 63] == piece]
+            if rivals:
+                if all(sq & 7 != from_sq & 7 for sq in rivals):
+                    text += FILE_NAMES[from_sq & 7]
+                elif all(sq >> 3 != from_sq >> 3 for sq in rivals):
+                    text += RANKS[from_sq >> 3]
+                else:
+                    text += square_name(from_sq)
+            if capture:
+                text += "x"
+        text += square_name(to_sq)
+        promotion = (move >> 12) & 7
+        if promotion:
+            text += "=" + PIECE_LETTERS[promotion]
+
+    position.make_move(move)
+    if in_check(position):
+        text += "#" if not generate_legal_moves(position) else "+"
+    position.unmake_move()
+    return text
@@ -0,0 +1,33 @@
+# board/zobrist.py
+
+# Zobrist keys: the position key is the XOR of one random 64-bit number per
+# (piece, square), the castling rights, the en passant file and the side to
+# move. The generator is seeded so keys are identical across runs and
+# processes; anything persisted by key (books, bitbases) depends on that.
+
+import random
+
+_rng = random.Random(0x5EED_C4E55)
+
+# Indexed piece * 64 + square
+PIECE_KEYS = [_rng.getrandbits(64) for _ in range(12 * 64)]
+CASTLING_KEYS = [_rng.getrandbits(64) for _ in range(16)]
+EP_KEYS = [_rng.getrandbits(64) for _ in range(8)]  # by file
+SIDE_KEY = _rng.getrandbits(64)  # XORed in when black is to move
+
+# No castling rights contributes nothing, like no en passant square
+CASTLING_KEYS[0] = 0
+
+
+def compute_key(position):
+    """Hash a position from scratch; tools.perft --check compares it with the incremental key."""
+    key = 0
+    for sq, piece in enumerate(position.mailbox):
+        if piece >= 0:
+            key ^= PIECE_KEYS[piece * 64 + sq]
+    key ^= CASTLING_KEYS[position.castling]
+    if position.ep_square >= 0:
+        key ^= EP_KEYS[position.ep_square % 8]
+    if position.side:
+        key ^= SIDE_KEY
+    return key
@@ -0,0 +1,4 @@
+# conftest.py
+
+# Marks the repository root for pytest, so the tests import board/, engine/
+# and tools/ the way `python -m` does.
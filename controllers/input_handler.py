@@ -11,7 +11,13 @@ class InputHandler:
         self.available_moves = []   # Will be set after first click
 
     def handle(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_BACKSPACE:
+            self.undo_move()
+
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if self.game.is_bot_turn():
+                return
+
             index = self.get_tile_index(event.pos)
 
             #print(f"index = {index}")#for debugging reasons 
@@ -24,16 +30,8 @@ class InputHandler:
             if self.selected_index is None:
                 if self.board.board_pieces[index].startswith(turn_prefix):
                     self.selected_index = index
-                    valid_moves = self.board.get_valid_moves(index)
-
-                    # If the king is in check, filter moves to those that resolve it
-                    valid_moves = [
-                        move for move in valid_moves
-                        if self.board.game_rules.is_move_resolving_check(self.selected_index, move, self.game.white_turn)
-                    ]
-
-
-                    self.available_moves = valid_moves
+                    # Legal moves only, so pinned pieces and check evasions are already handled
+                    self.available_moves = self.board.legal_targets(index)
 
 
             else:
@@ -50,17 +48,21 @@ class InputHandler:
                 else:
                     if self.board.board_pieces[index].startswith(turn_prefix):
                         self.selected_index = index
-                        valid_moves = self.board.get_valid_moves(index)
-
-                        
-                        valid_moves = [
-                            move for move in valid_moves
-                            if self.board.game_rules.is_move_resolving_check(self.selected_index, move, self.game.white_turn)
-                        ]
+                        self.available_moves = self.board.legal_targets(index)
 
-                        self.available_moves = valid_moves
 
 
+    def undo_move(self):
+        self.game.cancel_bot_search()  # its answer would be for a position that is gone
+        if self.board.position.history:
+            self.board.unmake_move()
+            self.game.white_turn = not self.game.white_turn
+            # Against the bot, take its reply back too so the player is to move again
+            if self.game.is_bot_turn() and self.board.position.history:
+                self.board.unmake_move()
+                self.game.white_turn = not self.game.white_turn
+            self.selected_index = None
+            self.available_moves = []
 
     def get_tile_index(self, position):
         x, y = position
@@ -0,0 +1,84 @@
+# engine/background.py
+
+# Runs the bot's search off the game loop. The search itself happens in
+# worker processes (see engine/parallel.py); a helper thread here only waits
+# on their pipes, which releases the GIL, so rendering and input handling
+# carry on at full speed while the bot thinks. The game loop calls poll()
+# to pick up progress and the final move; a notify callback lets a loop that
+# sleeps until something happens be woken when there is news.
+
+import threading
+
+from engine.parallel import ParallelSearcher
+from engine.search import MAX_PLY
+
+
+class BackgroundSearch:
+    """Non-blocking front end to a ParallelSearcher.
+
+    start() launches a search and returns at once; progress holds the
+    latest completed iteration (depth, score, PV, nodes); poll() returns
+    the finished SearchResult exactly once; cancel() abandons the search.
+    notify, if given, is called from the helper thread after every new
+    progress report and when the result is ready.
+    """
+
+    def __init__(self, workers=1, tt_size_mb=16, tablebase_path=None, notify=None):
+        self.searcher = ParallelSearcher(workers, tt_size_mb, tablebase_path)
+        self.notify = notify
+        self.progress = None
+        self._thread = None
+        self._result = None
+        self._lock = threading.Lock()
+
+    @property
+    def thinking(self):
+        return self._thread is not None
+
+    def start(self, position, time_manager, max_depth=MAX_PLY):
+        self.cancel()
+        self.progress = None
+        self._result = None
+        self._thread = threading.Thread(
+            target=self._run, args=(position.copy(), time_manager.budget(), max_depth), daemon=True)
+        self._thread.start()
+
+    def _run(self, position, time_limit, max_depth):
+        result = self.searcher.search(position, time_limit, max_depth, self._report)
+        with self._lock:
+            self._result = result
+        if self.notify is not None:
+            self.notify()
+
+    def _report(self, result):
+        self.progress = result  # a single attribute store, safe to read from the game loop
+        if self.notify is not None:
+            self.notify()
+
+    def poll(self):
+        """The finished search result, or None while the bot is still thinking."""
+        if self._thread is None:
+            return None
+        with self._lock:
+            result = self._result
+        if result is None:
+            return None
+        self._thread.join()
+        self._thread = None
+        self._result = None
+        return result
+
+    def cancel(self):
+        """Stop the current search (if any) and throw its result away."""
+        if self._thread is None:
+            return
+        self.searcher.stop()
+        self._thread.join()
+        self.searcher.stop_event.clear()
+        self._thread = None
+        self._result = None
+        self.progress = None
+
+    def close(self):
+        self.cancel()
+        self.searcher.close()
@@ -0,0 +1,125 @@
+# engine/batch.py
+
+# Vectorised evaluation for scoring large sets of positions at once (offline
+# analysis, tuning). Positions are packed into NumPy arrays in one of two
+# layouts:
+#   boards     N x 64 int8, the piece code on each square (-1 when empty),
+#              the same layout as Position.mailbox / Board.board_pieces
+#   bitboards  N x 12 uint64, one bitboard per piece code like Position.pieces
+# Both give exactly the scores engine.evaluate.evaluate gives one at a time.
+#
+# NumPy is optional: the rest of the game and engine run without it, and
+# only this module needs it.
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from board.bitboard import EMPTY, PIECE_CODES
+from board.psqt import PSQT_MG, PSQT_EG, PIECE_PHASE, PHASE_TOTAL
+
+_tables = None
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("engine.batch needs NumPy: pip install numpy")
+
+
+def _get_tables():
+    # Row 12 stands for an empty square so a board can index the tables directly
+    global _tables
+    if _tables is None:
+        _require_numpy()
+        mg = np.zeros((13, 64), dtype=np.int64)
+        eg = np.zeros((13, 64), dtype=np.int64)
+        mg[:12] = np.asarray(PSQT_MG, dtype=np.int64).reshape(12, 64)
+        eg[:12] = np.asarray(PSQT_EG, dtype=np.int64).reshape(12, 64)
+        phase = np.zeros(13, dtype=np.int64)
+        phase[:12] = PIECE_PHASE
+        _tables = (mg, eg, phase)
+    return _tables
+
+
+def _mailbox(item):
+    # Board, Position or a 64-entry sequence of piece names / codes
+    position = getattr(item, "position", item)
+    mailbox = getattr(position, "mailbox", None)
+    if mailbox is not None:
+        return mailbox
+    return [PIECE_CODES.get(name, EMPTY) if isinstance(name, str) else name for name in item]
+
+
+def _side(item):
+    position = getattr(item, "position", item)
+    return getattr(position, "side", 0)
+
+
+def pack_boards(items):
+    """N x 64 int8 array of piece codes from Boards, Positions or board_pieces lists,
+    plus the N side-to-move flags (0 = White)."""
+    _require_numpy()
+    items = list(items)
+    boards = np.array([_mailbox(item) for item in items], dtype=np.int8).reshape(len(items), 64)
+    sides = np.array([_side(item) for item in items], dtype=np.int8)
+    return boards, sides
+
+
+def pack_bitboards(items):
+    """N x 12 uint64 array of piece bitboards from Boards or Positions, plus the
+    side-to-move flags."""
+    _require_numpy()
+    items = list(items)
+    bitboards = np.array([getattr(item, "position", item).pieces for item in items],
+                         dtype=np.uint64).reshape(len(items), 12)
+    sides = np.array([_side(item) for item in items], dtype=np.int8)
+    return bitboards, sides
+
+
+def _taper(mg, eg, phase, sides):
+    phase = np.minimum(phase, PHASE_TOTAL)
+    scores = (mg * phase + eg * (PHASE_TOTAL - phase)) // PHASE_TOTAL
+    if sides is not None:
+        scores = np.where(np.asarray(sides) == 0, scores, -scores)
+    return scores.astype(np.int32)
+
+
+def evaluate_boards(boards, sides=None):
+    """Scores for an N x 64 piece-code array.
+
+    With sides the scores are from each side to move's point of view, like
+    evaluate(); without them they are from White's.
+    """
+    mg_table, eg_table, phase_table = _get_tables()
+    codes = np.asarray(boards, dtype=np.int64)
+    codes = np.where(codes < 0, 12, codes)
+    squares = np.arange(64)
+    mg = mg_table[codes, squares].sum(axis=1)
+    eg = eg_table[codes, squares].sum(axis=1)
+    phase = phase_table[codes].sum(axis=1)
+    return _taper(mg, eg, phase, sides)
+
+
+def evaluate_bitboards(bitboards, sides=None, chunk=1 << 16):
+    """Scores for an N x 12 uint64 bitboard array (see evaluate_boards).
+
+    The bitboards are unpacked to one flag per piece and square, chunk
+    positions at a time to bound the memory used.
+    """
+    mg_table, eg_table, phase_table = _get_tables()
+    mg_flat = mg_table[:12].reshape(-1)
+    eg_flat = eg_table[:12].reshape(-1)
+    bitboards = np.ascontiguousarray(bitboards, dtype="<u8")
+    count = bitboards.shape[0]
+    mg = np.empty(count, dtype=np.int64)
+    eg = np.empty(count, dtype=np.int64)
+    phase = np.empty(count, dtype=np.int64)
+    for start in range(0, count, chunk):
+        part = bitboards[start:start + chunk]
+        # Bit i of each bitboard is square i: unpack little-endian to n x 768 flags
+        bits = np.unpackbits(part.view(np.uint8), axis=1, bitorder="little").astype(np.int64)
+        mg[start:start + chunk] = bits @ mg_flat
+        eg[start:start + chunk] = bits @ eg_flat
+        phase[start:start + chunk] = bits.reshape(len(part), 12, 64).sum(axis=2) @ phase_table[:12]
+    return _taper(mg, eg, phase, sides)
@@ -0,0 +1,592 @@
+# engine/bitbase.py
+
+# Endgame tables for positions with up to four pieces (kings included),
+# solved offline by retrograde analysis (tools/build_bitbases.py) and probed
+# through mmap like the opening book, so the search and the game-over logic
+# can look up exact results instead of searching them.
+#
+# There is one file per material signature, named with the stronger side as
+# White: "KQKR.bin" also answers KRKQ positions with the colours swapped.
+#   header  b"CHESSTB1" | positions per side to move (u64)
+#   data    one byte per position, all White to move, then all Black to move
+# A byte is 0 for a draw (or a position that cannot occur); otherwise it is
+# the distance to mate in plies plus one, so odd distances are wins for the
+# side to move and even ones losses.
+#
+# A position is indexed by the squares of the white king, the black king
+# and the other pieces in signature order. Tables without pawns use the
+# eight symmetries of the board to bring the white king into the a1-d1-d4
+# triangle; tables with pawns mirror it onto files a-d. Castling and en
+# passant are not modelled, and positions with either are never probed.
+
+import mmap
+import os
+import struct
+
+from board.attacks import KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS
+from board.bitboard import WHITE, BLACK, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, squares
+from board.magic import bishop_attacks, rook_attacks, queen_attacks
+
+MAGIC = b"CHESSTB1"
+HEADER = struct.Struct("<8sQ")
+MAX_PIECES = 4
+
+WIN, DRAW, LOSS = 1, 0, -1
+
+LETTERS = "PNBRQK"
+_PIECE_VALUES = (1, 3, 3, 5, 9, 0)  # only used to pick the stronger side
+
+
+def _transform(sq, flip_file, flip_rank, transpose):
+    file, rank = sq & 7, 7 - (sq >> 3)
+    if transpose:
+        file, rank = rank, file
+    if flip_file:
+        file = 7 - file
+    if flip_rank:
+        rank = 7 - rank
+    return (7 - rank) * 8 + file
+
+
+# The eight symmetries of the board as square permutations; the first two
+# (identity, left-right mirror) are the only ones that keep pawns pawns
+SYMMETRIES = [[_transform(sq, flip_file, flip_rank, transpose) for sq in range(64)]
+              for transpose in (0, 1) for flip_rank in (0, 1) for flip_file in (0, 1)]
+
+# White king squares a table is indexed by
+TRIANGLE = [sq for sq in range(64) if (sq & 7) <= 3 and 7 - (sq >> 3) <= (sq & 7)]
+HALF_BOARD = [sq for sq in range(64) if (sq & 7) <= 3]
+
+
+def split_signature(name):
+    """The non-king piece types of each side of a signature like "KRPKN"."""
+    if name[:1] != "K" or name.count("K") != 2:
+        raise ValueError(f"Invalid material signature {name!r}")
+    split = name.index("K", 1)
+    try:
+        return ([LETTERS.index(letter) for letter in name[1:split]],
+                [LETTERS.index(letter) for letter in name[split + 1:]])
+    except ValueError:
+        raise ValueError(f"Invalid material signature {name!r}") from None
+
+
+def _side_name(types):
+    return "K" + "".join(LETTERS[ptype] for ptype in sorted(types, reverse=True))
+
+
+def _side_strength(types):
+    return sum(_PIECE_VALUES[ptype] for ptype in types), sorted(types, reverse=True)
+
+
+def signature(white_types, black_types):
+    """(table name, whether colours must be swapped to look the position up)."""
+    if _side_strength(white_types) >= _side_strength(black_types):
+        return _side_name(white_types) + _side_name(black_types), False
+    return _side_name(black_types) + _side_name(white_types), True
+
+
+class Layout:
+    """Index arithmetic of one table, shared by the generator and the reader."""
+
+    def __init__(self, name):
+        white_types, black_types = split_signature(name)
+        self.name = name
+        self.codes = ([WHITE * 6 + KING, BLACK * 6 + KING]
+                      + [WHITE * 6 + ptype for ptype in sorted(white_types, reverse=True)]
+                      + [BLACK * 6 + ptype for ptype in sorted(black_types, reverse=True)])
+        self.count = len(self.codes)
+        self.pawns = PAWN in white_types or PAWN in black_types
+        self.kings = HALF_BOARD if self.pawns else TRIANGLE
+        self.king_slot = {sq: slot for slot, sq in enumerate(self.kings)}
+        self.block = 64 ** (self.count - 1)  # positions per white king square
+        self.size = len(self.kings) * self.block
+        # Symmetries that bring each white king square into self.kings
+        symmetries = SYMMETRIES[:2] if self.pawns else SYMMETRIES
+        self.symmetries = [[t for t in symmetries if t[sq] in self.king_slot] for sq in range(64)]
+        # Runs of identical pieces, whose squares are interchangeable
+        self.twins = [i for i in range(2, self.count - 1) if self.codes[i] == self.codes[i + 1]]
+
+    def index(self, sqs):
+        """Index of the position with the pieces on sqs (in self.codes order).
+
+        Every position maps to the same index as its mirror images, so each
+        is stored exactly once.
+        """
+        symmetries = self.symmetries[sqs[0]]
+        if len(symmetries) == 1 and not self.twins:
+            t = symmetries[0]  # the common case, off the diagonal
+            index = self.king_slot[t[sqs[0]]]
+            for sq in sqs[1:]:
+                index = (index << 6) | t[sq]
+            return index
+        best = None
+        for t in symmetries:
+            mapped = [t[sq] for sq in sqs]
+            for i in self.twins:
+                if mapped[i] > mapped[i + 1]:
+                    mapped[i], mapped[i + 1] = mapped[i + 1], mapped[i]
+            if best is None or mapped < best:
+                best = mapped
+        index = self.king_slot[best[0]]
+        for sq in best[1:]:
+            index = index * 64 + sq
+        return index
+
+    def squares(self, index):
+        sqs = [0] * self.count
+        for i in range(self.count - 1, 0, -1):
+            sqs[i] = index & 63
+            index >>= 6
+        sqs[0] = self.kings[index]
+        return sqs
+
+
+# --- Reading -----------------------------------------------------------------
+
+class _Table:
+    __slots__ = ("layout", "map", "size")
+
+    def __init__(self, name, path):
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.layout = Layout(name)
+        magic, self.size = HEADER.unpack_from(self.map, 0)
+        if (magic != MAGIC or self.size != self.layout.size
+                or len(self.map) != HEADER.size + 2 * self.size):
+            self.map.close()
+            raise ValueError(f"{path} is not a {name} table")
+
+
+_BARE_KINGS = object()  # stands in for the table of the always drawn KK
+
+
+def decode(value):
+    """(WIN/DRAW/LOSS, plies to mate) for a stored byte."""
+    if not value:
+        return DRAW, 0
+    return (WIN if (value - 1) & 1 else LOSS), value - 1
+
+
+class EndgameTables:
+    """All tables in a directory, each opened on first use.
+
+    Missing tables are simply not probed, so any subset can be installed.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._tables = {}  # name -> _Table, or None when there is no file
+        self._materials = {}  # sorted piece codes -> how to look them up
+
+    def _table(self, name):
+        try:
+            return self._tables[name]
+        except KeyError:
+            pass
+        path = os.path.join(self.directory, name + ".bin")
+        table = _Table(name, path) if os.path.exists(path) else None
+        self._tables[name] = table
+        return table
+
+    def close(self):
+        for table in self._tables.values():
+            if table is not None:
+                table.map.close()
+        self._tables = {}
+        self._materials = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _material(self, material):
+        # (table, colours swapped, table piece order as indices into material)
+        white_types = [code for code in material if code < 6 and code != KING]
+        black_types = [code - 6 for code in material if code >= 6 and code != 6 + KING]
+        if not white_types and not black_types:
+            return _BARE_KINGS, False, ()
+        name, swap = signature(white_types, black_types)
+        table = self._table(name)
+        if table is None:
+            return None, False, ()
+        codes = [code + 6 if code < 6 else code - 6 for code in material] if swap else list(material)
+        order = []
+        for code in table.layout.codes:
+            i = codes.index(code)
+            order.append(i)
+            codes[i] = -1
+        return table, swap, order
+
+    def probe_pieces(self, codes, sqs, side):
+        """(WIN/DRAW/LOSS, plies to mate) for the side to move, or None.
+
+        codes and sqs list every piece (both kings included) and its square.
+        """
+        pieces = sorted(zip(codes, sqs))
+        material = tuple(code for code, _ in pieces)
+        entry = self._materials.get(material)
+        if entry is None:
+            entry = self._materials[material] = self._material(material)
+        table, swap, order = entry
+        if table is None:
+            return None
+        if table is _BARE_KINGS:
+            return DRAW, 0
+        if swap:
+            ordered = [pieces[i][1] ^ 56 for i in order]
+            side ^= 1
+        else:
+            ordered = [pieces[i][1] for i in order]
+        return decode(table.map[HEADER.size + side * table.size + table.layout.index(ordered)])
+
+    def probe(self, position):
+        """Exact result for position, or None when no table covers it."""
+        occupied = position.all_occupied
+        if occupied.bit_count() > MAX_PIECES or position.castling or position.ep_square >= 0:
+            return None
+        mailbox = position.mailbox
+        sqs = list(squares(occupied))
+        return self.probe_pieces([mailbox[sq] for sq in sqs], sqs, position.side)
+
+
+# --- Move generation for a handful of pieces ----------------------------------
+# Pieces are parallel lists of codes and squares; the tables need only
+# plain moves, captures and promotions.
+
+def _attacks(code, sq, occupied):
+    ptype = code % 6
+    if ptype == KNIGHT:
+        return KNIGHT_ATTACKS[sq]
+    if ptype == KING:
+        return KING_ATTACKS[sq]
+    if ptype == PAWN:
+        return PAWN_ATTACKS[code // 6][sq]
+    if ptype == BISHOP:
+        return bishop_attacks(sq, occupied)
+    if ptype == ROOK:
+        return rook_attacks(sq, occupied)
+    return queen_attacks(sq, occupied)
+
+
+def _attacked(codes, sqs, target, by_color, occupied):
+    bit = 1 << target
+    for code, sq in zip(codes, sqs):
+        if code // 6 == by_color and _attacks(code, sq, occupied) & bit:
+            return True
+    return False
+
+
+def _moves(codes, sqs, side):
+    """Yield (codes, sqs) after each legal move of side.
+
+    Moves that stay in the table reuse the codes list, so captures and
+    promotions are the ones whose codes are a new list.
+    """
+    occupied = 0
+    own = 0
+    for code, sq in zip(codes, sqs):
+        occupied |= 1 << sq
+        if code // 6 == side:
+            own |= 1 << sq
+    king = side  # the white king is piece 0 and the black king piece 1
+    for i, (code, sq) in enumerate(zip(codes, sqs)):
+        if code // 6 != side:
+            continue
+        if code % 6 == PAWN:
+            step = -8 if side == WHITE else 8
+            targets = PAWN_ATTACKS[side][sq] & occupied & ~own
+            ahead = sq + step
+            if not occupied >> ahead & 1:
+                targets |= 1 << ahead
+                start_row = 6 if side == WHITE else 1
+                if sq >> 3 == start_row and not occupied >> (ahead + step) & 1:
+                    targets |= 1 << (ahead + step)
+        else:
+            targets = _attacks(code, sq, occupied) & ~own
+        for to in squares(targets):
+            new_sqs = sqs[:]
+            new_sqs[i] = to
+            new_codes = codes
+            if occupied >> to & 1:
+                victim = new_sqs.index(to)  # the first match is the captured piece
+                if victim == i:
+                    victim = new_sqs.index(to, i + 1)
+                new_codes = codes[:victim] + codes[victim + 1:]
+                del new_sqs[victim]
+            if _attacked(new_codes, new_sqs, new_sqs[king], side ^ 1,
+                         (occupied & ~(1 << sq)) | (1 << to)):
+                continue
+            if code % 6 == PAWN and to >> 3 in (0, 7):
+                moved = new_sqs.index(to)
+                for promotion in (QUEEN, ROOK, BISHOP, KNIGHT):
+                    promoted = list(new_codes)
+                    promoted[moved] = side * 6 + promotion
+                    yield promoted, new_sqs
+            else:
+                yield new_codes, new_sqs
+
+
+def _unmoves(codes, sqs, side):
+    """Yield the squares before each quiet move side could have just made."""
+    occupied = 0
+    for sq in sqs:
+        occupied |= 1 << sq
+    for i, (code, sq) in enumerate(zip(codes, sqs)):
+        if code // 6 != side:
+            continue
+        if code % 6 == PAWN:
+            origins = 0
+            back = 8 if side == WHITE else -8
+            origin = sq + back
+            start_row = 6 if side == WHITE else 1
+            # A pawn never stands on its first rank
+            if (origin >> 3) in range(1, 7) and not occupied >> origin & 1:
+                origins |= 1 << origin
+                if (origin + back) >> 3 == start_row and not occupied >> (origin + back) & 1:
+                    origins |= 1 << (origin + back)
+        else:
+            origins = _attacks(code, sq, occupied) & ~occupied
+        for origin in squares(origins):
+            previous = sqs[:]
+            previous[i] = origin
+            yield previous
+
+
+# --- Generation ----------------------------------------------------------------
+
+def table_names(max_pieces=MAX_PIECES):
+    """Every signature with 3..max_pieces pieces, easiest first."""
+    names = set()
+    types = range(PAWN, KING)
+    for extra in range(1, max_pieces - 1):
+        sides = [[]]
+        for _ in range(extra):
+            sides = [side + [ptype] for side in sides for ptype in types if not side or ptype <= side[-1]]
+        for pieces in sides:
+            for split in range(len(pieces) + 1):
+                names.add(signature(pieces[:split], pieces[split:])[0])
+    return sorted(names, key=_generation_order)
+
+
+def _generation_order(name):
+    # Captures lead to fewer pieces and promotions to fewer pawns, so this
+    # order has every table after the ones it depends on
+    return len(name), name.count("P"), name
+
+
+def dependencies(name):
+    """Tables reached from name by one capture or promotion."""
+    white_types, black_types = split_signature(name)
+    found = set()
+    for own, other, flip in ((white_types, black_types, False), (black_types, white_types, True)):
+        for i, ptype in enumerate(own):
+            rest = own[:i] + own[i + 1:]
+            replacements = [rest] + ([rest + [promotion] for promotion in (KNIGHT, BISHOP, ROOK, QUEEN)]
+                                     if ptype == PAWN else [])
+            for new in replacements:
+                if new or other:
+                    found.add(signature(other, new)[0] if flip else signature(new, other)[0])
+    found.discard(name)
+    return sorted(found, key=_generation_order)
+
+
+_worker_state = {}
+
+
+def _worker_tables(name, directory):
+    # Per process: the layout of the table being built and a reader for the
+    # finished ones it depends on
+    if _worker_state.get("name") != (name, directory):
+        if "tables" in _worker_state:
+            _worker_state["tables"].close()
+        _worker_state["name"] = (name, directory)
+        _worker_state["layout"] = Layout(name)
+        _worker_state["tables"] = EndgameTables(directory)
+    return _worker_state["layout"], _worker_state["tables"]
+
+
+def _valid(layout, index):
+    sqs = layout.squares(index)
+    if len(set(sqs)) != layout.count or KING_ATTACKS[sqs[0]] >> sqs[1] & 1:
+        return None
+    for code, sq in zip(layout.codes, sqs):
+        if code % 6 == PAWN and sq >> 3 in (0, 7):
+            return None
+    if layout.index(sqs) != index:
+        return None  # a mirror image stored under another index
+    return sqs
+
+
+def _solve_chunk(task):
+    """First pass over one block of positions.
+
+    For each side to move this works out which positions are legal, how many
+    distinct positions in the table they lead to, which are mate, and what
+    the moves leaving the table (captures, promotions) lead to.
+    """
+    name, directory, start, stop = task
+    layout, tables = _worker_tables(name, directory)
+    size = layout.size
+    codes = layout.codes
+    state = bytearray(2 * (stop - start))  # 1 for a legal position
+    counts = bytearray(2 * (stop - start))
+    mates = []
+    wins = {}  # level -> positions winning by a move out of the table
+    decrements = {}  # level -> positions with a move out of the table that loses
+    for index in range(start, stop):
+        sqs = _valid(layout, index)
+        if sqs is None:
+            continue
+        occupied = 0
+        for sq in sqs:
+            occupied |= 1 << sq
+        for side in (WHITE, BLACK):
+            # The side not to move must not be in check
+            if _attacked(codes, sqs, sqs[side ^ 1], side, occupied):
+                continue
+            slot = side * (stop - start) + index - start
+            position = side * size + index
+            state[slot] = 1
+            children = set()
+            leaving = 0
+            best_win = None
+            any_move = False
+            for new_codes, new_sqs in _moves(codes, sqs, side):
+                any_move = True
+                if new_codes is codes:
+                    children.add(layout.index(new_sqs))
+                    continue
+                leaving += 1
+                entry = tables.probe_pieces(new_codes, new_sqs, side ^ 1)
+                if entry is None:
+                    raise RuntimeError(f"{name} needs the tables {', '.join(dependencies(name))}")
+                result, plies = entry
+                if result == LOSS:
+                    if best_win is None or plies + 1 < best_win:
+                        best_win = plies + 1
+                elif result == WIN:
+                    decrements.setdefault(plies, []).append(position)
+            if not any_move:
+                if _attacked(codes, sqs, sqs[side], side ^ 1, occupied):
+                    mates.append(position)
+                continue  # stalemate stays a draw
+            if best_win is not None:
+                wins.setdefault(best_win, []).append(position)
+            counts[slot] = len(children) + leaving
+    return start, stop, bytes(state), bytes(counts), mates, wins, decrements
+
+
+def _predecessors(task):
+    """Distinct positions one quiet move before each of the given ones."""
+    name, directory, positions = task
+    layout, _ = _worker_tables(name, directory)
+    size = layout.size
+    codes = layout.codes
+    found = []
+    for position in positions:
+        side, index = divmod(position, size)
+        mover = side ^ 1
+        base = mover * size
+        seen = set()
+        for previous in _unmoves(codes, layout.squares(index), mover):
+            seen.add(base + layout.index(previous))
+        found.extend(seen)
+    return found
+
+
+def _map(pool, func, tasks):
+    return map(func, tasks) if pool is None else pool.imap(func, tasks)
+
+
+def generate(name, directory, workers=None, chunk=4096):
+    """Solve the table name and write it to directory.
+
+    Every table it leads to by a capture or promotion (see dependencies)
+    must already be in directory. The first pass and the predecessor
+    expansion of each ply run on a pool of workers processes (None for one
+    per CPU, 1 to stay in this process). Returns counts of won, drawn and
+    lost positions and the longest mate in plies.
+    """
+    layout = Layout(name)
+    size = layout.size
+    state = bytearray(2 * size)  # 0 impossible, 1 unsolved, 2 solved
+    counts = bytearray(2 * size)
+    values = bytearray(2 * size)
+    wins = {}
+    decrements = {}
+    frontier = []
+    from multiprocessing import Pool  # only the generator needs it; probing stays light to import
+    pool = None if workers == 1 else Pool(workers)
+    try:
+        tasks = [(name, directory, start, min(start + layout.block, size))
+                 for start in range(0, size, layout.block)]
+        for start, stop, part_state, part_counts, mates, part_wins, part_decrements in _map(
+                pool, _solve_chunk, tasks):
+            length = stop - start
+            for side in (WHITE, BLACK):
+                state[side * size + start:side * size + stop] = part_state[side * length:(side + 1) * length]
+                counts[side * size + start:side * size + stop] = part_counts[side * length:(side + 1) * length]
+            frontier.extend(mates)
+            for level, positions in part_wins.items():
+                wins.setdefault(level, []).extend(positions)
+            for level, positions in part_decrements.items():
+                decrements.setdefault(level, []).extend(positions)
+
+        for position in frontier:
+            state[position] = 2
+            values[position] = 1
+
+        # Solve outwards from the mates one ply at a time: positions decided
+        # at an even level are losses, so whatever moves into them wins one
+        # ply later; a position all of whose moves lead to wins for the
+        # opponent is lost one ply after the last of them is decided.
+        level = 0
+        while frontier or wins or decrements:
+            if level + 2 > 255:
+                raise OverflowError(f"{name}: mate distances do not fit in a byte")
+            for position in wins.pop(level, ()):
+                if state[position] == 1:
+                    state[position] = 2
+                    values[position] = level + 1
+                    frontier.append(position)
+            following = []
+            for position in decrements.pop(level, ()):
+                counts[position] -= 1
+                if not counts[position] and state[position] == 1:
+                    state[position] = 2
+                    values[position] = level + 2
+                    following.append(position)
+            batches = [(name, directory, frontier[i:i + chunk]) for i in range(0, len(frontier), chunk)]
+            for found in _map(pool, _predecessors, batches):
+                for position in found:
+                    if state[position] != 1:
+                        continue
+                    if level & 1:
+                        counts[position] -= 1
+                        if counts[position]:
+                            continue
+                    state[position] = 2
+                    values[position] = level + 2
+                    following.append(position)
+            frontier = following
+            level += 1
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, name + ".bin")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, size))
+        f.write(values)
+    os.replace(tmp_path, path)
+
+    won = sum(1 for value in values if value and (value - 1) & 1)
+    lost = sum(1 for value in values if value and not (value - 1) & 1)
+    return {"positions": state.count(1) + state.count(2), "won": won, "lost": lost,
+            "drawn": state.count(1) + state.count(2) - won - lost,
+            "longest": max(values) - 1 if any(values) else 0}
@@ -0,0 +1,182 @@
+# engine/book.py
+
+# Binary opening book. The file is a 16-byte header followed by fixed-size
+# records sorted by position key:
+#   header  b"CHESSBK1" | record count (u64)
+#   record  Zobrist key (u64) | move (u32) | games played (u32) | weight (u32)
+# all little-endian. Records for one key are ordered by weight, best first.
+#
+# The book is opened with mmap and searched in place with a binary search,
+# so there is nothing to parse at load time and a probe touches a handful of
+# pages; processes that open the same file share it through the page cache.
+# Keys are board.zobrist keys, which are fixed across runs.
+
+import mmap
+import os
+import random
+import struct
+
+from board.movegen import generate_legal_moves
+from board.pgn import read_games
+from board.position import Position
+from board.san import parse_san
+
+MAGIC = b"CHESSBK1"
+HEADER = struct.Struct("<8sQ")
+RECORD = struct.Struct("<QIII")
+_KEY = struct.Struct("<Q")
+
+# Weight per game from the point of view of the side that played the move
+WIN_WEIGHT, DRAW_WEIGHT, LOSS_WEIGHT = 2, 1, 0
+
+
+class BookEntry:
+    __slots__ = ("move", "count", "weight")
+
+    def __init__(self, move, count, weight):
+        self.move = move
+        self.count = count
+        self.weight = weight
+
+    def __repr__(self):
+        return f"BookEntry(move={self.move}, count={self.count}, weight={self.weight})"
+
+
+class OpeningBook:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.size = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or len(self._map) != HEADER.size + self.size * RECORD.size:
+            self._map.close()
+            raise ValueError(f"{path} is not an opening book")
+
+    def __len__(self):
+        return self.size
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _first_index(self, key):
+        # Lower bound of key over the sorted records
+        data = self._map
+        lo, hi = 0, self.size
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if _KEY.unpack_from(data, HEADER.size + mid * RECORD.size)[0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def probe(self, key):
+        """Book entries stored for a position key, best first."""
+        data = self._map
+        entries = []
+        index = self._first_index(key)
+        while index < self.size:
+            record_key, move, count, weight = RECORD.unpack_from(data, HEADER.size + index * RECORD.size)
+            if record_key != key:
+                break
+            entries.append(BookEntry(move, count, weight))
+            index += 1
+        return entries
+
+    def choose(self, position, rng=random):
+        """A book move for position picked in proportion to its weight, or None.
+
+        Moves are checked against the legal moves so a key collision can
+        never produce an illegal move. When every legal entry has weight 0
+        (the book only saw them lose) None is returned and the search decides.
+        """
+        entries = self.probe(position.key)
+        if not entries:
+            return None
+        legal = set(generate_legal_moves(position))
+        entries = [entry for entry in entries if entry.move in legal]
+        if not entries:
+            return None
+        total = sum(entry.weight for entry in entries)
+        if not total:
+            return None
+        pick = rng.randrange(total)
+        for entry in entries:
+            pick -= entry.weight
+            if pick < 0:
+                return entry.move
+        return entries[0].move
+
+
+def _result_weights(result):
+    # (weight for a White move, weight for a Black move)
+    if result == "1-0":
+        return WIN_WEIGHT, LOSS_WEIGHT
+    if result == "0-1":
+        return LOSS_WEIGHT, WIN_WEIGHT
+    return DRAW_WEIGHT, DRAW_WEIGHT
+
+
+def collect(pgn_paths, max_ply=24, stats=None):
+    """Aggregate {(key, move): [games, weight]} over every game in the PGN files.
+
+    Games are streamed one at a time, but the table of every distinct
+    (position, move) seen stays in memory; a game stops contributing at its
+    first unreadable move. stats, if given, receives the number of "games"
+    read and of "errors" (games with an unreadable FEN or move).
+    """
+    table = {}
+    games = errors = 0
+    for path in pgn_paths:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for game in read_games(f):
+                try:
+                    position = Position.from_fen(game.fen)
+                except ValueError:
+                    errors += 1
+                    continue
+                games += 1
+                weights = _result_weights(game.result)
+                for san in game.moves[:max_ply]:
+                    try:
+                        move = parse_san(position, san)
+                    except ValueError:
+                        errors += 1
+                        break
+                    slot = table.get((position.key, move))
+                    if slot is None:
+                        slot = table[(position.key, move)] = [0, 0]
+                    slot[0] += 1
+                    slot[1] += weights[position.side]
+                    position.make_move(move)
+    if stats is not None:
+        stats["games"] = games
+        stats["errors"] = errors
+    return table
+
+
+def write_book(table, path, min_count=1):
+    """Write aggregated entries (see collect) as a sorted book file.
+
+    The file is replaced by a rename, which Windows refuses while another
+    process (a running game) has the old book mapped.
+    """
+    records = [(key, move, count, weight) for (key, move), (count, weight) in table.items()
+               if count >= min_count]
+    records.sort(key=lambda r: (r[0], -r[3], -r[2], r[1]))
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(records)))
+        for record in records:
+            f.write(RECORD.pack(*record))
+    os.replace(tmp_path, path)  # readers never see a half-written book
+    return len(records)
+
+
+def build_book(pgn_paths, path, max_ply=24, min_count=1, stats=None):
+    return write_book(collect(pgn_paths, max_ply, stats), path, min_count)
@@ -0,0 +1,21 @@
+# engine/evaluate.py
+
+# Static evaluation in centipawns, always from the point of view of the side
+# to move (what negamax expects). Material and piece-square terms come from
+# the sums Position updates incrementally (board/psqt.py), blended between
+# the midgame and endgame tables by the remaining material.
+
+from board.bitboard import WHITE
+from board.psqt import PHASE_TOTAL, MATERIAL_MG
+
+# Indexed by piece type, for move ordering; the king is never traded. The
+# midgame material of the evaluation, so there is one set of piece values.
+PIECE_VALUES = MATERIAL_MG
+
+
+def evaluate(position):
+    phase = position.phase
+    if phase > PHASE_TOTAL:
+        phase = PHASE_TOTAL  # extra queens from promotions
+    score = (position.psqt_mg * phase + position.psqt_eg * (PHASE_TOTAL - phase)) // PHASE_TOTAL
+    return score if position.side == WHITE else -score
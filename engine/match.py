@@ -0,0 +1,324 @@
+# engine/match.py
+
+# Headless engine-vs-engine matches, to measure whether a change to the bot
+# is an improvement. Every game is an independent job for a process pool:
+# a worker builds its two engines once and then plays whatever games it is
+# handed, so with no shared state between games the number of games per hour
+# grows with the number of cores.
+#
+# Each opening is played twice with colours reversed, which cancels out
+# most of the bias of an unbalanced opening. Games are adjudicated by the
+# rule engine (checkmate, stalemate, insufficient material, and the endgame
+# tables when installed) plus the fifty-move rule, threefold repetition and
+# a move limit, all scored as draws.
+
+import importlib
+import math
+from multiprocessing import Pool
+
+from board.board import Board
+from board.bitboard import WHITE, BLACK
+from board.san import parse_san, move_to_san
+from board.position import START_FEN, Position
+from engine.bitbase import EndgameTables, WIN, LOSS
+from engine.search import MAX_PLY
+from engine.timeman import TimeManager
+
+# A small spread of main lines, used when no opening file is given
+OPENINGS = (
+    "e4 e5 Nf3 Nc6 Bb5 a6",
+    "e4 e5 Nf3 Nc6 Bc4 Bc5",
+    "e4 c5 Nf3 d6 d4 cxd4 Nxd4 Nf6",
+    "e4 c5 Nc3 Nc6 g3 g6",
+    "e4 e6 d4 d5 Nc3 Nf6",
+    "e4 c6 d4 d5 e5 Bf5",
+    "e4 d5 exd5 Qxd5 Nc3 Qa5",
+    "d4 d5 c4 e6 Nc3 Nf6",
+    "d4 d5 c4 c6 Nf3 Nf6",
+    "d4 Nf6 c4 g6 Nc3 Bg7",
+    "d4 Nf6 c4 e6 Nc3 Bb4",
+    "d4 f5 g3 Nf6 Bg2 g6",
+    "c4 e5 Nc3 Nf6 g3 d5",
+    "Nf3 d5 g3 Nf6 Bg2 c6",
+)
+
+
+class EngineConfig:
+    """One side of a match: how to build the engine and how long it may think.
+
+    factory is "module:callable" and must accept tt_size_mb and tablebases
+    keywords and return an object with Searcher.search's signature, so an
+    older copy of engine/search.py saved under another name can play the
+    current one. Moves are limited by depth, a fixed movetime, a game clock
+    of base seconds plus increment per move, or a combination.
+    """
+
+    __slots__ = ("name", "factory", "depth", "movetime", "base", "increment", "hash_mb")
+
+    def __init__(self, name, factory="engine.search:Searcher", depth=None, movetime=None,
+                 base=None, increment=0.0, hash_mb=16):
+        if depth is None and movetime is None and base is None:
+            raise ValueError(f"engine {name!r} needs a depth, a movetime or a clock")
+        self.name = name
+        self.factory = factory
+        self.depth = depth
+        self.movetime = movetime
+        self.base = base
+        self.increment = increment
+        self.hash_mb = hash_mb
+
+    def create(self, tablebases=None):
+        module_name, _, attribute = self.factory.partition(":")
+        factory = getattr(importlib.import_module(module_name), attribute or "Searcher")
+        return factory(tt_size_mb=self.hash_mb, tablebases=tablebases)
+
+    def clock(self):
+        # A fresh TimeManager for one game, or None for depth-only play
+        if self.movetime is None and self.base is None:
+            return None
+        return TimeManager(movetime=self.movetime, remaining=self.base, increment=self.increment)
+
+    def __repr__(self):
+        return f"EngineConfig({self.name!r}, {self.factory!r})"
+
+
+class GameResult:
+    __slots__ = ("index", "opening", "white", "black", "result", "reason", "fen", "moves", "seconds", "nodes")
+
+    def __init__(self, index, opening, white, black, result, reason, fen, moves, seconds, nodes):
+        self.index = index
+        self.opening = opening  # index into the opening list
+        self.white = white      # engine names
+        self.black = black
+        self.result = result    # "1-0", "0-1" or "1/2-1/2"
+        self.reason = reason
+        self.fen = fen          # where the engines took over
+        self.moves = moves      # SAN of the moves the engines played
+        self.seconds = seconds
+        self.nodes = nodes
+
+    def score(self, name):
+        # 1, 0.5 or 0 for the named engine
+        if self.result == "1/2-1/2":
+            return 0.5
+        return float((self.result == "1-0") == (self.white == name))
+
+    def __repr__(self):
+        return f"GameResult({self.white} - {self.black} {self.result}, {self.reason}, {len(self.moves)} plies)"
+
+
+def opening_positions(lines):
+    """FENs reached by playing each line of SAN moves from the start position."""
+    fens = []
+    for line in lines:
+        position = Position.from_fen(START_FEN)
+        for san in line.split():
+            position.make_move(parse_san(position, san))
+        fens.append(position.to_fen())
+    return fens
+
+
+def repetitions(position):
+    # How often the current position occurred before, since the last capture or pawn move
+    history = position.history
+    key = position.key
+    last = max(len(history) - position.halfmove_clock, 0)
+    return sum(1 for i in range(len(history) - 2, last - 1, -2) if history[i][5] == key)
+
+
+def _winner(side):
+    return "1-0" if side == WHITE else "0-1"
+
+
+def adjudicate(board, max_plies):
+    """(result, reason) if the game on board is over, else None."""
+    status = board.status
+    position = board.position
+    if status.checkmate:
+        return _winner(status.side ^ 1), "checkmate"
+    if status.stalemate:
+        return "1/2-1/2", "stalemate"
+    if status.insufficient_material:
+        return "1/2-1/2", "insufficient material"
+    if status.endgame is not None:
+        outcome = status.endgame[0]
+        if outcome == WIN:
+            return _winner(status.side), "endgame tables"
+        if outcome == LOSS:
+            return _winner(status.side ^ 1), "endgame tables"
+        return "1/2-1/2", "endgame tables"
+    if position.halfmove_clock >= 100:
+        return "1/2-1/2", "fifty-move rule"
+    if repetitions(position) >= 2:
+        return "1/2-1/2", "threefold repetition"
+    if len(position.history) >= max_plies:
+        return "1/2-1/2", "move limit"
+    return None
+
+
+def play_game(fen, white, black, engines, tablebases=None, max_plies=400, index=0, opening=0):
+    """Play one game from fen; engines maps each EngineConfig to a built engine."""
+    board = Board.from_fen(fen, tablebases)
+    configs = {WHITE: white, BLACK: black}
+    clocks = {WHITE: white.clock(), BLACK: black.clock()}
+    moves = []
+    seconds = 0.0
+    nodes = 0
+    while True:
+        verdict = adjudicate(board, max_plies)
+        if verdict is not None:
+            break
+        side = board.status.side
+        config = configs[side]
+        clock = clocks[side]
+        result = engines[config].search(board.position, None if clock is None else clock.budget(),
+                                        config.depth or MAX_PLY)
+        seconds += result.seconds
+        nodes += result.nodes
+        if clock is not None and clock.remaining is not None:
+            if result.seconds > clock.remaining:
+                verdict = _winner(side ^ 1), "time forfeit"
+                break
+            clock.spend(result.seconds)
+        moves.append(move_to_san(board.position, result.move, board.status.legal_moves))
+        board.make_move(result.move)
+    return GameResult(index, opening, white.name, black.name, verdict[0], verdict[1],
+                      fen, moves, seconds, nodes)
+
+
+_worker_state = {}
+
+
+def _worker_init(configs, tablebase_path):
+    tablebases = EndgameTables(tablebase_path) if tablebase_path else None
+    _worker_state["tablebases"] = tablebases
+    _worker_state["engines"] = {config: config.create(tablebases) for config in configs}
+
+
+def _play(task):
+    index, opening, fen, white, black, max_plies = task
+    engines = _worker_state["engines"]
+    # Games must not learn from each other through the hash table
+    for engine in engines.values():
+        tt = getattr(engine, "tt", None)
+        if tt is not None:
+            tt.clear()
+    # The configs arrive as pickled copies; map them back to this worker's engines
+    by_name = {config.name: config for config in engines}
+    return play_game(fen, by_name[white], by_name[black], engines, _worker_state["tablebases"],
+                     max_plies, index, opening)
+
+
+def run_match(first, second, openings, games, workers=None, tablebase_path=None, max_plies=400):
+    """Play games between two EngineConfigs and yield each GameResult as it finishes.
+
+    Game i uses opening i // 2 (cycling through openings) with first as
+    White when i is even, so every opening is played from both sides.
+    Results arrive in the order the games end, not by index. Closing the
+    generator early stops the pool.
+    """
+    if first.name == second.name:
+        raise ValueError("the two engines need different names")
+    tasks = []
+    for index in range(games):
+        opening = (index // 2) % len(openings)
+        white, black = (first, second) if index % 2 == 0 else (second, first)
+        tasks.append((index, opening, openings[opening], white.name, black.name, max_plies))
+    pool = Pool(workers, initializer=_worker_init, initargs=((first, second), tablebase_path))
+    try:
+        yield from pool.imap_unordered(_play, tasks)
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def elo_from_score(score):
+    """Elo difference that an expected score (0 < score < 1) corresponds to."""
+    return -400 * math.log10(1 / score - 1)
+
+
+def score_from_elo(elo):
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+class MatchStats:
+    """Running win/draw/loss count for one engine, with Elo and SPRT figures.
+
+    The SPRT tests H0 "the engine is elo0 stronger" against H1 "it is elo1
+    stronger" with the normal approximation to the game score used by most
+    engine testing frameworks. Once llr() leaves sprt_bounds() the test is
+    decided: above the upper bound accept H1, below the lower accept H0.
+    """
+
+    def __init__(self, name, elo0=0.0, elo1=5.0, alpha=0.05, beta=0.05):
+        self.name = name
+        self.wins = self.draws = self.losses = 0
+        self.elo0 = elo0
+        self.elo1 = elo1
+        self.alpha = alpha
+        self.beta = beta
+
+    def add(self, game):
+        score = game.score(self.name)
+        if score == 1:
+            self.wins += 1
+        elif score == 0:
+            self.losses += 1
+        else:
+            self.draws += 1
+
+    @property
+    def games(self):
+        return self.wins + self.draws + self.losses
+
+    def score(self):
+        return (self.wins + 0.5 * self.draws) / self.games if self.games else 0.5
+
+    def _variance(self):
+        # Per-game variance of the score
+        n = self.games
+        s = self.score()
+        return (self.wins * (1 - s) ** 2 + self.draws * (0.5 - s) ** 2 + self.losses * s ** 2) / n
+
+    def elo(self):
+        """(Elo difference, 95% error margin); infinite while one side has every point."""
+        if not self.games:
+            return 0.0, math.inf
+        s = self.score()
+        if s <= 0 or s >= 1:
+            return math.copysign(math.inf, s - 0.5), math.inf
+        margin = 1.959964 * math.sqrt(self._variance() / self.games)
+        low = elo_from_score(max(s - margin, 1e-9))
+        high = elo_from_score(min(s + margin, 1 - 1e-9))
+        return elo_from_score(s), (high - low) / 2
+
+    def los(self):
+        """Likelihood of superiority: the chance this engine is the stronger one."""
+        decisive = self.wins + self.losses
+        if not decisive:
+            return 0.5
+        return 0.5 * (1 + math.erf((self.wins - self.losses) / math.sqrt(2 * decisive)))
+
+    def sprt_bounds(self):
+        return math.log(self.beta / (1 - self.alpha)), math.log((1 - self.beta) / self.alpha)
+
+    def llr(self):
+        """Log-likelihood ratio of H1 over H0 for the games so far."""
+        if not self.games:
+            return 0.0
+        variance = self._variance()
+        if variance == 0:
+            return 0.0  # every game ended the same way; no evidence yet
+        s0 = score_from_elo(self.elo0)
+        s1 = score_from_elo(self.elo1)
+        return self.games * (s1 - s0) * (2 * self.score() - s0 - s1) / (2 * variance)
+
+    def sprt(self):
+        # "H1" or "H0" once the test is decided, else None
+        lower, upper = self.sprt_bounds()
+        llr = self.llr()
+        if llr >= upper:
+            return "H1"
+        if llr <= lower:
+            return "H0"
+        return None
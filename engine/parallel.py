@@ -0,0 +1,140 @@
+# engine/parallel.py
+
+# Lazy SMP: several worker processes search the same position at once and
+# share one transposition table in shared memory. They do not coordinate
+# beyond that; what one worker stores, the others pick up on their next
+# probe, so the tree gets explored faster than by a single process. Workers
+# start their iterative deepening at staggered depths so they are not all
+# working on the same iteration in lockstep.
+
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+
+from engine.search import Searcher, SearchResult, MAX_PLY
+from engine.transposition import entries_for_size, ENTRY_BYTES, TranspositionTable
+from engine.bitbase import EndgameTables
+
+
+def _worker(index, conn, shm_name, stop_event, tablebase_path):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    tt = TranspositionTable(buffer=shm.buf)
+    # Every worker maps the same table files, so they share one copy in the page cache
+    tablebases = EndgameTables(tablebase_path) if tablebase_path else None
+    searcher = Searcher(tt, tablebases=tablebases)
+    searcher.stop_event = stop_event
+    try:
+        while True:
+            job = conn.recv()
+            if job is None:
+                break
+            position, time_limit, max_depth, report = job
+            # Every other helper skips ahead one ply
+            start_depth = 1 + (index & 1) if index else 1
+            on_iteration = None
+            if report:
+                def on_iteration(r):
+                    conn.send(("info", r.move, r.score, r.depth, r.nodes, r.seconds, r.pv))
+            result = searcher.search(position, time_limit, max_depth, on_iteration, start_depth)
+            conn.send(("done", index, result.move, result.score, result.depth, result.nodes, result.pv))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        if tablebases is not None:
+            tablebases.close()
+        tt.close()
+        shm.close()
+
+
+class ParallelSearcher:
+    """Searcher look-alike that spreads one search over several processes.
+
+    The worker processes and the shared table live until close(); search()
+    can be called any number of times in between. tablebase_path is a
+    directory of endgame tables for the workers to probe.
+    """
+
+    def __init__(self, workers=None, tt_size_mb=16, tablebase_path=None):
+        self.workers = workers or multiprocessing.cpu_count()
+        size = entries_for_size(tt_size_mb) * ENTRY_BYTES
+        self.shm = shared_memory.SharedMemory(create=True, size=size)
+        self.stop_event = multiprocessing.Event()
+        self.connections = []
+        self.processes = []
+        for index in range(self.workers):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_worker, args=(index, child_conn, self.shm.name, self.stop_event, tablebase_path),
+                daemon=True)
+            process.start()
+            child_conn.close()
+            self.connections.append(parent_conn)
+            self.processes.append(process)
+
+    def search(self, position, time_limit=None, max_depth=MAX_PLY, on_iteration=None):
+        """Best move for position's side to move.
+
+        Worker 0 runs the clock like a single searcher would and reports its
+        completed iterations to on_iteration. The search ends when it
+        finishes, when any worker completes max_depth or when stop() is
+        called; the rest are stopped and the deepest completed result wins,
+        preferring the lower worker index on a tie.
+        """
+        start = time.perf_counter()
+        for index, conn in enumerate(self.connections):
+            conn.send((position, time_limit, max_depth, index == 0 and on_iteration is not None))
+
+        results = []
+        pending = list(self.connections)
+        try:
+            while pending:
+                for conn in wait(pending):
+                    message = conn.recv()
+                    if message[0] == "info":
+                        on_iteration(SearchResult(*message[1:]))
+                        continue
+                    results.append(message[1:])
+                    pending.remove(conn)
+                    if message[1] == 0 or message[4] >= max_depth:
+                        self.stop_event.set()
+        finally:
+            # Cleared only once every worker is idle again, so a stop() that
+            # arrives while the jobs are being sent is never lost
+            self.stop_event.clear()
+
+        index, move, score, depth, _, pv = max(results, key=lambda r: (r[3], -r[0]))
+        nodes = sum(r[4] for r in results)
+        return SearchResult(move, score, depth, nodes, time.perf_counter() - start, pv)
+
+    def stop(self):
+        # Safe to call from another thread; search() returns shortly afterwards.
+        # When no search is running the flag stays set until the next one ends
+        self.stop_event.set()
+
+    def clear(self):
+        # Forget everything the workers stored, e.g. between unrelated positions
+        tt = TranspositionTable(buffer=self.shm.buf)
+        tt.clear()
+        tt.close()
+
+    def close(self):
+        for conn in self.connections:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
+        self.connections = []
+        self.processes = []
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,307 @@
+# engine/search.py
+
+# Negamax alpha-beta with iterative deepening, a quiescence search over
+# captures, a transposition table and move ordering (TT move, MVV-LVA
+# captures, killer moves, history counters). Positions with few enough
+# pieces are scored from the endgame tables when they are installed.
+
+import time
+
+from board.bitboard import EMPTY, PAWN, popcount
+from board.movegen import generate_legal_moves, in_check
+from board.move import NO_MOVE, EN_PASSANT
+from engine.evaluate import evaluate, PIECE_VALUES
+from engine.transposition import TranspositionTable, EXACT, LOWER, UPPER
+from engine.bitbase import MAX_PIECES, WIN, LOSS
+
+MATE = 30000
+INFINITY = 32000
+MAX_PLY = 64
+MATE_BOUND = MATE - 512  # scores beyond this are mates, found in the tree or in the tables
+
+# Ordering bands, highest first
+_TT_MOVE = 1 << 30
+_CAPTURE = 1 << 20
+_KILLER = 1 << 19
+_CHECK_EVERY = 1023  # nodes between clock checks
+
+
+class SearchTimeout(Exception):
+    """Raised inside the tree when the time budget runs out."""
+
+
+class SearchResult:
+    __slots__ = ("move", "score", "depth", "nodes", "seconds", "pv")
+
+    def __init__(self, move, score, depth, nodes, seconds, pv):
+        self.move = move
+        self.score = score
+        self.depth = depth
+        self.nodes = nodes
+        self.seconds = seconds
+        self.pv = pv
+
+    def __repr__(self):
+        return (f"SearchResult(move={self.move}, score={self.score}, depth={self.depth}, "
+                f"nodes={self.nodes}, seconds={self.seconds:.3f})")
+
+
+def _score_to_tt(score, ply):
+    # Mate scores are stored relative to the node, not the root
+    if score > MATE_BOUND:
+        return score + ply
+    if score < -MATE_BOUND:
+        return score - ply
+    return score
+
+
+def _score_from_tt(score, ply):
+    if score > MATE_BOUND:
+        return score - ply
+    if score < -MATE_BOUND:
+        return score + ply
+    return score
+
+
+def is_capture(position, move):
+    return position.mailbox[(move >> 6) & 63] != EMPTY or move >> 15 == EN_PASSANT
+
+
+class Searcher:
+    def __init__(self, tt=None, tt_size_mb=16, tablebases=None):
+        self.tt = tt if tt is not None else TranspositionTable(tt_size_mb)
+        self.tablebases = tablebases  # engine.bitbase.EndgameTables, or None
+        self.killers = [[NO_MOVE, NO_MOVE] for _ in range(MAX_PLY + 1)]
+        self.history = [0] * (64 * 64)
+        self.nodes = 0
+        self.deadline = None
+        self.stop_event = None  # anything with is_set(); lets another process end the search
+        self.root_best = NO_MOVE
+
+    def search(self, position, time_limit=None, max_depth=MAX_PLY, on_iteration=None, start_depth=1):
+        """Best move for the side to move, searched on a copy of position.
+
+        Deepens one ply at a time from start_depth until max_depth or until
+        time_limit seconds are used up; the result of the last completed
+        iteration is returned. on_iteration, if given, is called with a
+        SearchResult after each one.
+        """
+        position = position.copy()
+        start = time.perf_counter()
+        self.deadline = None if time_limit is None else start + time_limit
+        self.nodes = 0
+        self.killers = [[NO_MOVE, NO_MOVE] for _ in range(MAX_PLY + 1)]
+        self.history = [0] * (64 * 64)
+        self.tt.new_search()
+
+        root_moves = generate_legal_moves(position)
+        result = SearchResult(root_moves[0] if root_moves else NO_MOVE, 0, 0, 0, 0.0, [])
+        if len(root_moves) <= 1:
+            return result  # nothing to think about
+
+        root_height = len(position.history)
+        for depth in range(min(start_depth, max_depth), max_depth + 1):
+            self.root_best = NO_MOVE
+            try:
+                score = self.negamax(position, depth, -INFINITY, INFINITY, 0)
+            except SearchTimeout:
+                while len(position.history) > root_height:
+                    position.unmake_move()
+                # The previous best is searched first, so any root move the unfinished
+                # iteration settled on is at least as good
+                if self.root_best:
+                    result.move = self.root_best
+                break
+            elapsed = time.perf_counter() - start
+            result = SearchResult(self.root_best, score, depth, self.nodes, elapsed,
+                                  self.principal_variation(position, depth))
+            if on_iteration is not None:
+                on_iteration(result)
+            if abs(score) > MATE_BOUND:
+                break  # a forced mate will not get any better
+            # Another iteration takes several times as long as this one; do not start
+            # one that has no chance to finish
+            if self.deadline is not None and elapsed > time_limit * 0.5:
+                break
+        result.nodes = self.nodes
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def principal_variation(self, position, depth):
+        pv = []
+        seen = set()
+        for _ in range(depth):
+            entry = self.tt.probe(position.key)
+            if entry is None or not entry[0] or position.key in seen:
+                break
+            move = entry[0]
+            if move not in generate_legal_moves(position):
+                break
+            seen.add(position.key)
+            pv.append(move)
+            position.make_move(move)
+        for _ in pv:
+            position.unmake_move()
+        return pv
+
+    def is_repetition(self, position):
+        # Any earlier occurrence since the last capture or pawn move counts as a draw
+        history = position.history
+        key = position.key
+        last = len(history) - position.halfmove_clock
+        for i in range(len(history) - 2, max(last, 0) - 1, -2):
+            if history[i][5] == key:
+                return True
+        return False
+
+    def order_moves(self, position, moves, tt_move, ply):
+        mailbox = position.mailbox
+        killers = self.killers[ply]
+        history = self.history
+        scored = []
+        for move in moves:
+            if move == tt_move:
+                score = _TT_MOVE
+            else:
+                victim = mailbox[(move >> 6) & 63]
+                if victim != EMPTY:
+                    score = _CAPTURE + PIECE_VALUES[victim % 6] * 8 - PIECE_VALUES[mailbox[move & 63] % 6] // 100
+                elif move >> 15 == EN_PASSANT:
+                    score = _CAPTURE + PIECE_VALUES[PAWN] * 8 - 1
+                elif (move >> 12) & 7:
+                    score = _CAPTURE + PIECE_VALUES[(move >> 12) & 7]
+                elif move == killers[0] or move == killers[1]:
+                    score = _KILLER
+                else:
+                    score = min(history[move & 0xFFF], _KILLER - 1)
+            scored.append((score, move))
+        scored.sort(reverse=True)
+        return [move for _, move in scored]
+
+    def probe_tables(self, position, ply):
+        # Exact score from the endgame tables, or None when they do not cover the position
+        if self.tablebases is None or popcount(position.all_occupied) > MAX_PIECES:
+            return None
+        entry = self.tablebases.probe(position)
+        if entry is None:
+            return None
+        result, plies = entry
+        if result == WIN:
+            return MATE - ply - plies
+        if result == LOSS:
+            return -MATE + ply + plies
+        return 0
+
+    def _check_time(self):
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise SearchTimeout
+        if self.stop_event is not None and self.stop_event.is_set():
+            raise SearchTimeout
+
+    def negamax(self, position, depth, alpha, beta, ply):
+        if depth <= 0:
+            return self.quiescence(position, alpha, beta, ply)
+
+        self.nodes += 1
+        if not self.nodes & _CHECK_EVERY:
+            self._check_time()
+
+        if ply and (position.halfmove_clock >= 100 or self.is_repetition(position)):
+            return 0
+        if ply:
+            score = self.probe_tables(position, ply)
+            if score is not None:
+                return score
+
+        key = position.key
+        tt_move = NO_MOVE
+        entry = self.tt.probe(key)
+        if entry is not None:
+            tt_move, tt_score, tt_depth, bound = entry
+            if ply and tt_depth >= depth:
+                tt_score = _score_from_tt(tt_score, ply)
+                if (bound == EXACT
+                        or (bound == LOWER and tt_score >= beta)
+                        or (bound == UPPER and tt_score <= alpha)):
+                    return tt_score
+
+        moves = generate_legal_moves(position)
+        if not moves:
+            return -MATE + ply if in_check(position) else 0
+        if ply >= MAX_PLY:
+            return evaluate(position)
+
+        original_alpha = alpha
+        best_score = -INFINITY
+        best_move = NO_MOVE
+        for move in self.order_moves(position, moves, tt_move, ply):
+            position.make_move(move)
+            score = -self.negamax(position, depth - 1, -beta, -alpha, ply + 1)
+            position.unmake_move()
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if ply == 0:
+                    self.root_best = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        if not is_capture(position, move):
+                            killers = self.killers[ply]
+                            if killers[0] != move:
+                                killers[1] = killers[0]
+                                killers[0] = move
+                            self.history[move & 0xFFF] += depth * depth
+                        break
+
+        if best_score >= beta:
+            bound = LOWER
+        elif best_score > original_alpha:
+            bound = EXACT
+        else:
+            bound = UPPER
+        self.tt.store(key, best_move, _score_to_tt(best_score, ply), min(depth, 255), bound)
+        return best_score
+
+    def quiescence(self, position, alpha, beta, ply):
+        """Search captures only, so the static evaluation is never taken in the
+        middle of an exchange."""
+        self.nodes += 1
+        if not self.nodes & _CHECK_EVERY:
+            self._check_time()
+
+        score = self.probe_tables(position, ply)
+        if score is not None:
+            return score
+
+        checked = in_check(position)
+        moves = generate_legal_moves(position)
+        if not moves:
+            return -MATE + ply if checked else 0
+
+        if not checked:
+            stand_pat = evaluate(position)
+            if stand_pat >= beta or ply >= MAX_PLY:
+                return stand_pat
+            if stand_pat > alpha:
+                alpha = stand_pat
+            # When not in check only captures and promotions are worth a look
+            mailbox = position.mailbox
+            moves = [move for move in moves
+                     if mailbox[(move >> 6) & 63] != EMPTY or move >> 15 == EN_PASSANT
+                     or (move >> 12) & 7]
+            if not moves:
+                return alpha
+        elif ply >= MAX_PLY:
+            return evaluate(position)
+
+        for move in self.order_moves(position, moves, NO_MOVE, ply):
+            position.make_move(move)
+            score = -self.quiescence(position, -beta, -alpha, ply + 1)
+            position.unmake_move()
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    break
+        return alpha
@@ -0,0 +1,47 @@
+# engine/timeman.py
+
+# Decides how long the bot may think about one move, either a fixed time per
+# move or a share of the time left on a game clock.
+
+import time
+
+MIN_BUDGET = 0.02  # seconds; always look at least a ply or two deep
+
+
+class TimeManager:
+    """Per-move time budget.
+
+    With movetime set every move gets that many seconds. Otherwise the
+    budget is a slice of remaining (the bot's clock) plus most of the
+    increment, never more than half the clock. safety is kept in hand for
+    the time it takes to get the move back to the game loop.
+    """
+
+    def __init__(self, movetime=None, remaining=None, increment=0.0, moves_to_go=None, safety=0.05):
+        if movetime is None and remaining is None:
+            raise ValueError("TimeManager needs a movetime or a remaining clock time")
+        self.movetime = movetime
+        self.remaining = remaining
+        self.increment = increment
+        self.moves_to_go = moves_to_go
+        self.safety = safety
+
+    def budget(self):
+        """Seconds the search may use for the next move."""
+        if self.movetime is not None:
+            return max(MIN_BUDGET, self.movetime - self.safety)
+        moves_to_go = self.moves_to_go or 30
+        budget = self.remaining / moves_to_go + self.increment * 0.8
+        budget = min(budget, self.remaining * 0.5) - self.safety
+        return max(MIN_BUDGET, budget)
+
+    def deadline(self, start=None):
+        """Absolute time.perf_counter() value by which the move is due."""
+        return (time.perf_counter() if start is None else start) + self.budget()
+
+    def spend(self, seconds):
+        # Charge a finished move to the clock (no-op for a fixed movetime)
+        if self.remaining is not None:
+            self.remaining = max(0.0, self.remaining - seconds) + self.increment
+            if self.moves_to_go:
+                self.moves_to_go = max(1, self.moves_to_go - 1)
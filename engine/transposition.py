@@ -0,0 +1,104 @@
+# engine/transposition.py
+
+# Fixed-size transposition table. Entries live in one flat buffer of
+# unsigned 64-bit words viewed through a memoryview, two words per entry:
+#   word 0  key XOR data
+#   word 1  data: move (17 bits) | score + 32768 (16) | depth (8) | bound (2) | age (8)
+# Storing the key XORed with the data means a torn or foreign write simply
+# fails the key check on probe, so the buffer can be handed to several
+# searchers without locking.
+
+EXACT, LOWER, UPPER = 1, 2, 3  # bound kinds (0 marks an empty slot)
+
+ENTRY_WORDS = 2
+ENTRY_BYTES = ENTRY_WORDS * 8
+
+_SCORE_SHIFT = 17
+_DEPTH_SHIFT = 33
+_BOUND_SHIFT = 41
+_AGE_SHIFT = 43
+
+
+def entries_for_size(size_mb):
+    """Largest power-of-two entry count that fits in size_mb megabytes."""
+    entries = 1
+    while entries * 2 * ENTRY_BYTES <= size_mb * 1024 * 1024:
+        entries *= 2
+    return entries
+
+
+class TranspositionTable:
+    """Key-indexed cache of search results with a depth/age replacement policy.
+
+    buffer may be any writable object supporting the buffer protocol (for
+    example a shared memory block) of at least entries * ENTRY_BYTES bytes;
+    by default a private bytearray of size_mb megabytes is allocated.
+    """
+
+    def __init__(self, size_mb=16, buffer=None):
+        if buffer is None:
+            buffer = bytearray(entries_for_size(size_mb) * ENTRY_BYTES)
+        self.buffer = buffer
+        self.words = memoryview(buffer).cast("B").cast("Q")
+        entries = 1
+        while entries * 2 * ENTRY_WORDS <= len(self.words):
+            entries *= 2
+        self.mask = entries - 1
+        self.age = 0
+
+    def close(self):
+        # Drop the view so the underlying buffer (e.g. shared memory) can be closed
+        self.words.release()
+
+    def __len__(self):
+        return self.mask + 1
+
+    def clear(self):
+        raw = self.words.cast("B")
+        raw[:] = bytes(len(raw))
+        self.age = 0
+
+    def new_search(self):
+        # Entries from earlier searches become the first to be replaced
+        self.age = (self.age + 1) & 0xFF
+
+    def probe(self, key):
+        """(move, score, depth, bound) stored for key, or None."""
+        index = (key & self.mask) * ENTRY_WORDS
+        words = self.words
+        data = words[index + 1]
+        if not data or words[index] ^ data != key:
+            return None
+        return (data & 0x1FFFF,
+                ((data >> _SCORE_SHIFT) & 0xFFFF) - 32768,
+                (data >> _DEPTH_SHIFT) & 0xFF,
+                (data >> _BOUND_SHIFT) & 3)
+
+    def store(self, key, move, score, depth, bound):
+        index = (key & self.mask) * ENTRY_WORDS
+        words = self.words
+        old = words[index + 1]
+        if old:
+            same_key = words[index] ^ old == key
+            # Keep a deeper result from the current search for a different position
+            if (not same_key and (old >> _AGE_SHIFT) == self.age
+                    and ((old >> _DEPTH_SHIFT) & 0xFF) > depth):
+                return
+            # Re-storing the same position without a move keeps the old best move
+            if same_key and not move:
+                move = old & 0x1FFFF
+        data = (move
+                | ((score + 32768) << _SCORE_SHIFT)
+                | (depth << _DEPTH_SHIFT)
+                | (bound << _BOUND_SHIFT)
+                | (self.age << _AGE_SHIFT))
+        words[index] = key ^ data
+        words[index + 1] = data
+
+    def hashfull(self):
+        """Permille of the first thousand slots used by the current search."""
+        words = self.words
+        sample = min(1000, len(self))
+        used = sum(1 for i in range(sample)
+                   if words[i * ENTRY_WORDS + 1] and words[i * ENTRY_WORDS + 1] >> _AGE_SHIFT == self.age)
+        return used * 1000 // sample
@@ -1,78 +1,184 @@
 # game.py
 
+import os
+import sys
 import pygame
-from settings import WINDOW_WIDTH, WINDOW_HEIGHT, BG_COLOR, FPS
+from settings import WINDOW_WIDTH, WINDOW_HEIGHT, FPS, BOT_TIME_LIMIT, TT_SIZE_MB, BOT_WORKERS, BOOK_PATH, TABLEBASE_PATH
 from board.board import Board
+from board.renderer import BoardRenderer
 from controllers.input_handler import InputHandler
-from board.rule_engine import GameRules
 from scenes.result_screen import ResultScreen
+from engine.background import BackgroundSearch
+from engine.timeman import TimeManager
+from engine.book import OpeningBook
+from engine.bitbase import EndgameTables, WIN, DRAW
+from board.move import move_to_uci
+from board.bitboard import WHITE
+from utils.frame_scheduler import FrameScheduler
+
+# Posted from the bot's helper thread so the sleeping game loop wakes for its progress and move
+BOT_EVENT = pygame.USEREVENT + 1
+
+
+def post_bot_event():
+    pygame.event.post(pygame.event.Event(BOT_EVENT))
+
+
+def asset_path(relative):
+    # Assets sit next to this file, or in the bundle directory of a packaged build
+    base_path = getattr(sys, '_MEIPASS', os.path.abspath(os.path.dirname(__file__)))
+    return os.path.join(base_path, relative)
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, mode="1v1", tablebases=None):
         pygame.init()
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Chess")
-        self.clock = pygame.time.Clock()
+        self.caption = "Chess"
+        self.scheduler = FrameScheduler(FPS)
         self.running = True
         self.white_turn = True
         self.king_in_check : bool
 
 
-        self.board = Board()
-        self.game_rules = GameRules(self.board)  # Initialize game_rules with the board reference
+        # Endgame tables are opened lazily and only if they have been built. A game started
+        # from the result screen's menu is handed this instance and closes it when it ends.
+        self.tablebases = tablebases if tablebases is not None else EndgameTables(asset_path(TABLEBASE_PATH))
+        self.board = Board(self.tablebases)
+        self.renderer = BoardRenderer(self.board)
         self.input_handler = InputHandler(self.board, self)
-
+        self.bot = None
+        self.book = None
+        self.set_mode(mode)
+
+    def set_mode(self, mode):
+        # "AI" puts the bot on the black side; "1v1" is two players at one board
+        self.close_bot()
+        self.mode = mode
+        # The bot searches in BOT_WORKERS background processes
+        self.bot = BackgroundSearch(BOT_WORKERS, TT_SIZE_MB, self.tablebases.directory, post_bot_event) if mode == "AI" else None
+        self.book = self.open_book() if mode == "AI" else None
+        self.bot_white = False
+        self.time_manager = TimeManager(movetime=BOT_TIME_LIMIT)
+
+    def open_book(self):
+        # The opening book is optional: without one the bot searches from move one
+        path = asset_path(BOOK_PATH)
+        if not os.path.exists(path):
+            return None
+        try:
+            return OpeningBook(path)
+        except ValueError:
+            return None
+
+    def close_bot(self):
+        # The bot owns worker processes and a shared memory block
+        if self.bot is not None:
+            self.bot.close()
+        self.bot = None
+        if self.book is not None:
+            self.book.close()
+        self.book = None
+
+    def is_bot_turn(self):
+        return self.bot is not None and self.white_turn == self.bot_white
+
+    def cancel_bot_search(self):
+        if self.bot is not None:
+            self.bot.cancel()
+
+    def update_bot(self):
+        # Called once per frame: start thinking on the bot's turn, play the move once it is ready
+        if not self.is_bot_turn() or self.board.status.game_over:
+            return
+        if not self.bot.thinking:
+            self.scheduler.request()  # show the book move, or the thinking caption
+            move = self.book.choose(self.board.position) if self.book is not None else None
+            if move is not None:
+                self.board.make_move(move)
+                self.white_turn = not self.white_turn
+                return
+            self.bot.start(self.board.position, self.time_manager)
+            return
+        result = self.bot.poll()
+        if result is not None:
+            self.time_manager.spend(result.seconds)
+            self.board.make_move(result.move)
+            self.white_turn = not self.white_turn
+            self.scheduler.request()
+
+    def turn_caption(self):
+        if self.is_bot_turn() and self.bot.thinking:
+            progress = self.bot.progress
+            if progress is None:
+                return "Chess - Bot is thinking..."
+            pv = " ".join(move_to_uci(move) for move in progress.pv[:5])
+            return (f"Chess - Bot is thinking: depth {progress.depth}, "
+                    f"score {progress.score / 100:+.2f}, {progress.nodes} nodes, {pv}")
+        caption = f"Chess - {'White' if self.white_turn else 'Black'}'s Turn"
+        status = self.board.status
+        if status.endgame is not None and status.endgame[0] != DRAW and status.endgame[1]:
+            # Plies to mate from the endgame tables, as the winner's moves
+            result, plies = status.endgame
+            winner = status.side if result == WIN else status.side ^ 1
+            caption += f" ({'White' if winner == WHITE else 'Black'} mates in {(plies + 1) // 2})"
+        return caption
 
     def run(self):
         while self.running:
-            self.screen.fill(BG_COLOR)
-
-            for event in pygame.event.get():
+            # Sleeps until there is input or news from the bot; nothing on the board animates
+            for event in self.scheduler.wait():
                 if event.type == pygame.QUIT:
                     self.running = False
                 elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.type == pygame.VIDEOEXPOSE:
+                    self.renderer.invalidate()  # the window contents were lost
                 
                 self.input_handler.handle(event)
 
 
-            # use this for locking only the king will be played or a piece that can move the king out of check
-            self.king_in_check = self.game_rules.king_in_check(self.white_turn)  # True if the king is in check False if not 
+            # Cached per ply: nothing is recomputed until a move is made or undone
+            status = self.board.status
+            self.king_in_check = status.in_check  # True if the king is in check False if not
             # Check for checkmate
-            if self.game_rules.is_checkmate(self.white_turn):
+            if status.checkmate:
                 message = f"{'Black' if self.white_turn else 'White'} Wins by Checkmate!"
                 result = ResultScreen(self, message).run()
                 if result == "menu":
                     self.running = False
+                    self.close_bot()
                     from scenes.menu import Menu
                     from game import Game
-                    Menu(self).run()
-                    Game().run()
+                    mode = Menu(self).run()
+                    Game(mode, self.tablebases).run()
                     return  # <- This prevents drawing to a closed screen
                 else:
                     self.running = False
 
-            elif self.game_rules.is_stalemate(self.white_turn):
+            elif status.stalemate:
                 result = ResultScreen(self, "Stalemate! It's a draw.").run()
                 if result == "menu":
                     self.running = False
+                    self.close_bot()
                     from scenes.menu import Menu
                     from game import Game
-                    Menu(self).run()
-                    Game().run()
+                    mode = Menu(self).run()
+                    Game(mode, self.tablebases).run()
                     return  # <- This prevents drawing to a closed screen
                 else:
                     self.running = False
 
-            elif self.game_rules.is_draw_by_insufficient_material():
+            elif status.insufficient_material:
                 result = ResultScreen(self, "Draw! Insufficient material.").run()
                 if result == "menu":
                     self.running = False
+                    self.close_bot()
                     from scenes.menu import Menu
                     from game import Game
-                    Menu(self).run()
-                    Game().run()
+                    mode = Menu(self).run()
+                    Game(mode, self.tablebases).run()
                     return  # <- This prevents drawing to a closed screen
                 else:
                     self.running = False
@@ -81,22 +187,21 @@ class Game:
 
 
             
-            self.board.draw_tiles(self.screen)# draws the tiles of the board
-            self.board.draw_red_tile(self.screen, self.white_turn)# draws the red tile if the king is in check
-
-
-            self.board.highlight_tile(self.input_handler.selected_index, self.screen)
-            self.board.highlight_moves(self.input_handler.available_moves, self.screen)
-
-
-            self.board.draw_pieces(self.screen)
-            
-            
-            
-            
-            
-            pygame.display.set_caption(f"Chess - {'White' if self.white_turn else 'Black'}'s Turn")
-            pygame.display.flip()
-            self.clock.tick(FPS)
-
+            # Only the squares that changed since the last frame are redrawn and pushed to the display
+            dirty = self.renderer.draw(self.screen, self.input_handler.selected_index,
+                                       self.input_handler.available_moves)
+            if dirty:
+                pygame.display.update(dirty)
+
+            caption = self.turn_caption()
+            if caption != self.caption:
+                pygame.display.set_caption(caption)
+                self.caption = caption
+
+            # Never blocks: the search runs in the background and is only polled here
+            if self.running:
+                self.update_bot()
+
+        self.close_bot()
+        self.tablebases.close()
         pygame.quit()
@@ -1,14 +1,17 @@
 # main.py
 
+import multiprocessing
+
 from scenes.menu import Menu
 from game import Game
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # the bot's worker processes in a frozen build
 
 
     game_instance = Game()
     menu = Menu(game_instance)
     mode = menu.run()  # mode will be "1v1" or "AI"
 
-    # You can now pass `mode` into the Game class if needed
-    game_instance.run()
\ No newline at end of file
+    game_instance.set_mode(mode)
+    game_instance.run()
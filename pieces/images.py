@@ -0,0 +1,41 @@
+# pieces/images.py
+
+# Piece sprites for the renderer. They are decoded the first time they are
+# asked for, not at import, so nothing that only needs the rules (the
+# pieces' move handlers included) pulls in pygame or touches the image files.
+
+import pygame
+import os
+
+piece_images = {}
+
+# Map in-code names to filenames
+piece_map = {
+    "wP": "whitePawn.png",
+    "wR": "whiteRook.png",
+    "wKnight": "whiteKnight.png",
+    "wB": "whiteBishop.png",
+    "wQ": "whiteQueen.png",
+    "wK": "whiteKing.png",
+    "bP": "blackPawn.png",
+    "bR": "blackRook.png",
+    "bKnight": "blackKnight.png",
+    "bB": "blackBishop.png",
+    "bQ": "blackQueen.png",
+    "bK": "blackKing.png",
+}
+
+ASSET_PATH = os.path.join(os.path.dirname(__file__), "..", "assets", "images")
+ASSET_PATH = os.path.abspath(ASSET_PATH)
+
+def load_images():
+    for key, filename in piece_map.items():
+        path = os.path.join(ASSET_PATH, filename)
+        image = pygame.image.load(path)  # No scaling needed
+        image = pygame.transform.scale(image, (80, 80))
+        piece_images[key] = image
+
+def get_piece_images():
+    if not piece_images:
+        load_images()
+    return piece_images
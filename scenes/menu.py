@@ -1,15 +1,36 @@
 import pygame
 import sys
-from settings import WINDOW_WIDTH, WINDOW_HEIGHT, BG_COLOR
+from settings import WINDOW_WIDTH, WINDOW_HEIGHT, MENU_FPS
 import random
 import math
 import os
+from utils.sprite_cache import SurfaceCache, SpriteAtlas
+from utils.frame_scheduler import FrameScheduler
+
+# Particle pulses are drawn from this many pre-rendered brightness steps
+PULSE_LEVELS = 8
+# Phases of the animated stripes on disabled buttons
+HOLO_FRAMES = 24
+
+
+def particle_sprite(color, size, level):
+    # Glow and core of one particle at pulse step level (0 = dim, PULSE_LEVELS - 1 = full)
+    pulse = level / (PULSE_LEVELS - 1)
+    current_size = size * (0.5 + pulse * 0.5)
+    glow_size = int(current_size + 3)
+    glow_surface = pygame.Surface((glow_size * 4, glow_size * 4), pygame.SRCALPHA)
+    # Outer glow
+    pygame.draw.circle(glow_surface, (*color, 30), (glow_size * 2, glow_size * 2), glow_size * 2)
+    # Inner bright core
+    pygame.draw.circle(glow_surface, (*color, int(200 * pulse)), (glow_size * 2, glow_size * 2), int(current_size))
+    return glow_surface
+
 
 class Menu:
     def __init__(self, game):
         self.game = game
         self.screen = game.screen
-        self.clock = pygame.time.Clock()
+        self.scheduler = FrameScheduler(MENU_FPS)
 
         self.button_font = pygame.font.SysFont("Arial", 36, bold=True)
         self.title_font = pygame.font.SysFont("Arial", 48, bold=True)
@@ -56,23 +77,43 @@ class Menu:
         self.selected_button = None
 
         # Create more dynamic particles
+        particle_colors = [self.primary_color, self.secondary_color, self.accent_color, self.neon_purple, self.neon_green]
         for _ in range(80):
             self.particles.append({
                 'x': random.randint(0, WINDOW_WIDTH),
                 'y': random.randint(0, WINDOW_HEIGHT),
                 'speed': random.uniform(0.3, 1.5),
                 'size': random.randint(1, 4),
-                'color': random.choice([self.primary_color, self.secondary_color, self.accent_color, self.neon_purple, self.neon_green]),
+                'color': random.choice(particle_colors),
                 'pulse_offset': random.uniform(0, math.pi * 2),
                 'drift_speed': random.uniform(0.1, 0.5)
             })
 
+        # Every particle look (colour, size, pulse step) is rendered once into an atlas
+        self.particle_atlas = SpriteAtlas({
+            (color, size, level): particle_sprite(color, size, level)
+            for color in particle_colors
+            for size in range(1, 5)
+            for level in range(PULSE_LEVELS)
+        })
+        # Labels, panels and glow layers, built the first time they are drawn
+        self.sprites = SurfaceCache()
+
+        # Background image and gradient flattened into one opaque layer
+        self.background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self.background.fill(self.bg_color)
+        self.background.blit(self.bg_image, (self.bg_x, self.bg_y))
+        self.background.blit(self.bg_overlay, (0, 0))
+
         # Game title
         self.title_text = "CHESS MASTER"
         self.subtitle_text = "The Ultimate Strategy Game"
+        self.title_surface = self.title_font.render(self.title_text, True, self.primary_color)
+        self.title_glow = self.title_font.render(self.title_text, True, (*self.primary_color, 50))
+        self.subtitle_surface = self.subtitle_font.render(self.subtitle_text, True, self.secondary_color)
 
         # Button configuration
-        button_texts = ["1v1 (Offline)", "1v1 (Online) Coming Soon", "1 v Bot Coming Soon", "Quit"]
+        button_texts = ["1v1 (Offline)", "1v1 (Online) Coming Soon", "1 v Bot", "Quit"]
         self.buttons = []
 
         # Calculate button layout - make buttons wider for longer text
@@ -82,7 +123,7 @@ class Menu:
         start_y = (WINDOW_HEIGHT - total_height) // 2 + 100
 
         for i, text in enumerate(button_texts):
-            enabled = text == "1v1 (Offline)" or text == "Quit"
+            enabled = text in ("1v1 (Offline)", "1 v Bot", "Quit")
             x = (WINDOW_WIDTH - button_width) // 2
             y = start_y + i * (button_height + 20)
 
@@ -114,77 +155,108 @@ class Menu:
         main_surface = font.render(text, True, main_color)
         self.screen.blit(main_surface, (x, y))
 
+    def neon_glow(self, size, color, glow_size):
+        # All the glow rings of draw_neon_border stacked on one surface, outermost first
+        width, height = size
+        glow_layer = pygame.Surface((width + glow_size * 2, height + glow_size * 2), pygame.SRCALPHA)
+        for i in range(glow_size, 0, -1):
+            alpha = int(50 * (i / glow_size))
+            ring = pygame.Surface((width + i * 2, height + i * 2), pygame.SRCALPHA)
+            pygame.draw.rect(ring, (*color, alpha), ring.get_rect(), border_radius=15)
+            glow_layer.blit(ring, (glow_size - i, glow_size - i))
+        return glow_layer
+
     def draw_neon_border(self, rect, color, thickness=3, glow_size=10):
         """Draw a glowing neon border"""
         # Outer glow
-        for i in range(glow_size, 0, -1):
-            alpha = int(50 * (i / glow_size))
-            glow_rect = rect.inflate(i * 2, i * 2)
-            glow_surface = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surface, (*color, alpha), (0, 0, glow_rect.width, glow_rect.height), border_radius=15)
-            self.screen.blit(glow_surface, glow_rect.topleft)
-        
+        if glow_size > 0:
+            glow_layer = self.sprites.get(("glow", rect.size, color, glow_size),
+                                          lambda: self.neon_glow(rect.size, color, glow_size))
+            self.screen.blit(glow_layer, (rect.x - glow_size, rect.y - glow_size))
+
         # Main border
         pygame.draw.rect(self.screen, color, rect, thickness, border_radius=10)
 
+    def button_panel(self, size, color):
+        panel = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(panel, color, panel.get_rect(), border_radius=10)
+        return panel
+
+    def scan_line(self, size, color):
+        scan_surface = pygame.Surface(size, pygame.SRCALPHA)
+        scan_surface.fill(color)
+        return scan_surface
+
+    def button_label(self, text, color, max_width):
+        label = self.button_font.render(text, True, color)
+        # Ensure text fits within button bounds
+        if label.get_width() > max_width:
+            # Use smaller font if text is too wide
+            smaller_font = pygame.font.SysFont("Arial", 28, bold=True)
+            label = smaller_font.render(text, True, color)
+        return label
+
+    def holo_stripes(self, size, frame):
+        # Holographic stripes of a disabled button at one of HOLO_FRAMES animation phases
+        width, height = size
+        phase = frame * math.pi / HOLO_FRAMES  # abs(sin) repeats every pi
+        holo_surface = pygame.Surface(size, pygame.SRCALPHA)
+        for y in range(0, height, 4):
+            alpha = int(abs(math.sin(phase + y * 0.1)) * 40)
+            pygame.draw.line(holo_surface, (255, 255, 255, alpha), (0, y), (width, y), 1)
+        return holo_surface
+
     def run(self):
         while True:
-            dt = self.clock.tick(60)
+            # The particles never stop, so a frame is always due; with nobody at the
+            # screen the scheduler lowers the rate, and movement follows the clock
+            events = self.scheduler.wait(animating=True)
+            dt = self.scheduler.dt
             self.time += dt * 0.001
+            steps = dt * MENU_FPS / 1000  # movement is tuned per frame at MENU_FPS
             mouse_pos = pygame.mouse.get_pos()
 
             # Draw background
-            self.screen.fill(self.bg_color)
-            self.screen.blit(self.bg_image, (self.bg_x, self.bg_y))
-            self.screen.blit(self.bg_overlay, (0, 0))
+            self.screen.blit(self.background, (0, 0))
 
             # Update and draw particles
+            sprites = []
+            atlas = self.particle_atlas
             for particle in self.particles:
                 # Update position
-                particle['y'] -= particle['speed']
+                particle['y'] -= particle['speed'] * steps
                 if particle['y'] < -10:
                     particle['y'] = WINDOW_HEIGHT + 10
                     particle['x'] = random.randint(0, WINDOW_WIDTH)
                 
                 # Add drift movement
-                particle['x'] += math.sin(self.time * particle['drift_speed'] + particle['pulse_offset']) * 0.5
+                particle['x'] += math.sin(self.time * particle['drift_speed'] + particle['pulse_offset']) * 0.5 * steps
                 
-                # Pulse effect
+                # Pulse effect, rounded to one of the pre-rendered steps
                 pulse = math.sin(self.time * 3 + particle['pulse_offset']) * 0.5 + 0.5
-                current_size = particle['size'] * (0.5 + pulse * 0.5)
-                
+                key = (particle['color'], particle['size'], round(pulse * (PULSE_LEVELS - 1)))
+
                 # Draw particle with glow
-                glow_size = int(current_size + 3)
-                glow_surface = pygame.Surface((glow_size * 4, glow_size * 4), pygame.SRCALPHA)
-                
-                # Outer glow
-                pygame.draw.circle(glow_surface, (*particle['color'], 30), 
-                                 (glow_size * 2, glow_size * 2), glow_size * 2)
-                # Inner bright core
-                pygame.draw.circle(glow_surface, (*particle['color'], int(200 * pulse)), 
-                                 (glow_size * 2, glow_size * 2), int(current_size))
-                
-                self.screen.blit(glow_surface, (particle['x'] - glow_size * 2, particle['y'] - glow_size * 2))
+                width, height = atlas.sizes[key]
+                sprites.append(atlas.blit_args(key, (particle['x'] - width // 2, particle['y'] - height // 2)))
+            self.screen.blits(sprites, doreturn=False)
 
             # Draw title
             title_y = 80
-            title_surface = self.title_font.render(self.title_text, True, self.primary_color)
-            title_rect = title_surface.get_rect(center=(WINDOW_WIDTH // 2, title_y))
-            
+            title_rect = self.title_surface.get_rect(center=(WINDOW_WIDTH // 2, title_y))
+
             # Title glow effect
             for i in range(5, 0, -1):
-                glow_surface = self.title_font.render(self.title_text, True, (*self.primary_color, 50))
                 glow_rect = title_rect.copy()
                 glow_rect.x += random.randint(-i, i)
                 glow_rect.y += random.randint(-i, i)
-                self.screen.blit(glow_surface, glow_rect)
-            
-            self.screen.blit(title_surface, title_rect)
-            
+                self.screen.blit(self.title_glow, glow_rect)
+
+            self.screen.blit(self.title_surface, title_rect)
+
             # Draw subtitle
-            subtitle_surface = self.subtitle_font.render(self.subtitle_text, True, self.secondary_color)
-            subtitle_rect = subtitle_surface.get_rect(center=(WINDOW_WIDTH // 2, title_y + 60))
-            self.screen.blit(subtitle_surface, subtitle_rect)
+            subtitle_rect = self.subtitle_surface.get_rect(center=(WINDOW_WIDTH // 2, title_y + 60))
+            self.screen.blit(self.subtitle_surface, subtitle_rect)
 
             # Update and draw buttons
             for i, button in enumerate(self.buttons):
@@ -192,15 +264,15 @@ class Menu:
                 
                 # Update effects
                 if button["hover"]:
-                    button["glow_intensity"] = min(255, button["glow_intensity"] + 8)
+                    button["glow_intensity"] = min(255, button["glow_intensity"] + 8 * steps)
                     button["pulse"] = math.sin(self.time * 8) * 3
                 else:
-                    button["glow_intensity"] = max(0, button["glow_intensity"] - 12)
+                    button["glow_intensity"] = max(0, button["glow_intensity"] - 12 * steps)
                     button["pulse"] = 0
 
                 # Update scan line for enabled buttons
                 if button["enabled"]:
-                    button["scan_line"] = (button["scan_line"] + 2) % button["rect"].height
+                    button["scan_line"] = (button["scan_line"] + 2 * steps) % button["rect"].height
 
                 button_rect = button["rect"].copy()
                 button_rect.y = button["original_y"] + int(button["pulse"])
@@ -224,8 +296,8 @@ class Menu:
                     self.draw_neon_border(button_rect, border_color, 2, int(button["glow_intensity"] / 20))
 
                 # Draw button background
-                button_surface = pygame.Surface((button_rect.width, button_rect.height), pygame.SRCALPHA)
-                pygame.draw.rect(button_surface, bg_color, (0, 0, button_rect.width, button_rect.height), border_radius=10)
+                button_surface = self.sprites.get(("panel", button_rect.size, bg_color),
+                                                  lambda: self.button_panel(button_rect.size, bg_color))
                 self.screen.blit(button_surface, button_rect.topleft)
 
                 # Draw button border
@@ -233,46 +305,22 @@ class Menu:
 
                 # Draw scanning line for enabled buttons
                 if button["enabled"] and not button["hover"]:
-                    scan_y = button_rect.top + button["scan_line"]
+                    scan_y = button_rect.top + int(button["scan_line"])
                     scan_color = (*border_color, 100)
-                    scan_surface = pygame.Surface((button_rect.width, 2), pygame.SRCALPHA)
-                    scan_surface.fill(scan_color)
+                    scan_surface = self.sprites.get(("scan", button_rect.width, scan_color),
+                                                    lambda: self.scan_line((button_rect.width, 2), scan_color))
                     self.screen.blit(scan_surface, (button_rect.left, scan_y))
 
                 # Draw button text with proper sizing
-                if button["enabled"] and button["hover"]:
-                    # For hovered buttons, use regular text (no glitch effect that might overflow)
-                    label = self.button_font.render(button["text"], True, text_color)
-                    label_rect = label.get_rect(center=button_rect.center)
-                    
-                    # Ensure text fits within button bounds
-                    if label_rect.width > button_rect.width - 20:
-                        # Use smaller font if text is too wide
-                        smaller_font = pygame.font.SysFont("Arial", 28, bold=True)
-                        label = smaller_font.render(button["text"], True, text_color)
-                        label_rect = label.get_rect(center=button_rect.center)
-                    
-                    self.screen.blit(label, label_rect)
-                else:
-                    label = self.button_font.render(button["text"], True, text_color)
-                    label_rect = label.get_rect(center=button_rect.center)
-                    
-                    # Ensure text fits within button bounds
-                    if label_rect.width > button_rect.width - 20:
-                        # Use smaller font if text is too wide
-                        smaller_font = pygame.font.SysFont("Arial", 28, bold=True)
-                        label = smaller_font.render(button["text"], True, text_color)
-                        label_rect = label.get_rect(center=button_rect.center)
-                    
-                    self.screen.blit(label, label_rect)
+                label = self.sprites.get(("label", button["text"], text_color),
+                                         lambda: self.button_label(button["text"], text_color, button_rect.width - 20))
+                self.screen.blit(label, label.get_rect(center=button_rect.center))
 
                 # Holographic effect for disabled buttons
                 if not button["enabled"]:
-                    holo_surface = pygame.Surface((button_rect.width, button_rect.height), pygame.SRCALPHA)
-                    for y in range(0, button_rect.height, 4):
-                        alpha = int(abs(math.sin(self.time * 2 + y * 0.1)) * 40)
-                        pygame.draw.line(holo_surface, (255, 255, 255, alpha), 
-                                       (0, y), (button_rect.width, y), 1)
+                    frame = int(self.time * 2 / math.pi * HOLO_FRAMES) % HOLO_FRAMES
+                    holo_surface = self.sprites.get(("holo", button_rect.size, frame),
+                                                    lambda: self.holo_stripes(button_rect.size, frame))
                     self.screen.blit(holo_surface, button_rect.topleft)
 
             # Draw corner decorations
@@ -297,7 +345,7 @@ class Menu:
                              (WINDOW_WIDTH - 20, WINDOW_HEIGHT - 20 - corner_size)], 3)
 
             # Handle events
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -306,7 +354,10 @@ class Menu:
                         if button["rect"].collidepoint(event.pos) and button["enabled"]:
                             if button["text"] == "1v1 (Offline)":
                                 self.fade_out()
-                                return button["text"]
+                                return "1v1"
+                            elif button["text"] == "1 v Bot":
+                                self.fade_out()
+                                return "AI"
                             elif button["text"] == "Quit":
                                 pygame.quit()
                                 sys.exit()
@@ -2,8 +2,49 @@ import pygame
 import sys
 import math
 import random
-from settings import WINDOW_WIDTH, WINDOW_HEIGHT
+from settings import WINDOW_WIDTH, WINDOW_HEIGHT, MENU_FPS
 import os
+from utils.sprite_cache import SurfaceCache
+from utils.frame_scheduler import FrameScheduler
+
+# Font objects by point size, shared by every ResultScreen
+_fonts = {}
+# Particle discs by (colour, surface size, radius), drawn at full opacity and faded with set_alpha
+_particle_sprites = SurfaceCache()
+# The darkening overlay is rebuilt when its strength moves into another bucket this wide
+OVERLAY_ALPHA_STEP = 5
+
+
+def get_font(size):
+    font = _fonts.get(size)
+    if font is None:
+        try:
+            font = pygame.font.Font(None, size)
+        except:
+            font = pygame.font.SysFont("Arial", size, bold=True)
+        _fonts[size] = font
+    return font
+
+
+def _particle_sprite(color, diameter, radius):
+    particle_surf = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+    pygame.draw.circle(particle_surf, (*color, 255), (radius, radius), radius)
+    return particle_surf
+
+
+def _star_sprite(size):
+    # Five-pointed star at full opacity; the twinkle is applied with set_alpha
+    star_surf = pygame.Surface((int(size * 8), int(size * 8)), pygame.SRCALPHA)
+    points = []
+    for j in range(10):
+        angle = j * math.pi / 5
+        radius = size * 3 if j % 2 == 0 else size * 1.5
+        px = size * 4 + radius * math.cos(angle)
+        py = size * 4 + radius * math.sin(angle)
+        points.append((px, py))
+    pygame.draw.polygon(star_surf, (255, 255, 200), points)
+    return star_surf
+
 
 class Particle:
     def __init__(self, x, y, color):
@@ -15,44 +56,41 @@ class Particle:
         self.color = color
         self.size = random.uniform(2, 5)
         
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.1  # gravity
-        self.life -= 2
-        self.size = max(0, self.size - 0.02)
+    def update(self, steps=1):
+        # steps: how many MENU_FPS frames the last frame lasted
+        self.x += self.vx * steps
+        self.y += self.vy * steps
+        self.vy += 0.1 * steps  # gravity
+        self.life -= 2 * steps
+        self.size = max(0, self.size - 0.02 * steps)
         
     def is_alive(self):
         return self.life > 0 and self.size > 0
         
     def draw(self, screen):
         if self.is_alive():
-            alpha = max(0, min(255, self.life))
-            color_with_alpha = (*self.color, alpha)
-            # Create a surface for the particle with alpha
-            particle_surf = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, color_with_alpha, 
-                             (int(self.size), int(self.size)), int(self.size))
+            alpha = int(max(0, min(255, self.life)))
+            # Shared sprite for this colour and size, faded to the particle's life
+            key = (self.color, int(self.size * 2), int(self.size))
+            particle_surf = _particle_sprites.get(key, lambda: _particle_sprite(*key))
+            particle_surf.set_alpha(alpha)
             screen.blit(particle_surf, (self.x - self.size, self.y - self.size))
 
 class ResultScreen:
     def __init__(self, game, result_message):
         self.game = game
         self.screen = game.screen
-        self.clock = pygame.time.Clock()
+        self.scheduler = FrameScheduler(MENU_FPS)
         self.result_message = result_message
         self.time = 0
         self.particles = []
         
         # Enhanced fonts with fallbacks
-        try:
-            self.title_font = pygame.font.Font(None, 72)
-            self.button_font = pygame.font.Font(None, 36)
-            self.subtitle_font = pygame.font.Font(None, 28)
-        except:
-            self.title_font = pygame.font.SysFont("Arial", 72, bold=True)
-            self.button_font = pygame.font.SysFont("Arial", 36, bold=True)
-            self.subtitle_font = pygame.font.SysFont("Arial", 28)
+        self.title_font = get_font(72)
+        self.button_font = get_font(36)
+        self.subtitle_font = get_font(28)
+        # Rendered text and button surfaces, keyed by what they show
+        self.sprites = SurfaceCache()
 
         # Load and scale background with error handling
         try:
@@ -107,6 +145,8 @@ class ResultScreen:
         if self.is_victory:
             self.stars = [(random.randint(0, WINDOW_WIDTH), random.randint(0, WINDOW_HEIGHT), 
                           random.uniform(0.5, 2.0)) for _ in range(50)]
+            self.star_sprites = [_star_sprite(size) for _, _, size in self.stars]
+        self.flash = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
     
     def create_gradient_background(self):
         """Create an animated gradient background"""
@@ -115,11 +155,30 @@ class ResultScreen:
     def create_animated_overlay(self):
         """Create animated overlay effects"""
         self.overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        self.overlay_bucket = None  # overlay strength the surface was last drawn with
+
+    def update_overlay(self, overlay_alpha):
+        # Redraw the 200 overlay lines only when the strength reaches another bucket
+        bucket = overlay_alpha // OVERLAY_ALPHA_STEP
+        if bucket == self.overlay_bucket:
+            return
+        self.overlay_bucket = bucket
+        overlay_alpha = bucket * OVERLAY_ALPHA_STEP
+        self.overlay.fill((0, 0, 0, 0))
+        for y in range(0, WINDOW_HEIGHT, 4):
+            alpha = int(overlay_alpha * (1 - y / WINDOW_HEIGHT))
+            color = (10, 5, 20, alpha)
+            pygame.draw.line(self.overlay, color, (0, y), (WINDOW_WIDTH, y), 4)
+
+    def text(self, font_size, text, color):
+        # Glyphs of text at font_size, rendered once
+        return self.sprites.get(("text", font_size, text, color),
+                                lambda: get_font(font_size).render(text, True, color))
         
-    def update_particles(self):
+    def update_particles(self, steps=1):
         """Update and manage particle system"""
         # Add new particles occasionally
-        if random.random() < 0.3:
+        if random.random() < 0.3 * steps:
             x = random.randint(0, WINDOW_WIDTH)
             y = WINDOW_HEIGHT + 10
             color = self.result_color if random.random() < 0.7 else (255, 255, 255)
@@ -128,7 +187,7 @@ class ResultScreen:
         # Update existing particles
         self.particles = [p for p in self.particles if p.is_alive()]
         for particle in self.particles:
-            particle.update()
+            particle.update(steps)
     
     def draw_animated_background(self):
         """Draw the animated background"""
@@ -151,11 +210,7 @@ class ResultScreen:
         
         # Animated overlay
         overlay_alpha = int(50 + 30 * math.sin(self.time * 0.02))
-        self.overlay.fill((0, 0, 0, 0))
-        for y in range(0, WINDOW_HEIGHT, 4):
-            alpha = int(overlay_alpha * (1 - y / WINDOW_HEIGHT))
-            color = (10, 5, 20, alpha)
-            pygame.draw.line(self.overlay, color, (0, y), (WINDOW_WIDTH, y), 4)
+        self.update_overlay(overlay_alpha)
         self.screen.blit(self.overlay, (0, 0))
         
         # Draw victory stars
@@ -163,18 +218,9 @@ class ResultScreen:
             for i, (x, y, size) in enumerate(self.stars):
                 twinkle = math.sin(self.time * 0.1 + i) * 0.5 + 0.5
                 alpha = int(100 + 155 * twinkle)
-                star_color = (255, 255, 200, alpha)
-                
-                # Create star surface
-                star_surf = pygame.Surface((int(size * 8), int(size * 8)), pygame.SRCALPHA)
-                points = []
-                for j in range(10):
-                    angle = j * math.pi / 5
-                    radius = size * 3 if j % 2 == 0 else size * 1.5
-                    px = size * 4 + radius * math.cos(angle)
-                    py = size * 4 + radius * math.sin(angle)
-                    points.append((px, py))
-                pygame.draw.polygon(star_surf, star_color, points)
+
+                star_surf = self.star_sprites[i]
+                star_surf.set_alpha(alpha)
                 self.screen.blit(star_surf, (x - size * 4, y - size * 4))
     
     def draw_enhanced_title(self):
@@ -191,30 +237,17 @@ class ResultScreen:
         # Draw glow layers
         for offset in range(8, 0, -2):
             glow_alpha = int(30 * glow_intensity * (8 - offset) / 8)
-            glow_color = (*self.result_color, glow_alpha)
-            
-            # Create glow surface
-            glow_surf = pygame.Surface((WINDOW_WIDTH, 200), pygame.SRCALPHA)
+
+            # Cached glyphs of the message one size up, faded to the glow strength
             scaled_font_size = int(72 * self.title_scale)
-            try:
-                glow_font = pygame.font.Font(None, scaled_font_size + offset)
-            except:
-                glow_font = pygame.font.SysFont("Arial", scaled_font_size + offset, bold=True)
-                
-            glow_text = glow_font.render(self.result_message, True, glow_color[:3])
-            glow_rect = glow_text.get_rect(center=(WINDOW_WIDTH // 2, 100))
-            glow_surf.blit(glow_text, glow_rect)
-            glow_surf.set_alpha(glow_alpha)
-            self.screen.blit(glow_surf, (0, WINDOW_HEIGHT // 2 - 200))
-        
+            glow_text = self.text(scaled_font_size + offset, self.result_message, self.result_color)
+            glow_text.set_alpha(glow_alpha)
+            glow_rect = glow_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 100))
+            self.screen.blit(glow_text, glow_rect)
+
         # Draw main title
         scaled_font_size = int(72 * self.title_scale)
-        try:
-            title_font = pygame.font.Font(None, scaled_font_size)
-        except:
-            title_font = pygame.font.SysFont("Arial", scaled_font_size, bold=True)
-            
-        title_surface = title_font.render(self.result_message, True, self.result_color)
+        title_surface = self.text(scaled_font_size, self.result_message, self.result_color)
         title_surface.set_alpha(self.title_alpha)
         
         # Add subtle movement
@@ -272,58 +305,71 @@ class ResultScreen:
             if button["glow"] > 0:
                 glow_size = int(10 * button["glow"])
                 glow_rect = scaled_rect.inflate(glow_size * 2, glow_size * 2)
-                glow_surf = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-                
-                glow_color = (0, 255, 255, int(50 * button["glow"]))
-                pygame.draw.rect(glow_surf, glow_color, (0, 0, glow_rect.width, glow_rect.height), 
-                               border_radius=20)
+                glow_alpha = int(50 * button["glow"])
+                glow_surf = self.sprites.get(("glow", glow_rect.size, glow_alpha),
+                                             lambda: self.button_glow(glow_rect.size, glow_alpha))
                 self.screen.blit(glow_surf, glow_rect.topleft)
-            
+
             # Draw button background with gradient
-            button_surf = pygame.Surface((scaled_width, scaled_height), pygame.SRCALPHA)
-            
-            # Create gradient effect
-            base_color = (0, 200, 200) if button["hover"] else (60, 60, 80)
-            highlight_color = (0, 255, 255) if button["hover"] else (100, 100, 120)
-            
-            for y in range(scaled_height):
-                ratio = y / scaled_height
-                color = [
-                    int(base_color[j] + (highlight_color[j] - base_color[j]) * (1 - ratio))
-                    for j in range(3)
-                ]
-                pygame.draw.line(button_surf, color, (0, y), (scaled_width, y))
-            
-            # Add border
-            border_color = (0, 255, 255) if button["hover"] else (120, 120, 140)
-            pygame.draw.rect(button_surf, border_color, (0, 0, scaled_width, scaled_height), 
-                           width=3, border_radius=15)
-            
+            button_surf = self.sprites.get(("button", scaled_width, scaled_height, button["hover"]),
+                                           lambda: self.button_face(scaled_width, scaled_height, button["hover"]))
             self.screen.blit(button_surf, (button_x, button_y))
-            
+
             # Draw button text with shadow
             text_color = (0, 0, 0) if button["hover"] else (200, 200, 200)
-            shadow_color = (0, 0, 0, 100)
-            
+
             # Shadow
-            shadow_surf = self.button_font.render(button["text"], True, shadow_color[:3])
+            shadow_surf = self.sprites.get(("shadow", button["text"]), lambda: self.text_shadow(button["text"]))
             shadow_rect = shadow_surf.get_rect(center=(scaled_rect.centerx + 2, scaled_rect.centery + 2))
-            shadow_surf.set_alpha(shadow_color[3])
             self.screen.blit(shadow_surf, shadow_rect)
-            
+
             # Main text
-            text_surface = self.button_font.render(button["text"], True, text_color)
+            text_surface = self.text(36, button["text"], text_color)
             text_rect = text_surface.get_rect(center=scaled_rect.center)
             self.screen.blit(text_surface, text_rect)
 
+    def button_glow(self, size, alpha):
+        glow_surf = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(glow_surf, (0, 255, 255, alpha), glow_surf.get_rect(), border_radius=20)
+        return glow_surf
+
+    def button_face(self, width, height, hover):
+        button_surf = pygame.Surface((width, height), pygame.SRCALPHA)
+
+        # Create gradient effect
+        base_color = (0, 200, 200) if hover else (60, 60, 80)
+        highlight_color = (0, 255, 255) if hover else (100, 100, 120)
+
+        for y in range(height):
+            ratio = y / height
+            color = [
+                int(base_color[j] + (highlight_color[j] - base_color[j]) * (1 - ratio))
+                for j in range(3)
+            ]
+            pygame.draw.line(button_surf, color, (0, y), (width, y))
+
+        # Add border
+        border_color = (0, 255, 255) if hover else (120, 120, 140)
+        pygame.draw.rect(button_surf, border_color, (0, 0, width, height), width=3, border_radius=15)
+        return button_surf
+
+    def text_shadow(self, text):
+        # Its own surface, so the fixed alpha never leaks into the black hover label
+        shadow_surf = self.button_font.render(text, True, (0, 0, 0))
+        shadow_surf.set_alpha(100)
+        return shadow_surf
+
     def run(self):
         running = True
         while running:
-            self.time += 1
-            self.clock.tick(60)
-            
+            # Always animating; the scheduler lowers the rate when nobody is at the screen,
+            # and time (counted in MENU_FPS frames) follows the clock
+            events = self.scheduler.wait(animating=True)
+            steps = self.scheduler.dt * MENU_FPS / 1000
+            self.time += steps
+
             # Handle events
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -346,7 +392,7 @@ class ResultScreen:
                         sys.exit()
 
             # Update animations
-            self.update_particles()
+            self.update_particles(steps)
             
             # Draw everything
             self.draw_animated_background()
@@ -361,9 +407,8 @@ class ResultScreen:
             # Add screen flash effect for victory
             if self.is_victory and self.time < 30:
                 flash_alpha = int(50 * (1 - self.time / 30))
-                flash_surf = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-                flash_surf.fill((255, 255, 255, flash_alpha))
-                self.screen.blit(flash_surf, (0, 0))
+                self.flash.fill((255, 255, 255, flash_alpha))
+                self.screen.blit(self.flash, (0, 0))
 
             pygame.display.flip()
 
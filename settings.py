@@ -9,6 +9,19 @@ MARGIN_X = (WINDOW_WIDTH - BOARD_SIZE) // 2
 MARGIN_Y = (WINDOW_HEIGHT - BOARD_SIZE) // 2
 
 FPS = 30
+MENU_FPS = 60  # menu and result screen animations
+
+# Frame scheduling: scenes sleep until input arrives unless they have something to animate
+IDLE_TIMEOUT_MS = 500  # longest a sleeping scene waits before looking around again
+IDLE_AFTER = 10.0  # seconds without input before animations drop to IDLE_FPS
+IDLE_FPS = 20
+
+# Bot
+BOT_TIME_LIMIT = 1.5  # seconds per move
+TT_SIZE_MB = 16
+BOT_WORKERS = 1  # more than one searches with that many processes (Lazy SMP)
+BOOK_PATH = "assets/book.bin"  # built with python -m tools.build_book; optional
+TABLEBASE_PATH = "assets/tablebases"  # built with python -m tools.build_bitbases; optional
 
 # Colors
 WHITE = (240, 217, 181)
@@ -0,0 +1,26 @@
+# tests/test_perft.py
+
+# Node counts of the legal move tree against the published perft numbers.
+# Depth 3 covers castling, en passant and promotions in the suite positions
+# and keeps the run to a few seconds.
+
+import pytest
+
+from board.position import Position
+from tools.perft import POSITIONS, perft, checked_perft
+
+MAX_DEPTH = 3
+
+
+@pytest.mark.parametrize("name", sorted(POSITIONS))
+def test_perft(name):
+    fen, counts = POSITIONS[name]
+    position = Position.from_fen(fen)
+    for depth, expected in enumerate(counts[:MAX_DEPTH], 1):
+        assert perft(position, depth) == expected, f"{name} depth {depth}"
+    assert position.to_fen() == Position.from_fen(fen).to_fen()  # every move was taken back
+
+
+def test_checked_perft_agrees():
+    fen, counts = POSITIONS["kiwipete"]
+    assert checked_perft(Position.from_fen(fen), 2) == counts[1]
@@ -0,0 +1,85 @@
+# tests/test_position.py
+
+# The incremental state Position keeps up to date in make_move / unmake_move
+# (Zobrist key, piece-square sums, attack maps) must always equal what a
+# position set up from scratch computes, and FEN must round-trip.
+
+import random
+
+import pytest
+
+from board.movegen import generate_legal_moves
+from board.position import Position, START_FEN
+from board.zobrist import compute_key
+from tools.perft import POSITIONS
+
+FENS = [fen for fen, _ in POSITIONS.values()]
+
+# Everything make_move updates in place, as opposed to recomputing
+STATE = ("pieces", "occupied", "all_occupied", "mailbox", "side", "castling", "ep_square",
+         "halfmove_clock", "key", "psqt_mg", "psqt_eg", "phase",
+         "attack_sets", "attack_planes", "attacked")
+
+
+def snapshot(position):
+    return {name: getattr(position, name) for name in STATE}
+
+
+def copy_of(value):
+    return value[:] if isinstance(value, list) else value
+
+
+def random_game(fen, rng, plies):
+    # Plays random legal moves from fen, yielding the position after each one
+    position = Position.from_fen(fen)
+    for _ in range(plies):
+        moves = generate_legal_moves(position)
+        if not moves:
+            break
+        position.make_move(rng.choice(moves))
+        yield position
+
+
+@pytest.mark.parametrize("fen", FENS)
+def test_fen_round_trip(fen):
+    position = Position.from_fen(fen)
+    assert position.to_fen() == fen
+    assert Position.from_fen(position.to_fen()).key == position.key
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_fen_round_trip_after_random_moves(seed):
+    rng = random.Random(seed)
+    for position in random_game(FENS[seed % len(FENS)], rng, 120):
+        fen = position.to_fen()
+        assert Position.from_fen(fen).to_fen() == fen
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_incremental_state_matches_a_fresh_position(seed):
+    rng = random.Random(seed)
+    for position in random_game(FENS[seed % len(FENS)], rng, 100):
+        fresh = Position.from_fen(position.to_fen())
+        assert position.key == compute_key(position)
+        assert snapshot(position) == snapshot(fresh), position.to_fen()
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_unmake_restores_everything(seed):
+    rng = random.Random(seed)
+    position = Position.from_fen(FENS[seed % len(FENS)] if seed else START_FEN)
+    states = []
+    for _ in range(80):
+        moves = generate_legal_moves(position)
+        if not moves:
+            break
+        states.append({name: copy_of(value) for name, value in snapshot(position).items()})
+        position.make_move(rng.choice(moves))
+        # Take some moves back mid-game too, not only at the end
+        if rng.random() < 0.3:
+            position.unmake_move()
+            assert snapshot(position) == states.pop()
+    while states:
+        position.unmake_move()
+        assert snapshot(position) == states.pop()
+    assert not position.history
@@ -0,0 +1,92 @@
+# tools/bench_eval.py
+#
+# Positions per second of scoring positions one at a time from scratch
+# against the NumPy batch evaluation (engine/batch.py) on random playout
+# positions:
+#   python -m tools.bench_eval [--positions N] [--seed S]
+#
+# The baseline rescans each position's bitboards, which is the work a batch
+# of unrelated positions really costs one by one. evaluate() is shown too,
+# but it only reads the sums Position keeps up to date move by move.
+
+import argparse
+import random
+import time
+
+from board.bitboard import WHITE, squares
+from board.position import Position, START_FEN
+from board.psqt import PSQT_MG, PSQT_EG, PIECE_PHASE, PHASE_TOTAL
+from board.movegen import generate_legal_moves
+from engine.evaluate import evaluate
+from engine.batch import pack_boards, pack_bitboards, evaluate_boards, evaluate_bitboards
+
+
+def random_positions(count, seed):
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        position = Position.from_fen(START_FEN)
+        for _ in range(rng.randint(10, 120)):
+            moves = generate_legal_moves(position)
+            if not moves:
+                break
+            position.make_move(rng.choice(moves))
+            if rng.random() < 0.25:
+                positions.append(position.copy())
+    return positions[:count]
+
+
+def rescan_evaluate(position):
+    # evaluate() recomputed from the bitboards, without the incremental sums
+    mg = eg = phase = 0
+    for piece, bb in enumerate(position.pieces):
+        base = piece * 64
+        for sq in squares(bb):
+            mg += PSQT_MG[base + sq]
+            eg += PSQT_EG[base + sq]
+            phase += PIECE_PHASE[piece]
+    phase = min(phase, PHASE_TOTAL)
+    score = (mg * phase + eg * (PHASE_TOTAL - phase)) // PHASE_TOTAL
+    return score if position.side == WHITE else -score
+
+
+def best_of(repeat, fn):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-position and batched evaluation.")
+    parser.add_argument("--positions", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    positions = random_positions(args.positions, args.seed)
+    boards, sides = pack_boards(positions)
+    bitboards, _ = pack_bitboards(positions)
+
+    # Every method must agree before anything is timed
+    expected = [rescan_evaluate(position) for position in positions]
+    assert [evaluate(position) for position in positions] == expected
+    assert evaluate_boards(boards, sides).tolist() == expected
+    assert evaluate_bitboards(bitboards, sides).tolist() == expected
+
+    timings = {
+        "rescan loop": best_of(args.repeat, lambda: [rescan_evaluate(p) for p in positions]),
+        "incremental evaluate()": best_of(args.repeat, lambda: [evaluate(p) for p in positions]),
+        "batch, N x 64 int8": best_of(args.repeat, lambda: evaluate_boards(boards, sides)),
+        "batch, N x 12 uint64": best_of(args.repeat, lambda: evaluate_bitboards(bitboards, sides)),
+    }
+    baseline = timings["rescan loop"]
+    print(f"{'method':<24}{'positions/s':>14}{'speedup':>10}")
+    for name, seconds in timings.items():
+        print(f"{name:<24}{len(positions) / seconds:>14.0f}{baseline / seconds:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
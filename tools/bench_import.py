@@ -0,0 +1,79 @@
+# tools/bench_import.py
+#
+# Measures how long the headless modules take to import in a fresh
+# interpreter, and checks that none of them drags in pygame:
+#   python -m tools.bench_import [--runs 5] [--detail board.board]
+#
+# --detail prints the slowest imports below one module (python -X importtime).
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# Modules a batch job, service or worker process may import without a display
+HEADLESS = (
+    "board.position",
+    "board.movegen",
+    "board.rule_engine",
+    "board.board",
+    "board.san",
+    "board.pgn",
+    "board.epd",
+    "engine.search",
+    "engine.parallel",
+    "engine.book",
+    "engine.bitbase",
+)
+
+_PROBE = ("import sys, time; start = time.perf_counter(); import {module}; "
+          "print(time.perf_counter() - start, 'pygame' in sys.modules, len(sys.modules))")
+
+
+def time_import(module, runs):
+    # (median seconds, pygame imported, modules loaded) over runs fresh interpreters
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", _PROBE.format(module=module)],
+                                capture_output=True, text=True, check=True).stdout.split()
+        timings.append(float(output[0]))
+    return statistics.median(timings), output[1] == "True", int(output[2])
+
+
+def detail(module, top=15):
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, check=True).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        rows.append((int(cumulative_us), int(self_us), name))
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"{cumulative_us / 1000:>9.1f} ms {self_us / 1000:>8.1f} ms  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time imports of the headless engine modules.")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per module")
+    parser.add_argument("--detail", metavar="MODULE", help="break one module's import time down")
+    args = parser.parse_args()
+
+    if args.detail:
+        print(f"{'cumulative':>12} {'self':>11}  module")
+        detail(args.detail)
+        return
+
+    print(f"{'module':<20}{'ms':>8}{'modules':>9}  pygame")
+    clean = True
+    for module in HEADLESS:
+        seconds, pygame_loaded, modules = time_import(module, args.runs)
+        clean &= not pygame_loaded
+        print(f"{module:<20}{seconds * 1000:>8.1f}{modules:>9}  {'yes' if pygame_loaded else 'no'}")
+    if not clean:
+        print("pygame was imported by a headless module")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
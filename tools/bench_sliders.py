@@ -0,0 +1,90 @@
+# tools/bench_sliders.py
+#
+# Compares slider attack generation strategies on random middlegame-like
+# occupancies:  python -m tools.bench_sliders [--lookups N] [--seed S]
+
+import argparse
+import random
+import time
+
+from board.bitboard import rook_attacks_bb, bishop_attacks_bb
+from board.attacks import rook_ray_attacks, bishop_ray_attacks
+from board.magic import rook_attacks, bishop_attacks
+
+ROOK_STEPS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+BISHOP_STEPS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+def walk_attacks(sq, occupied, steps):
+    # The original square-by-square walker from GameRules.get_pseudo_moves
+    attacks = 0
+    row, col = divmod(sq, 8)
+    for dr, dc in steps:
+        r, c = row + dr, col + dc
+        while 0 <= r < 8 and 0 <= c < 8:
+            target = r * 8 + c
+            attacks |= 1 << target
+            if (occupied >> target) & 1:
+                break
+            r += dr
+            c += dc
+    return attacks
+
+
+STRATEGIES = {
+    "square walk": (lambda sq, occ: walk_attacks(sq, occ, ROOK_STEPS),
+                    lambda sq, occ: walk_attacks(sq, occ, BISHOP_STEPS)),
+    "set-wise fill": (lambda sq, occ: rook_attacks_bb(1 << sq, occ),
+                      lambda sq, occ: bishop_attacks_bb(1 << sq, occ)),
+    "ray tables": (rook_ray_attacks, bishop_ray_attacks),
+    "magic": (rook_attacks, bishop_attacks),
+}
+
+
+def make_samples(count, seed):
+    rng = random.Random(seed)
+    samples = []
+    for _ in range(count):
+        occupied = 0
+        for sq in rng.sample(range(64), rng.randint(16, 28)):
+            occupied |= 1 << sq
+        samples.append((rng.randrange(64), occupied))
+    return samples
+
+
+def time_strategy(rook_fn, bishop_fn, samples, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for sq, occupied in samples:
+            rook_fn(sq, occupied)
+            bishop_fn(sq, occupied)
+        best = min(best, time.perf_counter() - start)
+    return best / (2 * len(samples))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark slider attack generation.")
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    samples = make_samples(args.lookups, args.seed)
+
+    # Every strategy must agree with the square walker before we time anything
+    for name, (rook_fn, bishop_fn) in STRATEGIES.items():
+        for sq, occupied in samples:
+            assert rook_fn(sq, occupied) == walk_attacks(sq, occupied, ROOK_STEPS), name
+            assert bishop_fn(sq, occupied) == walk_attacks(sq, occupied, BISHOP_STEPS), name
+
+    baseline = None
+    print(f"{'strategy':<15}{'ns/lookup':>12}{'speedup':>10}")
+    for name, (rook_fn, bishop_fn) in STRATEGIES.items():
+        per_lookup = time_strategy(rook_fn, bishop_fn, samples, args.repeat)
+        baseline = baseline or per_lookup
+        print(f"{name:<15}{per_lookup * 1e9:>12.0f}{baseline / per_lookup:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# tools/bench_smp.py
+#
+# Time-to-depth scaling of the Lazy SMP search from 1 to N worker processes:
+#   python -m tools.bench_smp [--workers N] [--depth D] [--json PATH]
+#
+# Each worker count gets its own pool and a cleared shared table for every
+# position, so the times only differ by how many processes share the work.
+
+import argparse
+import json
+import multiprocessing
+import time
+
+from board.position import Position
+from engine.parallel import ParallelSearcher
+from tools.perft import POSITIONS
+
+
+def time_to_depth(workers, depth, fens, tt_size_mb):
+    with ParallelSearcher(workers, tt_size_mb) as searcher:
+        seconds = 0.0
+        nodes = 0
+        for fen in fens:
+            searcher.clear()
+            start = time.perf_counter()
+            result = searcher.search(Position.from_fen(fen), max_depth=depth)
+            seconds += time.perf_counter() - start
+            nodes += result.nodes
+    return seconds, nodes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Lazy SMP time-to-depth scaling.")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(),
+                        help="largest worker count to try")
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--hash", type=int, default=16, help="transposition table size in MB")
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON")
+    args = parser.parse_args()
+
+    fens = [fen for fen, _ in POSITIONS.values()]
+    rows = []
+    baseline = None
+    print(f"{'workers':>8}{'seconds':>10}{'nodes':>10}{'nps':>10}{'speedup':>9}")
+    for workers in range(1, args.workers + 1):
+        seconds, nodes = time_to_depth(workers, args.depth, fens, args.hash)
+        baseline = baseline or seconds
+        row = {"workers": workers, "seconds": round(seconds, 3), "nodes": nodes,
+               "nps": round(nodes / seconds), "speedup": round(baseline / seconds, 2)}
+        rows.append(row)
+        print(f"{workers:>8}{seconds:>10.2f}{nodes:>10}{row['nps']:>10}{row['speedup']:>8.2f}x")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"depth": args.depth, "cpus": multiprocessing.cpu_count(), "results": rows}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
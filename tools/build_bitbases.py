@@ -0,0 +1,90 @@
+# tools/build_bitbases.py
+#
+# Solves endgame tables by retrograde analysis and writes them where the game
+# looks for them:
+#   python -m tools.build_bitbases                   # every 3-piece table
+#   python -m tools.build_bitbases --pieces 4        # and every 4-piece one (slow)
+#   python -m tools.build_bitbases KQKR KRKN [--workers 4] [-o assets/tablebases]
+# Tables that the requested ones need (captures, promotions) are built first.
+
+import argparse
+import os
+import random
+import time
+
+from board.bitboard import WHITE, BLACK
+from engine.bitbase import (
+    EndgameTables, Layout, dependencies, generate, signature, split_signature, table_names,
+    MAX_PIECES, HEADER,
+)
+
+
+def with_dependencies(names):
+    ordered = []
+
+    def visit(name):
+        if name in ordered:
+            return
+        for dependency in dependencies(name):
+            visit(dependency)
+        ordered.append(name)
+
+    for name in names:
+        visit(name)
+    return ordered
+
+
+def time_probes(directory, name, count=10000):
+    # Microseconds per probe over random (mostly illegal, which costs the same) positions
+    layout = Layout(name)
+    rng = random.Random(1)
+    samples = []
+    while len(samples) < 1000:
+        sqs = rng.sample(range(64), layout.count)
+        samples.append((list(layout.codes), sqs, rng.choice((WHITE, BLACK))))
+    with EndgameTables(directory) as tables:
+        tables.probe_pieces(*samples[0])  # opens the file
+        start = time.perf_counter()
+        for i in range(count):
+            tables.probe_pieces(*samples[i % len(samples)])
+        return (time.perf_counter() - start) / count * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build endgame tables by retrograde analysis.")
+    parser.add_argument("tables", nargs="*", help="signatures such as KQK or KRKN (default: all)")
+    parser.add_argument("--pieces", type=int, default=3, choices=range(3, MAX_PIECES + 1),
+                        help="build every table with up to this many pieces")
+    parser.add_argument("-o", "--output", default="assets/tablebases")
+    parser.add_argument("--workers", type=int, default=None, help="processes to use (default: all CPUs)")
+    parser.add_argument("--force", action="store_true", help="rebuild tables that already exist")
+    args = parser.parse_args()
+
+    names = []
+    for name in args.tables:
+        try:
+            white_types, black_types = split_signature(name.upper())
+        except ValueError as exc:
+            parser.error(str(exc))
+        if 2 + len(white_types) + len(black_types) > MAX_PIECES:
+            parser.error(f"{name}: only tables with up to {MAX_PIECES} pieces are supported")
+        names.append(signature(white_types, black_types)[0])  # stronger side first
+    names = names or table_names(args.pieces)
+
+    for name in with_dependencies(names):
+        path = os.path.join(args.output, name + ".bin")
+        if os.path.exists(path) and not args.force:
+            print(f"{name:6} exists")
+            continue
+        start = time.perf_counter()
+        stats = generate(name, args.output, args.workers)
+        seconds = time.perf_counter() - start
+        print(f"{name:6} {stats['positions']:>9} positions: {stats['won']} won, {stats['drawn']} drawn, "
+              f"{stats['lost']} lost, longest mate {stats['longest']} plies "
+              f"({os.path.getsize(path) - HEADER.size} bytes, {seconds:.1f}s)")
+
+    print(f"probe: {time_probes(args.output, names[-1]):.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+# tools/match.py
+#
+# Plays two engines against each other over a process pool and streams the
+# running score with Elo, LOS and SPRT figures:
+#   python -m tools.match --engine name=new,depth=4 --engine name=old,depth=3 --games 200
+#   python -m tools.match --engine name=new --engine name=base,factory=engine.search_base:Searcher \
+#       --tc 10+0.1 --sprt elo0=0,elo1=5 --openings book.epd --pgn games.pgn
+#
+# --engine takes comma-separated key=value pairs: name, factory, depth,
+# movetime (seconds per move), tc (base+increment seconds) and hash (MB).
+# Whatever an engine leaves out comes from --depth / --movetime / --tc / --hash.
+# Openings are the positions of an EPD file, or the first --opening-plies
+# moves of each game in a PGN file; without --openings a built-in set is used.
+
+import argparse
+import multiprocessing
+import os
+import time
+
+from board.epd import read_epd
+from board.pgn import read_games, format_game
+from board.position import Position
+from board.san import parse_san
+from engine.match import EngineConfig, MatchStats, OPENINGS, opening_positions, run_match
+
+ENGINE_KEYS = ("name", "factory", "depth", "movetime", "tc", "hash")
+
+
+def parse_tc(text):
+    # "40+0.4" -> (40.0, 0.4); a bare number has no increment
+    base, _, increment = text.partition("+")
+    return float(base), float(increment or 0)
+
+
+def parse_pairs(text, keys):
+    pairs = {}
+    for item in text.split(","):
+        key, sep, value = item.partition("=")
+        if not sep or key not in keys:
+            raise ValueError(f"expected key=value with key one of {', '.join(keys)}, got {item!r}")
+        pairs[key] = value
+    return pairs
+
+
+def engine_config(text, defaults, number):
+    options = dict(defaults)
+    options.update(parse_pairs(text, ENGINE_KEYS))
+    base, increment = parse_tc(options["tc"]) if options.get("tc") else (None, 0.0)
+    return EngineConfig(
+        options.get("name") or f"engine{number}",
+        options.get("factory") or "engine.search:Searcher",
+        int(options["depth"]) if options.get("depth") else None,
+        float(options["movetime"]) if options.get("movetime") else None,
+        base, increment,
+        int(options.get("hash") or 16),
+    )
+
+
+def load_openings(path, plies):
+    if path.lower().endswith(".pgn"):
+        fens = []
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for game in read_games(f):
+                position = Position.from_fen(game.fen)
+                for san in game.moves[:plies]:
+                    position.make_move(parse_san(position, san))
+                fens.append(position.to_fen())
+        return fens
+    with open(path, encoding="utf-8") as f:
+        return [record.fen for record in read_epd(f)]
+
+
+def report(stats, other, finished, total, started):
+    elo, margin = stats.elo()
+    lower, upper = stats.sprt_bounds()
+    hours = (time.perf_counter() - started) / 3600
+    return (f"Score of {stats.name} vs {other}: +{stats.wins} -{stats.losses} ={stats.draws} "
+            f"[{stats.score():.3f}] {finished}/{total}, Elo {elo:+.1f} +/- {margin:.1f}, "
+            f"LOS {stats.los():.1%}, LLR {stats.llr():.2f} ({lower:.2f}, {upper:.2f}), "
+            f"{finished / hours:.0f} games/h")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play an engine-vs-engine match.")
+    parser.add_argument("--engine", action="append", required=True, metavar="KEY=VALUE,...",
+                        help="an engine (give exactly two): name, factory, depth, movetime, tc, hash")
+    parser.add_argument("--games", type=int, default=100, help="games to play (rounded up to pairs)")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(),
+                        help="games played at once (default: all CPUs)")
+    parser.add_argument("--depth", help="default search depth")
+    parser.add_argument("--movetime", help="default seconds per move")
+    parser.add_argument("--tc", help="default clock, base+increment seconds (e.g. 10+0.1)")
+    parser.add_argument("--hash", default="16", help="default transposition table size in MB")
+    parser.add_argument("--openings", metavar="PATH", help="EPD or PGN file of opening positions")
+    parser.add_argument("--opening-plies", type=int, default=8, help="moves to take from PGN openings")
+    parser.add_argument("--max-plies", type=int, default=400, help="adjudicate a draw after this many plies")
+    parser.add_argument("--tablebases", metavar="DIR", help="endgame tables for the engines and adjudication")
+    parser.add_argument("--sprt", metavar="KEY=VALUE,...",
+                        help="stop once decided: elo0, elo1, alpha, beta (defaults 0, 5, 0.05, 0.05)")
+    parser.add_argument("--pgn", metavar="PATH", help="append every finished game to this file")
+    args = parser.parse_args()
+
+    if len(args.engine) != 2:
+        parser.error("give --engine exactly twice")
+    defaults = {"depth": args.depth, "movetime": args.movetime, "tc": args.tc, "hash": args.hash}
+    if not any((args.depth, args.movetime, args.tc)):
+        defaults["depth"] = "3"
+    try:
+        first, second = (engine_config(text, defaults, number) for number, text in enumerate(args.engine, 1))
+        sprt = {key: float(value) for key, value in
+                parse_pairs(args.sprt, ("elo0", "elo1", "alpha", "beta")).items()} if args.sprt else {}
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.tablebases and not os.path.isdir(args.tablebases):
+        parser.error(f"{args.tablebases} is not a directory")
+
+    openings = load_openings(args.openings, args.opening_plies) if args.openings else opening_positions(OPENINGS)
+    if not openings:
+        parser.error("no opening positions found")
+    games = args.games + args.games % 2
+    stats = MatchStats(first.name, **sprt)
+    pgn = open(args.pgn, "a", encoding="utf-8") if args.pgn else None
+    reasons = {}
+    started = time.perf_counter()
+    print(f"{first.name} vs {second.name}: {games} games from {len(openings)} openings "
+          f"on {args.workers} processes")
+    try:
+        for finished, game in enumerate(run_match(first, second, openings, games, args.workers,
+                                                  args.tablebases, args.max_plies), 1):
+            stats.add(game)
+            reasons[game.reason] = reasons.get(game.reason, 0) + 1
+            print(f"Game {game.index + 1} ({game.white} vs {game.black}, opening {game.opening + 1}): "
+                  f"{game.result} {{{game.reason}, {len(game.moves)} plies}}")
+            print(report(stats, second.name, finished, games, started))
+            if pgn is not None:
+                headers = {"Event": f"{first.name} vs {second.name}", "Round": game.index + 1,
+                           "White": game.white, "Black": game.black, "Result": game.result,
+                           "FEN": game.fen, "SetUp": "1", "Termination": game.reason}
+                pgn.write(format_game(headers, game.moves, game.result) + "\n")
+                pgn.flush()
+            decision = stats.sprt() if sprt else None
+            if decision is not None:
+                bound = f"elo1 = {stats.elo1:g}" if decision == "H1" else f"elo0 = {stats.elo0:g}"
+                print(f"SPRT: {decision} accepted ({bound})")
+                break
+    except KeyboardInterrupt:
+        print("interrupted")
+    finally:
+        if pgn is not None:
+            pgn.close()
+
+    print(", ".join(f"{count} {reason}" for reason, count in sorted(reasons.items(), key=lambda r: -r[1])))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+# tools/perft.py
+#
+# Counts the leaf nodes of the legal move tree and compares them with the
+# published reference numbers:
+#   python -m tools.perft [--depth N] [--position NAME | --fen FEN | --epd PATH] [--divide] [--check] [--json PATH]
+#
+# --epd runs a perft suite file with one position per line and the expected
+# counts as ";D1 20 ;D2 400 ..." operations; the file is streamed.
+#
+# Every run reports nodes per second; --json writes the results in a form
+# that can be kept and diffed between revisions to catch slowdowns. --check
+# also recomputes the Zobrist key from scratch at every node and stops at
+# the first move where the incremental key went wrong (much slower).
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+from board.position import Position, START_FEN
+from board.movegen import generate_legal_moves
+from board.move import move_to_uci
+from board.epd import read_epd
+from board.zobrist import compute_key
+
+# name -> (FEN, node counts for depth 1, 2, ...)
+POSITIONS = {
+    "start": (START_FEN,
+              (20, 400, 8902, 197281, 4865609)),
+    "kiwipete": ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+                 (48, 2039, 97862, 4085603)),
+    "position3": ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+                  (14, 191, 2812, 43238, 674624, 11030083)),
+    "position4": ("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+                  (6, 264, 9467, 422333, 15833292)),
+    "position5": ("rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+                  (44, 1486, 62379, 2103487)),
+    "position6": ("r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+                  (46, 2079, 89890, 3894594)),
+}
+
+
+def perft(position, depth):
+    """Leaf nodes of the legal move tree below position, depth plies deep."""
+    moves = generate_legal_moves(position)
+    if depth <= 1:
+        return len(moves) if depth == 1 else 1  # bulk count at the frontier
+    nodes = 0
+    for move in moves:
+        position.make_move(move)
+        nodes += perft(position, depth - 1)
+        position.unmake_move()
+    return nodes
+
+
+def checked_perft(position, depth, line=()):
+    """perft that verifies the incremental key against compute_key at every node."""
+    key = position.key
+    if key != compute_key(position):
+        raise ValueError(f"key differs from compute_key after {' '.join(map(move_to_uci, line)) or 'setup'}")
+    if depth == 0:
+        return 1
+    nodes = 0
+    for move in generate_legal_moves(position):
+        position.make_move(move)
+        nodes += checked_perft(position, depth - 1, line + (move,))
+        position.unmake_move()
+        if position.key != key:
+            raise ValueError(f"key not restored by unmaking {' '.join(map(move_to_uci, line + (move,)))}")
+    return nodes
+
+
+def divide(position, depth, count=perft):
+    """Node count below each root move, for bisecting a wrong total."""
+    counts = {}
+    for move in generate_legal_moves(position):
+        position.make_move(move)
+        counts[move_to_uci(move)] = count(position, depth - 1)
+        position.unmake_move()
+    return counts
+
+
+def run(name, fen, depth, expected=None, show_divide=False, out=sys.stdout, check=False):
+    position = Position.from_fen(fen)
+    count = checked_perft if check else perft
+    start = time.perf_counter()
+    if show_divide:
+        counts = divide(position, depth, count)
+        nodes = sum(counts.values())
+    else:
+        nodes = count(position, depth)
+    seconds = time.perf_counter() - start
+
+    if show_divide:
+        for move, count in sorted(counts.items()):
+            print(f"  {move}: {count}", file=out)
+    result = {
+        "name": name,
+        "fen": fen,
+        "depth": depth,
+        "nodes": nodes,
+        "expected": expected,
+        "ok": expected is None or nodes == expected,
+        "seconds": round(seconds, 4),
+        "nps": round(nodes / seconds) if seconds else None,
+    }
+    status = "" if expected is None else ("ok" if result["ok"] else f"FAIL (expected {expected})")
+    print(f"{name:<12}{depth:>6}{nodes:>12}{seconds:>10.3f}{result['nps'] or 0:>12}  {status}", file=out)
+    return result
+
+
+def epd_jobs(path, max_depth):
+    # Streamed: one (name, fen, depth, expected) per line, at the deepest
+    # listed count that does not exceed max_depth
+    with open(path) as f:
+        for number, record in enumerate(read_epd(f), 1):
+            counts = {int(opcode[1:]): int(operands[0]) for opcode, operands in record.operations.items()
+                      if opcode[:1] == "D" and opcode[1:].isdigit() and operands}
+            depths = [depth for depth in counts if depth <= max_depth]
+            depth = max(depths) if depths else max_depth
+            yield record.get("id", f"line {number}"), record.fen, depth, counts.get(depth)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count move-generation nodes and measure their speed.")
+    parser.add_argument("--depth", type=int, default=3,
+                        help="plies to search (suite positions stop at their deepest known count)")
+    parser.add_argument("--position", choices=sorted(POSITIONS), help="run one suite position only")
+    parser.add_argument("--fen", help="run an arbitrary position (no reference count)")
+    parser.add_argument("--epd", metavar="PATH", help="run every position of an EPD perft suite")
+    parser.add_argument("--divide", action="store_true", help="print the node count under each root move")
+    parser.add_argument("--check", action="store_true",
+                        help="verify the incremental Zobrist key at every node (slow)")
+    parser.add_argument("--json", metavar="PATH", help="write the results as JSON ('-' for stdout)")
+    args = parser.parse_args()
+
+    if args.fen:
+        jobs = [("fen", args.fen, args.depth, None)]
+    elif args.epd:
+        jobs = epd_jobs(args.epd, args.depth)
+    else:
+        names = [args.position] if args.position else list(POSITIONS)
+        jobs = []
+        for name in names:
+            fen, counts = POSITIONS[name]
+            depth = min(args.depth, len(counts))
+            jobs.append((name, fen, depth, counts[depth - 1]))
+
+    # Keep stdout clean for the JSON report when it goes there
+    out = sys.stderr if args.json == "-" else sys.stdout
+    print(f"{'position':<12}{'depth':>6}{'nodes':>12}{'seconds':>10}{'nps':>12}", file=out)
+    try:
+        results = [run(name, fen, depth, expected, args.divide, out, args.check)
+                   for name, fen, depth, expected in jobs]
+    except ValueError as exc:
+        sys.exit(f"check failed: {exc}")
+
+    nodes = sum(result["nodes"] for result in results)
+    seconds = sum(result["seconds"] for result in results)
+    total_nps = round(nodes / seconds) if seconds else None
+    print(f"{'total':<12}{'':>6}{nodes:>12}{seconds:>10.3f}{total_nps or 0:>12}", file=out)
+
+    if args.json:
+        report = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "results": results,
+            "total": {"nodes": nodes, "seconds": round(seconds, 4), "nps": total_nps},
+        }
+        if args.json == "-":
+            json.dump(report, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.json, "w") as f:
+                json.dump(report, f, indent=2)
+
+    if not all(result["ok"] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# tools/replay_pgn.py
+#
+# Replays PGN collections move by move through Board and the rule engine,
+# to validate the move generator against real games and to measure
+# throughput:
+#   python -m tools.replay_pgn games.pgn [more.pgn ...] [--limit N] [--progress 10000]
+#
+# Games are streamed one at a time, so memory use stays flat however large
+# the files are; the peak resident size is printed at the end to show it.
+
+import argparse
+import sys
+import time
+
+from board.board import Board
+from board.bitboard import QUEEN
+from board.pgn import read_games
+from board.san import parse_san
+
+try:
+    import resource
+except ImportError:  # not on Windows
+    resource = None
+
+
+def replay_game(game, board=None):
+    """Play every move of game on a Board (a fresh one unless given) and return it.
+
+    Each SAN move is resolved against the legal moves of the cached rule
+    engine status and applied with Board.move_piece. Raises ValueError at
+    the first move that cannot be read or is not legal.
+    """
+    if board is None:
+        board = Board.from_fen(game.fen)
+    for ply, san in enumerate(game.moves):
+        try:
+            move = parse_san(board.position, san, board.status.legal_moves)
+        except ValueError as exc:
+            raise ValueError(f"ply {ply + 1}: {exc}") from None
+        board.move_piece(move & 63, (move >> 6) & 63, (move >> 12) & 7 or QUEEN)
+    return board
+
+
+def peak_memory_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024  # bytes on macOS, KiB elsewhere
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay PGN games through the rule engine.")
+    parser.add_argument("pgn", nargs="+", help="PGN files to read")
+    parser.add_argument("--limit", type=int, default=None, help="stop after this many games")
+    parser.add_argument("--progress", type=int, default=0, metavar="N", help="report every N games")
+    parser.add_argument("--errors", type=int, default=5, help="how many bad games to describe")
+    args = parser.parse_args()
+
+    games = plies = errors = mates = 0
+    start = time.perf_counter()
+    for path in args.pgn:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for game in read_games(f):
+                try:
+                    board = replay_game(game)
+                except ValueError as exc:
+                    errors += 1
+                    if errors <= args.errors:
+                        print(f"{path}: game {games + 1} "
+                              f"({game.headers.get('White', '?')} - {game.headers.get('Black', '?')}): {exc}")
+                else:
+                    plies += len(game.moves)
+                    mates += board.status.checkmate
+                games += 1
+                if args.progress and not games % args.progress:
+                    seconds = time.perf_counter() - start
+                    print(f"{games} games, {games / seconds:.0f} games/s, peak {peak_memory_mb() or 0:.0f} MB")
+                if args.limit and games >= args.limit:
+                    break
+        if args.limit and games >= args.limit:
+            break
+
+    seconds = time.perf_counter() - start
+    print(f"{games} games ({errors} with errors, {mates} ending in mate), {plies} plies in {seconds:.1f}s")
+    if seconds:
+        print(f"{games / seconds:.0f} games/s, {plies / seconds:.0f} plies/s")
+    peak = peak_memory_mb()
+    if peak is not None:
+        print(f"peak memory {peak:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# utils/frame_scheduler.py
+
+# Decides when a scene draws a frame. A scene that has nothing to animate
+# sleeps in pygame.event.wait until input arrives (or a timeout, so it can
+# look around), so an idle window costs no CPU and a click is handled the
+# moment it happens instead of at the next clock tick. A scene with an
+# animation running, or one that asked for another frame, is paced by a
+# clock like before; after IDLE_AFTER seconds without input its animations
+# drop to IDLE_FPS, and while the window is minimised it does not draw.
+
+import time
+
+import pygame
+from settings import IDLE_TIMEOUT_MS, IDLE_AFTER, IDLE_FPS
+
+# What counts as the user being there; bot progress, expose and window events do not
+INPUT_EVENTS = frozenset((
+    pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION, pygame.MOUSEWHEEL,
+))
+
+
+class FrameScheduler:
+    def __init__(self, fps, idle_fps=IDLE_FPS, idle_after=IDLE_AFTER, idle_timeout_ms=IDLE_TIMEOUT_MS):
+        self.fps = fps
+        self.idle_fps = idle_fps
+        self.idle_after = idle_after
+        self.idle_timeout_ms = idle_timeout_ms
+        self.clock = pygame.time.Clock()
+        self.last_input = time.monotonic()
+        self.dt = 0  # milliseconds since the previous frame
+        self._requested = True  # every scene draws its first frame
+
+    def request(self):
+        # Draw another frame without waiting for input, e.g. after the state changed off an event
+        self._requested = True
+
+    @property
+    def idle(self):
+        return time.monotonic() - self.last_input > self.idle_after
+
+    def wait(self, animating=False):
+        """Events for the next frame; blocks until there are some unless a frame is due.
+
+        animating says whether the scene has something moving on screen.
+        """
+        busy = (animating or self._requested) and pygame.display.get_active()
+        self._requested = False
+        if busy:
+            self.dt = self.clock.tick(self.idle_fps if animating and self.idle else self.fps)
+            events = pygame.event.get()
+        else:
+            first = pygame.event.wait(self.idle_timeout_ms)
+            events = [] if first.type == pygame.NOEVENT else [first]
+            events.extend(pygame.event.get())
+            # The sleep is not elapsed animation time: a scene that starts moving
+            # on this frame advances by at most one frame
+            self.dt = min(self.clock.tick(), 1000 // self.fps)
+        if any(event.type in INPUT_EVENTS for event in events):
+            self.last_input = time.monotonic()
+        return events
@@ -0,0 +1,64 @@
+# utils/sprite_cache.py
+
+# Caches for scenes that draw the same decorations every frame. Anything an
+# effect needs (a glow ring, a rendered label, a translucent panel) is built
+# once under a key describing it and reused; small sprites that are drawn
+# in large numbers are packed into one atlas surface so a frame is a single
+# Surface.blits call.
+
+import pygame
+
+
+class SurfaceCache:
+    """Surfaces built on first request and kept, keyed by what they show."""
+
+    def __init__(self):
+        self._surfaces = {}
+
+    def get(self, key, build):
+        # build() is only called the first time key is asked for
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = self._surfaces[key] = build()
+        return surface
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+class SpriteAtlas:
+    """Many small sprites packed into one surface, drawn with area rects.
+
+    Sprites are laid out in shelves, tallest first, width pixels wide.
+    blit_args(key, pos) gives the (source, dest, area) triple that
+    Surface.blit and Surface.blits take.
+    """
+
+    def __init__(self, sprites, width=512, padding=1):
+        order = sorted(sprites, key=lambda key: -sprites[key].get_height())
+        self.rects = {}
+        self.sizes = {}
+        x = y = shelf = 0
+        for key in order:
+            w, h = sprites[key].get_size()
+            if x and x + w > width:
+                x = 0
+                y += shelf + padding
+                shelf = 0
+            self.rects[key] = pygame.Rect(x, y, w, h)
+            self.sizes[key] = (w, h)
+            x += w + padding
+            shelf = max(shelf, h)
+        self.surface = pygame.Surface((width, max(y + shelf, 1)), pygame.SRCALPHA)
+        for key, rect in self.rects.items():
+            # MAX over the cleared atlas copies the pixels, alpha included, without blending
+            self.surface.blit(sprites[key], rect, special_flags=pygame.BLEND_RGBA_MAX)
+
+    def __contains__(self, key):
+        return key in self.rects
+
+    def blit_args(self, key, pos):
+        return self.surface, pos, self.rects[key]